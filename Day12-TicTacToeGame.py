@@ -1,10 +1,86 @@
 import streamlit as st
+import multiprocessing
+import os
 import random
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from tictactoe_engine import Bitboard, line_through, perfect_move, solved_table
+from tictactoe_mcts import MctsPlayer
+from tictactoe_selfplay import O_WINS, STRATEGIES, TIE, X_WINS, simulate, summarize
+
+# MCTS search time per computer move (seconds), and extra processes searching alongside
+MCTS_BUDGET = 0.2
+MCTS_WORKERS = min(4, os.cpu_count() or 1) - 1
+
+# Load the perfect-play table once per server process
+solved_table()
+
+# Board sizes on offer: (cells per side, marks in a row to win)
+BOARDS = {
+    "3×3, 3 in a row": (3, 3),
+    "7×7, 4 in a row": (7, 4),
+    "10×10, 5 in a row": (10, 5),
+    "15×15, 5 in a row (Gomoku)": (15, 5),
+}
+
+def grid_stylesheet():
+    """One stylesheet for every board and cell state, the same on every run"""
+    rules = ["<style>"]
+    for size, _ in BOARDS.values():
+        if size > 3:
+            cell = max(24, 240 // size)
+            rules.append(f".st-key-board-{size} .stButton > button {{ width: {cell}px !important; "
+                         f"height: {cell}px !important; font-size: {max(12, 120 // size)}px !important; "
+                         f"padding: 0 !important; }}")
+    rules.append("""
+div[class*="st-key-cell-empty-"] .stButton > button {
+    background-color: #4472C4 !important;
+    border: 2px solid #2E5AAC !important;
+    color: white !important;
+}
+div[class*="st-key-cell-empty-"] .stButton > button:hover {
+    background-color: #5A82D4 !important;
+    border: 2px solid #4472C4 !important;
+}
+div[class*="st-key-cell-X-"] .stButton > button,
+div[class*="st-key-cell-O-"] .stButton > button,
+div[class*="st-key-cell-reply-"] .stButton > button {
+    background-color: #E6E6E6 !important;
+    border: 2px solid #CCCCCC !important;
+    color: #000000 !important;
+}
+div[class*="st-key-cell-win-"] .stButton > button {
+    background-color: #90EE90 !important;
+    border: 3px solid #228B22 !important;
+    color: #000000 !important;
+}
+/* The computer's latest mark fades in once the thinking animation ends */
+div[class*="st-key-cell-reply-"] .stButton > button p {
+    animation: computer-reply 0.5s step-end backwards;
+}
+</style>""")
+    return "\n".join(rules)
+
+GRID_CSS = grid_stylesheet()
+
+def empty_board(size):
+    return [[''] * size for _ in range(size)]
+
+def all_cells(size):
+    """Every cell as (row, col), and each cell's slot in that list"""
+    cells = [(i, j) for i in range(size) for j in range(size)]
+    return cells, {cell: slot for slot, cell in enumerate(cells)}
 
 # Initialize session state
+if 'board_size' not in st.session_state:
+    st.session_state.board_size = 3
+if 'win_length' not in st.session_state:
+    st.session_state.win_length = 3
 if 'board' not in st.session_state:
-    st.session_state.board = [['', '', ''], ['', '', ''], ['', '', '']]
+    st.session_state.board = empty_board(st.session_state.board_size)
+if 'open_cells' not in st.session_state:
+    # Empty cells, kept up to date move by move so nothing rescans the board
+    st.session_state.open_cells, st.session_state.open_slots = all_cells(st.session_state.board_size)
 if 'current_player' not in st.session_state:
     st.session_state.current_player = 'X'
 if 'game_mode' not in st.session_state:
@@ -15,58 +91,99 @@ if 'winner' not in st.session_state:
     st.session_state.winner = None
 if 'winning_line' not in st.session_state:
     st.session_state.winning_line = []
+if 'difficulty' not in st.session_state:
+    st.session_state.difficulty = 'Random'
+if 'pending_move' not in st.session_state:
+    st.session_state.pending_move = None
+if 'last_computer_move' not in st.session_state:
+    st.session_state.last_computer_move = None
+if 'computer_moves' not in st.session_state:
+    st.session_state.computer_moves = 0
+if 'mcts' not in st.session_state:
+    st.session_state.mcts = None
 
-def check_winner(board):
-    """Check if there's a winner and return the winner and winning line"""
-    # Check rows
-    for i in range(3):
-        if board[i][0] == board[i][1] == board[i][2] != '':
-            return board[i][0], [(i, 0), (i, 1), (i, 2)]
-    
-    # Check columns
-    for j in range(3):
-        if board[0][j] == board[1][j] == board[2][j] != '':
-            return board[0][j], [(0, j), (1, j), (2, j)]
-    
-    # Check diagonals
-    if board[0][0] == board[1][1] == board[2][2] != '':
-        return board[0][0], [(0, 0), (1, 1), (2, 2)]
-    
-    if board[0][2] == board[1][1] == board[2][0] != '':
-        return board[0][2], [(0, 2), (1, 1), (2, 0)]
-    
-    return None, []
+def check_winner(board, row, col):
+    """Check if the move at (row, col) won and return the winner and winning line"""
+    if len(board) == 3:
+        winner, mask = Bitboard.from_board(board).winner()
+        return winner, [divmod(i, 3) for i in range(9) if mask >> i & 1]
+    # Larger boards: only the lines through the last move can have changed
+    winning_line = line_through(board, row, col, st.session_state.win_length)
+    return (board[row][col], winning_line) if winning_line else (None, [])
 
-def is_board_full(board):
+def claim_cell(row, col):
+    """Take (row, col) off the open cells: the last open cell moves into its slot"""
+    cells, slots = st.session_state.open_cells, st.session_state.open_slots
+    slot = slots.pop((row, col))
+    last = cells.pop()
+    if last != (row, col):
+        cells[slot] = last
+        slots[last] = slot
+
+def is_board_full():
     """Check if the board is full"""
-    for row in board:
-        if '' in row:
-            return False
-    return True
+    return not st.session_state.open_cells
 
-def get_available_moves(board):
+def get_available_moves():
     """Get list of available moves"""
-    moves = []
-    for i in range(3):
-        for j in range(3):
-            if board[i][j] == '':
-                moves.append((i, j))
-    return moves
-
-def computer_move():
-    """Make a random computer move"""
-    available_moves = get_available_moves(st.session_state.board)
-    if available_moves and not st.session_state.game_over:
-        row, col = random.choice(available_moves)
+    return list(st.session_state.open_cells)
+
+@st.cache_resource
+def move_executor():
+    """Worker threads for computer replies, shared by all sessions"""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="tictactoe")
+
+@st.cache_resource
+def mcts_pool():
+    """Extra processes for root-parallel MCTS, shared by all sessions; None on one core"""
+    if MCTS_WORKERS < 1:
+        return None
+    return ProcessPoolExecutor(MCTS_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+
+def choose_computer_move(board, moves, difficulty, mcts):
+    """Pick the computer's reply; runs on a worker thread, so it only sees its own copies"""
+    if difficulty == 'Unbeatable' and len(board) == 3:
+        return perfect_move(board)
+    if difficulty == 'MCTS':
+        return mcts.choose(board)
+    return random.choice(moves)
+
+def start_computer_move():
+    """Hand the reply to a worker; this run goes on to show the player's move right away"""
+    board = [row[:] for row in st.session_state.board]
+    if st.session_state.difficulty == 'MCTS' and st.session_state.mcts is None:
+        # One player per game, so its search tree carries over from move to move
+        st.session_state.mcts = MctsPlayer(st.session_state.win_length, MCTS_BUDGET, pool=mcts_pool(),
+                                           workers=MCTS_WORKERS)
+    st.session_state.pending_move = move_executor().submit(choose_computer_move, board,
+                                                           get_available_moves(),
+                                                           st.session_state.difficulty,
+                                                           st.session_state.mcts)
+
+def collect_computer_move():
+    """Play the computer's reply if the worker has it; returns whether it did"""
+    future = st.session_state.pending_move
+    if future is None or not future.done():
+        return False
+    st.session_state.pending_move = None
+    computer_move(*future.result())
+    return True
+
+def computer_move(row, col):
+    """Play the computer's reply at (row, col)"""
+    if st.session_state.board[row][col] == '' and not st.session_state.game_over:
         st.session_state.board[row][col] = 'O'
+        claim_cell(row, col)
+        st.session_state.last_computer_move = (row, col)
+        st.session_state.computer_moves += 1
         
         # Check for winner after computer move
-        winner, winning_line = check_winner(st.session_state.board)
+        winner, winning_line = check_winner(st.session_state.board, row, col)
         if winner:
             st.session_state.winner = winner
             st.session_state.winning_line = winning_line
             st.session_state.game_over = True
-        elif is_board_full(st.session_state.board):
+        elif is_board_full():
             st.session_state.game_over = True
         else:
             st.session_state.current_player = 'X'
@@ -75,14 +192,15 @@ def make_move(row, col):
     """Handle player move"""
     if st.session_state.board[row][col] == '' and not st.session_state.game_over:
         st.session_state.board[row][col] = st.session_state.current_player
+        claim_cell(row, col)
         
         # Check for winner
-        winner, winning_line = check_winner(st.session_state.board)
+        winner, winning_line = check_winner(st.session_state.board, row, col)
         if winner:
             st.session_state.winner = winner
             st.session_state.winning_line = winning_line
             st.session_state.game_over = True
-        elif is_board_full(st.session_state.board):
+        elif is_board_full():
             st.session_state.game_over = True
         else:
             # Switch players or trigger computer move
@@ -90,17 +208,22 @@ def make_move(row, col):
                 st.session_state.current_player = 'O' if st.session_state.current_player == 'X' else 'X'
             else:  # Single Player mode
                 st.session_state.current_player = 'O'
-                # Trigger computer move after a short delay
-                time.sleep(0.5)
-                computer_move()
+                start_computer_move()
 
 def reset_game():
     """Reset the game to initial state"""
-    st.session_state.board = [['', '', ''], ['', '', ''], ['', '', '']]
+    st.session_state.board = empty_board(st.session_state.board_size)
+    st.session_state.open_cells, st.session_state.open_slots = all_cells(st.session_state.board_size)
     st.session_state.current_player = 'X'
     st.session_state.game_over = False
     st.session_state.winner = None
     st.session_state.winning_line = []
+    st.session_state.pending_move = None  # A reply still being worked out is dropped
+    st.session_state.last_computer_move = None
+    st.session_state.mcts = None
+
+# A reply that finished since the last run is played before anything is drawn
+collect_computer_move()
 
 # Game statistics initialization
 if 'games_played' not in st.session_state:
@@ -127,22 +250,6 @@ if st.session_state.game_over and 'stats_updated' not in st.session_state:
 if not st.session_state.game_over and 'stats_updated' in st.session_state:
     del st.session_state.stats_updated
 
-def get_button_style(row, col):
-    """Get the CSS style for a button based on its state"""
-    if (row, col) in st.session_state.winning_line:
-        return """
-        background-color: #90EE90 !important;
-        border: 3px solid #228B22 !important;
-        color: #000000 !important;
-        font-weight: bold !important;
-        """
-    else:
-        return """
-        background-color: #f0f0f0 !important;
-        border: 2px solid #cccccc !important;
-        color: #333333 !important;
-        """
-
 # Main app
 st.title("🎮 Tic-Tac-Toe Game")
 
@@ -194,6 +301,32 @@ st.markdown("""
     margin-bottom: 0.5rem !important;
 }
 
+/* Computer reply: a short thinking pause played by the browser */
+@keyframes computer-reply { from { opacity: 0; } to { opacity: 1; } }
+@keyframes thinking-done { from { opacity: 1; } to { opacity: 0; } }
+
+.computer-reply {
+    display: grid;
+    padding: 16px;
+    margin-bottom: 1rem;
+    border-radius: 8px;
+    background-color: rgba(28, 131, 225, 0.1);
+    color: rgb(0, 66, 128);
+}
+
+/* Both messages share one grid cell; the first gives way to the second */
+.computer-reply span {
+    grid-area: 1 / 1;
+}
+
+.computer-reply .thinking {
+    animation: thinking-done 0.5s step-end forwards;
+}
+
+.computer-reply .ready {
+    animation: computer-reply 0.5s step-end backwards;
+}
+
 h4 {
     margin-top: 0.5rem !important;
     margin-bottom: 0.3rem !important;
@@ -202,6 +335,8 @@ h4 {
 </style>
 """, unsafe_allow_html=True)
 
+st.markdown(GRID_CSS, unsafe_allow_html=True)
+
 # Main layout: Board on left, Info panel on right
 main_col1, main_col2 = st.columns([1.2, 1])
 
@@ -214,6 +349,21 @@ with main_col1:
         if game_mode != st.session_state.game_mode:
             st.session_state.game_mode = game_mode
             reset_game()
+        board_name = st.selectbox("Board:", list(BOARDS),
+                                  index=list(BOARDS.values()).index((st.session_state.board_size,
+                                                                     st.session_state.win_length)))
+        if BOARDS[board_name] != (st.session_state.board_size, st.session_state.win_length):
+            st.session_state.board_size, st.session_state.win_length = BOARDS[board_name]
+            reset_game()
+        if st.session_state.game_mode != 'Two Player':
+            # The solved table only covers the classic board
+            difficulties = ["Random", "MCTS"] + (["Unbeatable"] if st.session_state.board_size == 3 else [])
+            difficulty = st.radio("Difficulty:", difficulties, horizontal=True,
+                                  index=difficulties.index(st.session_state.difficulty)
+                                  if st.session_state.difficulty in difficulties else 0)
+            if difficulty != st.session_state.difficulty:
+                st.session_state.difficulty = difficulty
+                reset_game()
     
     with mode_col2:
         if st.button("🔄 Reset", type="secondary"):
@@ -225,7 +375,12 @@ with main_col1:
         if st.session_state.game_mode == 'Two Player':
             st.info(f"Current Player: **{st.session_state.current_player}**")
         else:
-            if st.session_state.current_player == 'X':
+            if st.session_state.current_player == 'X' and st.session_state.last_computer_move:
+                # The "thinking" pause is a browser animation; the reply is already in
+                st.markdown(f'<div class="computer-reply" data-move="{st.session_state.computer_moves}">'
+                            '<span class="thinking">🤖 Computer thinking... <b>O</b></span>'
+                            '<span class="ready">Your turn: <b>X</b></span></div>', unsafe_allow_html=True)
+            elif st.session_state.current_player == 'X':
                 st.info("Your turn: **X**")
             else:
                 st.info("Computer thinking... **O**")
@@ -243,70 +398,45 @@ with main_col1:
     # Game board
     st.markdown("**Game Board:**")
     
-    # Create the 3x3 grid
-    for i in range(3):
-        cols = st.columns(3)
-        for j in range(3):
-            with cols[j]:
-                button_text = st.session_state.board[i][j] if st.session_state.board[i][j] != '' else ' '
-                
-                # Apply custom styling for winning line
-                if (i, j) in st.session_state.winning_line:
-                    st.markdown(f"""
-                    <style>
-                    div[data-testid="column"]:nth-child({j+1}) .stButton > button {{
-                        background-color: #90EE90 !important;
-                        border: 3px solid #228B22 !important;
-                        color: #000000 !important;
-                    }}
-                    </style>
-                    """, unsafe_allow_html=True)
-                elif st.session_state.board[i][j] == '':
-                    # Apply blue styling for empty buttons
-                    st.markdown(f"""
-                    <style>
-                    div[data-testid="column"]:nth-child({j+1}) .stButton > button {{
-                        background-color: #4472C4 !important;
-                        border: 2px solid #2E5AAC !important;
-                        color: white !important;
-                    }}
-                    div[data-testid="column"]:nth-child({j+1}) .stButton > button:hover {{
-                        background-color: #5A82D4 !important;
-                        border: 2px solid #4472C4 !important;
-                    }}
-                    </style>
-                    """, unsafe_allow_html=True)
-                else:
-                    # Styling for filled buttons (X or O)
-                    st.markdown(f"""
-                    <style>
-                    div[data-testid="column"]:nth-child({j+1}) .stButton > button {{
-                        background-color: #E6E6E6 !important;
-                        border: 2px solid #CCCCCC !important;
-                        color: #000000 !important;
-                    }}
-                    </style>
-                    """, unsafe_allow_html=True)
-                
-                if st.button(button_text, key=f"btn_{i}_{j}", disabled=st.session_state.board[i][j] != '' or st.session_state.game_over):
-                    make_move(i, j)
-                    st.rerun()
+    # Create the grid: each cell sits in a container whose key carries its
+    # state, which the grid stylesheet picks up as a st-key-cell-<state>-* class
+    size = st.session_state.board_size
+    waiting = st.session_state.pending_move is not None
+    with st.container(key=f"board-{size}"):
+        for i in range(size):
+            cols = st.columns(size)
+            for j in range(size):
+                with cols[j]:
+                    cell = st.session_state.board[i][j]
+                    if (i, j) in st.session_state.winning_line:
+                        state = "win"
+                    elif (i, j) == st.session_state.last_computer_move:
+                        state = "reply"
+                    else:
+                        state = cell or "empty"
+                    with st.container(key=f"cell-{state}-{i}-{j}"):
+                        if st.button(cell or ' ', key=f"btn_{i}_{j}",
+                                     disabled=cell != '' or st.session_state.game_over or waiting):
+                            make_move(i, j)
+                            st.rerun()
 
 with main_col2:
         
     # Instructions
     st.markdown("#### How to Play:")
-    st.markdown("""
+    st.markdown(f"""
     **Two Player Mode:**
     - Players take turns (X goes first)
     - Click empty squares to make moves
     
     **Single Player Mode:**
     - You are X, computer is O
-    - Computer makes random moves
+    - Random: computer makes random moves
+    - MCTS: computer searches each move for 0.2s (Monte Carlo tree search)
+    - Unbeatable (3×3 only): computer plays perfectly, the best you can do is a tie
     
     **Winning:**
-    - Get 3 in a row (horizontally, vertically, or diagonally)
+    - Get {st.session_state.win_length} in a row (horizontally, vertically, or diagonally)
     - Winning line highlights in green
     - Click 'Reset' to start over
     """)
@@ -326,4 +456,59 @@ with main_col2:
             x_win_rate = (st.session_state.x_wins / st.session_state.games_played) * 100
             st.write(f"**X Win Rate:** {x_win_rate:.1f}%")
     
-    st.markdown('</div>', unsafe_allow_html=True)
\ No newline at end of file
+    st.markdown('</div>', unsafe_allow_html=True)
+
+@st.cache_data(max_entries=16)
+def run_analysis(x_strategy, o_strategy, games, seed):
+    """Self-play summary and games per second; the same request is only simulated once"""
+    start = time.perf_counter()
+    summary = summarize(*simulate(x_strategy, o_strategy, games, seed))
+    return summary, games / (time.perf_counter() - start)
+
+# Analysis mode: strategies against each other on the classic board, simulated in bulk
+with st.expander("📊 Strategy Analysis (3×3 self-play)"):
+    col1, col2, col3 = st.columns(3)
+    x_strategy = col1.selectbox("X plays:", list(STRATEGIES), key="analysis_x")
+    o_strategy = col2.selectbox("O plays:", list(STRATEGIES), key="analysis_o")
+    games = col3.select_slider("Games:", [10_000, 100_000, 1_000_000, 3_000_000], value=1_000_000,
+                               key="analysis_games")
+    if st.button("▶️ Simulate", key="analysis_run"):
+        st.session_state.analysis = (x_strategy, o_strategy, games)
+    
+    if st.session_state.get('analysis'):
+        x_strategy, o_strategy, games = st.session_state.analysis
+        with st.spinner(f"Playing {games:,} games..."):
+            summary, rate = run_analysis(x_strategy, o_strategy, games, seed=0)
+        st.caption(f"{x_strategy} (X) vs {o_strategy} (O): {games:,} games at {rate:,.0f} games/s")
+        
+        outcomes = summary["outcomes"]
+        col1, col2, col3 = st.columns(3)
+        col1.metric("X wins", f"{outcomes[X_WINS]:.1%}")
+        col2.metric("O wins", f"{outcomes[O_WINS]:.1%}")
+        col3.metric("Ties", f"{outcomes[TIE]:.1%}")
+        
+        st.markdown("**Game length (moves):**")
+        st.bar_chart({"Moves": list(range(5, 10)), "Games": summary["lengths"].tolist()},
+                     x="Moves", y="Games")
+        
+        # First-move advantage: how X fares depending on its opening cell
+        st.markdown("**X's result by opening move:**")
+        by_first = summary["by_first_move"]
+        rows = []
+        for row, row_name in enumerate(["Top", "Middle", "Bottom"]):
+            entry = {"Row": row_name}
+            for col, col_name in enumerate(["Left", "Center", "Right"]):
+                results = by_first[row * 3 + col]
+                total = results.sum()
+                entry[col_name] = (f"{results[X_WINS] / total:.1%} win, {results[O_WINS] / total:.1%} loss"
+                                   if total else "never played")
+            rows.append(entry)
+        st.dataframe(rows, hide_index=True, use_container_width=True)
+
+# While a reply is still being worked out, check back for it without holding up this run
+@st.fragment(run_every=0.05 if st.session_state.pending_move is not None else None)
+def await_computer_move():
+    if collect_computer_move():
+        st.rerun()
+
+await_computer_move()
\ No newline at end of file
@@ -1,11 +1,14 @@
 import streamlit as st
 import random
+from rps_predictor import MOVES, NgramPredictor
 
 st.set_page_config(page_title="Rock-Paper-Scissors", page_icon="✂️")
 
 # --- Initialize Session State for Scores ---
 if 'scores' not in st.session_state:
     st.session_state.scores = {'player1': 0, 'player2': 0, 'computer': 0}
+if 'predictor' not in st.session_state:
+    st.session_state.predictor = NgramPredictor()
 
 # --- Game Logic ---
 def get_winner(player1_choice, player2_choice):
@@ -22,7 +25,13 @@ def get_winner(player1_choice, player2_choice):
 
 def play_round_one_player(player_choice):
     """Handles the game logic for one-player mode."""
-    computer_choice = random.choice(['rock', 'paper', 'scissors'])
+    predictor = st.session_state.predictor
+    if st.session_state.get('smart_computer'):
+        computer_choice = MOVES[predictor.choose()]
+    else:
+        computer_choice = random.choice(['rock', 'paper', 'scissors'])
+    # Learn from every round, so switching to smart mode starts with some history
+    predictor.update(MOVES.index(player_choice), MOVES.index(computer_choice))
     st.session_state.player_choice = player_choice
     st.session_state.computer_choice = computer_choice
     
@@ -74,6 +83,12 @@ with col1:
         
     choice_emojis = {'rock': '🗿', 'paper': '📜', 'scissors': '✂️'}
     
+    st.toggle("🧠 Smart computer (learns your patterns)", key='smart_computer')
+    predictor = st.session_state.predictor
+    if st.session_state.smart_computer and predictor.rounds:
+        st.caption(f"Learned from {predictor.rounds} rounds; guessed your throw "
+                   f"{predictor.hits / predictor.rounds:.0%} of the time")
+    
     # One-player buttons
     c1, c2, c3 = st.columns(3)
     with c1:
@@ -1,6 +1,7 @@
 import streamlit as st
 import random
 import time
+from rps_predictor import MOVES, NgramPredictor
 
 # Page configuration
 st.set_page_config(
@@ -128,6 +129,12 @@ if 'player2_choice' not in st.session_state:
 if 'waiting_for_player2' not in st.session_state:
     st.session_state.waiting_for_player2 = False
 
+if 'predictor' not in st.session_state:
+    st.session_state.predictor = NgramPredictor()
+
+if 'smart_computer' not in st.session_state:
+    st.session_state.smart_computer = False
+
 # Game logic functions
 def get_choice_emoji(choice):
     emojis = {"Rock": "🪨", "Paper": "📄", "Scissors": "✂️"}
@@ -143,6 +150,16 @@ def determine_winner(choice1, choice2):
     else:
         return "player2"
 
+def computer_throw():
+    """The computer's choice: random, or beating the player's predicted throw in smart mode"""
+    if st.session_state.smart_computer:
+        return MOVES[st.session_state.predictor.choose()].capitalize()
+    return random.choice(["Rock", "Paper", "Scissors"])
+
+def learn_round(player_choice, computer_choice):
+    """Teach the predictor one round (it learns in both modes)"""
+    st.session_state.predictor.update(MOVES.index(player_choice.lower()), MOVES.index(computer_choice.lower()))
+
 def reset_scores():
     st.session_state.player1_score = 0
     st.session_state.player2_score = 0
@@ -206,6 +223,12 @@ else:
             </div>
             ''', unsafe_allow_html=True)
         
+        st.toggle("🧠 Smart computer (learns your patterns)", key="smart_computer")
+        predictor = st.session_state.predictor
+        if st.session_state.smart_computer and predictor.rounds:
+            st.caption(f"The computer has watched {predictor.rounds} rounds and guessed your "
+                       f"choice {predictor.hits / predictor.rounds:.0%} of the time")
+        
         # Game choices
         st.markdown("### Make your choice!")
         
@@ -213,7 +236,8 @@ else:
         
         with col1:
             if st.button("🪨 Rock", key="rock_single"):
-                computer_choice = random.choice(["Rock", "Paper", "Scissors"])
+                computer_choice = computer_throw()
+                learn_round("Rock", computer_choice)
                 result = determine_winner("Rock", computer_choice)
                 
                 if result == "player1":
@@ -230,7 +254,8 @@ else:
         
         with col2:
             if st.button("📄 Paper", key="paper_single"):
-                computer_choice = random.choice(["Rock", "Paper", "Scissors"])
+                computer_choice = computer_throw()
+                learn_round("Paper", computer_choice)
                 result = determine_winner("Paper", computer_choice)
                 
                 if result == "player1":
@@ -247,7 +272,8 @@ else:
         
         with col3:
             if st.button("✂️ Scissors", key="scissors_single"):
-                computer_choice = random.choice(["Rock", "Paper", "Scissors"])
+                computer_choice = computer_throw()
+                learn_round("Scissors", computer_choice)
                 result = determine_winner("Scissors", computer_choice)
                 
                 if result == "player1":
@@ -1,112 +1,178 @@
 import streamlit as st
-import time
+import streamlit.components.v1 as components
+import os
 from datetime import timedelta
 import math
+from stopwatch_engine import NS_PER_SECOND, IntervalTimer, Stopwatch, TimerRegistry, format_duration
 
-def create_circular_stopwatch_html(elapsed_time):
-    # Calculate progress percentage (360 degrees = 60 seconds)
-    progress_degrees = (elapsed_time % 60) * 6  # 6 degrees per second
-    progress_percentage = (elapsed_time % 60) / 60 * 100
-    
-    # Format time display
-    minutes = int(elapsed_time // 60)
-    seconds = int(elapsed_time % 60)
-    milliseconds = int((elapsed_time * 1000) % 1000)
-    time_text = f"{minutes:02d}:{seconds:02d}.{milliseconds:03d}"
-    
-    # Create circular progress bar using CSS
-    html_code = f"""
-    <style>
-    .stopwatch-container {{
-        display: flex;
-        justify-content: center;
-        align-items: center;
-        margin: 20px 0;
-    }}
-    
-    .circular-progress {{
-        position: relative;
-        height: 300px;
-        width: 300px;
-        border-radius: 50%;
-        background: conic-gradient(#4CAF50 {progress_degrees}deg, #ededed 0deg);
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        box-shadow: 0 4px 15px rgba(0,0,0,0.2);
-    }}
-    
-    .circular-progress::before {{
-        content: '';
-        position: absolute;
-        height: 270px;
-        width: 270px;
-        border-radius: 50%;
-        background-color: white;
-    }}
-    
-    .progress-content {{
-        position: relative;
-        font-size: 32px;
-        font-weight: bold;
-        color: #2E7D32;
-        text-align: center;
-        z-index: 1;
-    }}
+# Browser-side display: ticks locally between Start/Stop/Reset presses
+_stopwatch_display = components.declare_component(
+    "stopwatch_display",
+    path=os.path.join(os.path.dirname(os.path.abspath(__file__)), "components", "stopwatch"),
+)
+
+@st.cache_resource
+def timer_registry():
+    """Event timers shared by every session of this server process"""
+    return TimerRegistry()
+
+def event_timers_page():
+    registry = timer_registry()
     
-    .time-display {{
-        font-family: 'Courier New', monospace;
-        font-size: 28px;
-        margin-bottom: 5px;
-    }}
+    # Status view: ?timer=<id> shows one timer as JSON, ?timer=all lists them.
+    # It is rendered inside the page, so HTTP clients only get the app shell;
+    # code in this process reads timer_registry().list_status() directly.
+    query = st.query_params.get("timer")
+    if query is not None:
+        try:
+            st.json(registry.list_status() if query == "all" else registry.status(int(query)))
+        except (KeyError, ValueError):
+            st.error(f"No timer {query}")
+        return
     
-    .progress-text {{
-        font-size: 16px;
-        color: #666;
-    }}
-    
-    /* Animation for running state */
-    @keyframes pulse {{
-        0% {{ transform: scale(1); }}
-        50% {{ transform: scale(1.02); }}
-        100% {{ transform: scale(1); }}
-    }}
-    
-    .running {{
-        animation: pulse 2s infinite;
-    }}
-    </style>
+    st.title("⏱️ Event Timers")
+    st.caption("Timers live on the server: every visitor sees the same ones, "
+               "and countdowns finish on time whether or not anyone is watching.")
+    st.markdown("---")
+    
+    with st.form("new_timer", clear_on_submit=True):
+        col1, col2, col3 = st.columns([2, 1, 1])
+        name = col1.text_input("Name", placeholder="Heat 1")
+        kind = col2.selectbox("Type", ["Countdown", "Stopwatch"])
+        minutes = col3.number_input("Minutes", min_value=0.1, value=5.0, step=0.5,
+                                    help="Countdowns only")
+        if st.form_submit_button("➕ Add timer", use_container_width=True):
+            name = name or f"Timer {len(registry) + 1}"
+            if kind == "Countdown":
+                registry.add_countdown(name, minutes * 60)
+            else:
+                registry.add_stopwatch(name)
+    
+    timers = registry.list_status()
+    if not timers:
+        st.info("No timers yet")
+        return
+    
+    labels = {t["id"]: f"#{t['id']} {t['name']}" for t in timers}
+    selected = st.selectbox("Timer", list(labels), format_func=labels.get)
+    col1, col2, col3, col4 = st.columns(4)
+    if col1.button("🚀 **Start**", use_container_width=True, key="timer_start"):
+        registry.start(selected)
+    if col2.button("⏸️ **Stop**", use_container_width=True, key="timer_stop"):
+        registry.stop(selected)
+    if col3.button("🔄 **Reset**", use_container_width=True, key="timer_reset"):
+        registry.reset(selected)
+    if col4.button("🗑️ **Remove**", use_container_width=True, key="timer_remove"):
+        registry.remove(selected)
+    
+    live = st.toggle("Live updates", value=True)
+    
+    # Only this table refreshes; the timers themselves need no polling
+    @st.fragment(run_every=1 if live else None)
+    def timer_table():
+        st.dataframe(
+            [{"#": t["id"], "Name": t["name"], "Type": t["kind"], "State": t["state"],
+              "Elapsed": format_duration(int(t["elapsed"] * NS_PER_SECOND)),
+              "Remaining": "" if t["remaining"] is None else format_duration(int(t["remaining"] * NS_PER_SECOND))}
+             for t in registry.list_status()],
+            hide_index=True, use_container_width=True)
+        st.caption(f"{len(registry)} timers, {registry.expired} countdowns finished")
+    
+    timer_table()
+
+def interval_page():
+    st.title("⏱️ Interval Timer")
+    st.markdown("---")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    rounds = col1.number_input("Rounds", min_value=1, max_value=500, value=8)
+    work = col2.number_input("Work (s)", min_value=1, value=20)
+    rest = col3.number_input("Rest (s)", min_value=0, value=10)
+    prepare = col4.number_input("Get ready (s)", min_value=0, value=5)
+    
+    # A new program only when the settings change, so a running one keeps its start time
+    settings = (rounds, work, rest, prepare)
+    if st.session_state.get("interval_settings") != settings:
+        st.session_state.interval_settings = settings
+        st.session_state.intervals = IntervalTimer.rounds(rounds, work, rest, prepare)
+    timer = st.session_state.intervals
+    
+    # The browser finds the current phase itself from the same boundaries
+    _stopwatch_display(view="intervals", html="", elapsed=timer.elapsed_ns() / NS_PER_SECOND,
+                       running=timer.running, ends=[end / NS_PER_SECOND for end in timer.ends],
+                       names=timer.names, kinds=timer.kinds, key="intervals", default=None)
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        if not timer.running:
+            if st.button("🚀 **Start**", use_container_width=True, key="interval_start",
+                         disabled=timer.finished):
+                timer.start()
+                st.rerun()
+        else:
+            if st.button("⏸️ **Pause**", use_container_width=True, key="interval_pause"):
+                timer.stop()
+                st.rerun()
+    with col2:
+        if st.button("🔄 **Reset**", use_container_width=True, key="interval_reset"):
+            timer.reset()
+            st.rerun()
+    with col3:
+        st.markdown(f"**{len(timer)} phases, {format_duration(timer.total_ns)} total**")
     
-    <div class="stopwatch-container">
-        <div class="circular-progress {'running' if st.session_state.running else ''}">
-            <div class="progress-content">
-                <div class="time-display">{time_text}</div>
-                <div class="progress-text">{'RUNNING' if st.session_state.running else 'PAUSED'}</div>
-            </div>
-        </div>
-    </div>
-    """
-    return html_code
+    status = timer.status()
+    st.caption(f"At last update: {status['name']}, {status['remaining']:.1f}s left in phase")
+
+# Dial markup only, as one %-template; its stylesheet ships once with the
+# component (components/stopwatch) instead of with every update
+_DIAL_TEMPLATE = (
+    '<div class="stopwatch-container">'
+    '<div class="circular-progress%s" style="background: conic-gradient(#4CAF50 %.2fdeg, #ededed 0deg)">'
+    '<div class="progress-content">'
+    '<div class="time-display">%02d:%02d.%03d</div>'
+    '<div class="progress-text">%s</div>'
+    '</div></div></div>'
+)
+
+def create_circular_stopwatch_html(elapsed_time, running):
+    # 360 degrees = 60 seconds, 6 degrees per second
+    return _DIAL_TEMPLATE % (
+        " running" if running else "",
+        (elapsed_time % 60) * 6,
+        elapsed_time // 60,
+        elapsed_time % 60,
+        (elapsed_time * 1000) % 1000,
+        "RUNNING" if running else "PAUSED",
+    )
 
 def main():
     st.set_page_config(page_title="Circular Stopwatch", page_icon="⏱️", layout="centered")
     
+    mode = st.sidebar.radio("Mode", ["Stopwatch", "Intervals", "Event timers"],
+                            index=2 if "timer" in st.query_params else 0)
+    if mode == "Intervals":
+        interval_page()
+        return
+    if mode == "Event timers":
+        event_timers_page()
+        return
+    
     st.title("⏱️ Circular Stopwatch")
     st.markdown("---")
     
     # Initialize session state variables
-    if 'running' not in st.session_state:
-        st.session_state.running = False
-    if 'start_time' not in st.session_state:
-        st.session_state.start_time = 0
-    if 'elapsed_time' not in st.session_state:
-        st.session_state.elapsed_time = 0
-    if 'last_update' not in st.session_state:
-        st.session_state.last_update = 0
+    if 'stopwatch' not in st.session_state:
+        st.session_state.stopwatch = Stopwatch()
+    stopwatch = st.session_state.stopwatch
+    
+    # Bring elapsed time up to date for this run (the browser keeps it moving)
+    st.session_state.running = stopwatch.running
+    st.session_state.elapsed_time = stopwatch.elapsed()
     
     # Display the circular stopwatch
-    html_content = create_circular_stopwatch_html(st.session_state.elapsed_time)
-    st.markdown(html_content, unsafe_allow_html=True)
+    html_content = create_circular_stopwatch_html(st.session_state.elapsed_time, st.session_state.running)
+    _stopwatch_display(view="dial", html=html_content, elapsed=st.session_state.elapsed_time,
+                       running=st.session_state.running, key="dial", default=None)
     
     # Control buttons
     col1, col2, col3, col4 = st.columns([1, 1, 1, 1])
@@ -114,56 +180,52 @@ def main():
     with col2:
         if not st.session_state.running:
             if st.button("🚀 **Start**", use_container_width=True, key="start"):
-                st.session_state.running = True
-                if st.session_state.elapsed_time == 0:
-                    st.session_state.start_time = time.time()
-                else:
-                    # Resume from paused time
-                    st.session_state.start_time = time.time() - st.session_state.elapsed_time
-                st.session_state.last_update = time.time()
+                # Starts fresh or resumes from the paused time
+                stopwatch.start()
                 st.rerun()
         else:
             if st.button("⏸️ **Stop**", use_container_width=True, key="stop"):
-                st.session_state.running = False
-                # Update elapsed time when stopping
-                current_time = time.time()
-                st.session_state.elapsed_time = current_time - st.session_state.start_time
+                stopwatch.stop()
                 st.rerun()
     
     with col3:
         if st.button("🔄 **Reset**", use_container_width=True, key="reset"):
-            st.session_state.running = False
-            st.session_state.elapsed_time = 0
-            st.session_state.start_time = 0
+            stopwatch.reset()
             st.rerun()
     
-    # Update timer if running
-    if st.session_state.running:
-        current_time = time.time()
-        st.session_state.elapsed_time = current_time - st.session_state.start_time
-        
-        # Auto-refresh every 100ms for smooth animation
-        if current_time - st.session_state.last_update > 0.1:
-            st.session_state.last_update = current_time
+    with col4:
+        if st.button("🏁 **Lap**", use_container_width=True, key="lap", disabled=not stopwatch.running):
+            stopwatch.lap()
             st.rerun()
     
     # Display additional time information in cards
     st.markdown("---")
     st.subheader("Time Details")
     
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        minutes = int(st.session_state.elapsed_time // 60)
-        st.info(f"**Minutes:** {minutes:02d}")
-    
-    with col2:
-        seconds = int(st.session_state.elapsed_time % 60)
-        st.warning(f"**Seconds:** {seconds:02d}")
+    _stopwatch_display(view="details", html="", elapsed=st.session_state.elapsed_time,
+                       running=st.session_state.running, key="details", default=None)
     
-    with col3:
-        milliseconds = int((st.session_state.elapsed_time * 1000) % 1000)
-        st.success(f"**Milliseconds:** {milliseconds:03d}")
+    # Laps: stats are kept current as laps are added, the table only shows the latest
+    laps = stopwatch.laps
+    if len(laps):
+        st.markdown("---")
+        st.subheader(f"Laps ({len(laps)})")
+        
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Fastest", format_duration(laps.fastest_ns))
+        col2.metric("Slowest", format_duration(laps.slowest_ns))
+        col3.metric("Mean", format_duration(int(laps.mean_ns)))
+        col4.metric("Std Dev", f"{laps.stdev_ns / 1e6:.1f} ms")
+        
+        st.dataframe(
+            [{"Lap": number, "Lap Time": format_duration(lap), "Split": format_duration(split),
+              "": "⚡" if number - 1 == laps.fastest_index else "🐢" if number - 1 == laps.slowest_index else ""}
+             for number, lap, split in laps.recent(10)],
+            hide_index=True, use_container_width=True)
+        
+        # The CSV is only built when the button is clicked, never kept in session state
+        st.download_button("⬇️ Export laps (CSV)", data=laps.to_csv,
+                           file_name="laps.csv", mime="text/csv")
     
     # Status indicator
     status_color = "🟢" if st.session_state.running else "🔴"
@@ -1,8 +1,11 @@
 import streamlit as st
-import random
-import time
 import pandas as pd
-from typing import List, Tuple, Optional
+from snake_autopilot import HamiltonianPolicy
+from snake_clock import TickClock
+from snake_engine import SnakeGame
+from snake_leaderboard import Leaderboard
+from snake_render import read_keys, render_board
+from snake_replay import Replay, ReplayPlayer, ReplayRecorder
 
 # Configure the page
 st.set_page_config(
@@ -106,87 +109,6 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-class SnakeGame:
-    def __init__(self, width: int = 20, height: int = 15):
-        self.width = width
-        self.height = height
-        self.reset_game()
-    
-    def reset_game(self):
-        """Reset the game to initial state"""
-        self.snake = [(self.width // 2, self.height // 2)]
-        self.direction = (1, 0)  # Moving right initially
-        self.food = self.generate_food()
-        self.score = 0
-        self.game_over = False
-        self.game_won = False
-    
-    def generate_food(self) -> Tuple[int, int]:
-        """Generate food at a random position not occupied by snake"""
-        while True:
-            food = (random.randint(0, self.width - 1), random.randint(0, self.height - 1))
-            if food not in self.snake:
-                return food
-    
-    def move_snake(self):
-        """Move the snake in the current direction"""
-        if self.game_over:
-            return
-        
-        head_x, head_y = self.snake[0]
-        dx, dy = self.direction
-        new_head = (head_x + dx, head_y + dy)
-        
-        # Check wall collision
-        if (new_head[0] < 0 or new_head[0] >= self.width or 
-            new_head[1] < 0 or new_head[1] >= self.height):
-            self.game_over = True
-            return
-        
-        # Check self collision
-        if new_head in self.snake:
-            self.game_over = True
-            return
-        
-        self.snake.insert(0, new_head)
-        
-        # Check if food eaten
-        if new_head == self.food:
-            self.score += 10
-            self.food = self.generate_food()
-            
-            # Check win condition (snake fills most of the board)
-            if len(self.snake) >= (self.width * self.height * 0.8):
-                self.game_won = True
-        else:
-            self.snake.pop()  # Remove tail if no food eaten
-    
-    def change_direction(self, new_direction: Tuple[int, int]):
-        """Change snake direction, preventing 180-degree turns"""
-        current_dx, current_dy = self.direction
-        new_dx, new_dy = new_direction
-        
-        # Prevent 180-degree turns
-        if (current_dx, current_dy) != (-new_dx, -new_dy):
-            self.direction = new_direction
-    
-    def get_board_display(self) -> List[List[str]]:
-        """Get the current board state for display"""
-        board = [['⬜' for _ in range(self.width)] for _ in range(self.height)]
-        
-        # Place food
-        food_x, food_y = self.food
-        board[food_y][food_x] = '🍎'
-        
-        # Place snake
-        for i, (x, y) in enumerate(self.snake):
-            if i == 0:  # Head
-                board[y][x] = '🟢'
-            else:  # Body
-                board[y][x] = '🟩'
-        
-        return board
-
 # Initialize session state
 if 'game' not in st.session_state:
     st.session_state.game = SnakeGame()
@@ -194,104 +116,183 @@ if 'auto_move' not in st.session_state:
     st.session_state.auto_move = False
 if 'game_speed' not in st.session_state:
     st.session_state.game_speed = 0.3
+if 'renderer' not in st.session_state:
+    st.session_state.renderer = 'Canvas'
+if 'tick_clock' not in st.session_state:
+    st.session_state.tick_clock = TickClock(st.session_state.game_speed)
+if 'ai_mode' not in st.session_state:
+    st.session_state.ai_mode = False
+if 'autopilot' not in st.session_state:
+    st.session_state.autopilot = HamiltonianPolicy(budget=0.001)
+if 'recorder' not in st.session_state:
+    st.session_state.recorder = ReplayRecorder(st.session_state.game)
+if 'saved_seed' not in st.session_state:
+    st.session_state.saved_seed = None
+
+@st.cache_resource
+def get_leaderboard() -> Leaderboard:
+    """One leaderboard shared by every session of this server"""
+    return Leaderboard()
+
+def new_game():
+    """Start a fresh game with auto play switched off"""
+    st.session_state.game = SnakeGame()
+    st.session_state.recorder = ReplayRecorder(st.session_state.game)
+    st.session_state.auto_move = False
+
+def save_score():
+    """Store the finished game, with its replay, on the leaderboard"""
+    game = st.session_state.game
+    get_leaderboard().add_game(st.session_state.player_name.strip() or "Anonymous", game.width, game.height,
+                               game.score, len(game.snake), game.seed,
+                               st.session_state.recorder.replay.to_string())
+    st.session_state.saved_seed = game.seed
+
+def watch_replay(replay_code: str):
+    """Load a leaderboard game into the replay viewer"""
+    st.session_state.replay_code = replay_code
 
 # Main game interface
 st.markdown('<h1 class="main-header">🐍 Snake Game Pro</h1>', unsafe_allow_html=True)
 
-# Game statistics
-col1, col2, col3 = st.columns(3)
-with col1:
-    st.markdown(f"""
-    <div class="stat-box">
-        <span class="stat-value">{st.session_state.game.score}</span>
-        <span class="stat-label">SCORE</span>
-    </div>
-    """, unsafe_allow_html=True)
+def game_playing() -> bool:
+    game = st.session_state.game
+    return not game.game_over and not game.game_won
 
-with col2:
-    st.markdown(f"""
-    <div class="stat-box">
-        <span class="stat-value">{len(st.session_state.game.snake)}</span>
-        <span class="stat-label">LENGTH</span>
-    </div>
-    """, unsafe_allow_html=True)
+def advance_game():
+    """Run one tick, letting the autopilot steer first when AI mode is on"""
+    game = st.session_state.game
+    if game.game_over:
+        return
+    if st.session_state.ai_mode:
+        # Turns queued by hand before AI mode was switched on must not override it
+        game.clear_turns()
+        game.change_direction(st.session_state.autopilot.decide(game))
+    game.move_snake()
+    st.session_state.recorder.record_tick(game)
 
-with col3:
-    status = "🔴 Game Over" if st.session_state.game.game_over else "🏆 You Won!" if st.session_state.game.game_won else "🟢 Playing"
-    st.markdown(f"""
-    <div class="stat-box">
-        <span class="stat-value" style="font-size: 1.2rem;">{status}</span>
-        <span class="stat-label">STATUS</span>
-    </div>
-    """, unsafe_allow_html=True)
+# Auto play reruns only this fragment on a timer; the clock decides how many
+# ticks are due so the cadence holds no matter how long a rerun takes
+@st.fragment(run_every=st.session_state.game_speed if st.session_state.auto_move and game_playing() else None)
+def game_view():
+    # Key presses rerun just this fragment and queue a turn for the next tick
+    read_keys(st.session_state.game, enabled=not st.session_state.ai_mode)
 
-# Game board
-st.markdown('<div class="game-board">', unsafe_allow_html=True)
-board = st.session_state.game.get_board_display()
+    clock = st.session_state.tick_clock
+    clock.set_period(st.session_state.game_speed)
+    if st.session_state.auto_move and game_playing():
+        if not clock.running:
+            clock.start()
+        for _ in range(clock.due()):
+            advance_game()
+            if not game_playing():
+                clock.stop()
+                st.rerun()  # Full rerun: stop the timer and show the result
+    else:
+        clock.stop()
 
-# Create board display using columns
-board_container = st.container()
-with board_container:
-    for row in board:
-        cols = st.columns(len(row))
-        for j, cell in enumerate(row):
-            with cols[j]:
-                st.markdown(f"<div style='text-align: center; font-size: 1.5rem;'>{cell}</div>", 
-                           unsafe_allow_html=True)
+    # Game statistics
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.markdown(f"""
+        <div class="stat-box">
+            <span class="stat-value">{st.session_state.game.score}</span>
+            <span class="stat-label">SCORE</span>
+        </div>
+        """, unsafe_allow_html=True)
 
-st.markdown('</div>', unsafe_allow_html=True)
+    with col2:
+        st.markdown(f"""
+        <div class="stat-box">
+            <span class="stat-value">{len(st.session_state.game.snake)}</span>
+            <span class="stat-label">LENGTH</span>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col3:
+        status = "🔴 Game Over" if st.session_state.game.game_over else "🏆 You Won!" if st.session_state.game.game_won else "🟢 Playing"
+        st.markdown(f"""
+        <div class="stat-box">
+            <span class="stat-value" style="font-size: 1.2rem;">{status}</span>
+            <span class="stat-label">STATUS</span>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # Game board
+    if st.session_state.renderer == 'Canvas':
+        # One canvas component that only receives the cells changed since the last frame
+        render_board(st.session_state.game)
+    else:
+        st.markdown('<div class="game-board">', unsafe_allow_html=True)
+        board = st.session_state.game.get_board_display()
+
+        # Create board display using columns
+        board_container = st.container()
+        with board_container:
+            for row in board:
+                cols = st.columns(len(row))
+                for j, cell in enumerate(row):
+                    with cols[j]:
+                        st.markdown(f"<div style='text-align: center; font-size: 1.5rem;'>{cell}</div>", 
+                                   unsafe_allow_html=True)
+
+        st.markdown('</div>', unsafe_allow_html=True)
+
+    if clock.running:
+        st.caption(f"⏱️ {clock.achieved_rate():.1f} / {clock.target_rate:.1f} ticks/s"
+                   + (f" · {clock.dropped} dropped" if clock.dropped else ""))
+
+game_view()
 
 # Control panel
 st.markdown('<div class="control-panel">', unsafe_allow_html=True)
 st.markdown("### 🎮 Game Controls")
 
 # Direction buttons
-col1, col2, col3, col4, col5 = st.columns([1, 1, 1, 1, 1])
+col1, col2, col3, col4, col5, col6 = st.columns([1, 1, 1, 1, 1, 1])
 
 with col1:
-    if st.button("⬅️ Left", key="left"):
+    if st.button("⬅️ Left", key="left", disabled=st.session_state.ai_mode):
         st.session_state.game.change_direction((-1, 0))
 
 with col2:
-    if st.button("⬆️ Up", key="up"):
+    if st.button("⬆️ Up", key="up", disabled=st.session_state.ai_mode):
         st.session_state.game.change_direction((0, -1))
 
 with col3:
-    if st.button("⬇️ Down", key="down"):
+    if st.button("⬇️ Down", key="down", disabled=st.session_state.ai_mode):
         st.session_state.game.change_direction((0, 1))
 
 with col4:
-    if st.button("➡️ Right", key="right"):
+    if st.button("➡️ Right", key="right", disabled=st.session_state.ai_mode):
         st.session_state.game.change_direction((1, 0))
 
 with col5:
     if st.button("🔄 Move", key="manual_move"):
         if not st.session_state.game.game_over and not st.session_state.game.game_won:
-            st.session_state.game.move_snake()
+            advance_game()
             st.rerun()
 
+with col6:
+    st.toggle("🧠 AI", key='ai_mode', help="Let the pathfinding autopilot steer")
+
 st.markdown('</div>', unsafe_allow_html=True)
 
 # Auto-play controls
-col1, col2 = st.columns(2)
+col1, col2, col3 = st.columns(3)
 with col1:
-    auto_play = st.checkbox("🤖 Auto Play", value=st.session_state.auto_move)
-    st.session_state.auto_move = auto_play
+    st.checkbox("🤖 Auto Play", key='auto_move')
 
 with col2:
-    speed = st.selectbox(
+    st.selectbox(
         "⚡ Speed",
         options=[0.5, 0.3, 0.2, 0.1],
-        index=1,
+        key='game_speed',
         format_func=lambda x: f"{'🐌 Slow' if x == 0.5 else '🚶 Normal' if x == 0.3 else '🏃 Fast' if x == 0.2 else '⚡ Lightning'}"
     )
-    st.session_state.game_speed = speed
 
-# Auto-move logic
-if st.session_state.auto_move and not st.session_state.game.game_over and not st.session_state.game.game_won:
-    time.sleep(st.session_state.game_speed)
-    st.session_state.game.move_snake()
-    st.rerun()
+with col3:
+    st.selectbox("🖼️ Board", options=['Canvas', 'Emoji Grid'], key='renderer')
 
 # Game over/won screen
 if st.session_state.game.game_over:
@@ -312,11 +313,63 @@ elif st.session_state.game.game_won:
     </div>
     """, unsafe_allow_html=True)
 
+# Leaderboard entry for the finished game
+game = st.session_state.game
+if game.game_over or game.game_won:
+    leaderboard = get_leaderboard()
+    rank = leaderboard.rank(game.width, game.height, game.score)
+    if st.session_state.saved_seed == game.seed:
+        st.success(f"🏅 Saved! Rank #{rank} of {leaderboard.count(game.width, game.height)}")
+    else:
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            st.text_input("Your name", key='player_name', placeholder="Anonymous")
+        with col2:
+            st.button(f"🏅 Save (rank #{rank})", key="save_score", on_click=save_score)
+
 # Restart button
-if st.button("🔄 Start New Game", key="restart"):
-    st.session_state.game = SnakeGame()
-    st.session_state.auto_move = False
-    st.rerun()
+st.button("🔄 Start New Game", key="restart", on_click=new_game)
+
+# High scores for this board size
+with st.expander("🏅 Leaderboard", expanded=False):
+    game = st.session_state.game
+    top_games = get_leaderboard().top(game.width, game.height, 10)
+    if top_games:
+        st.dataframe(pd.DataFrame(
+            [{"Rank": i + 1, "Player": row["player"], "Score": row["score"], "Length": row["length"]}
+             for i, row in enumerate(top_games)]), hide_index=True, use_container_width=True)
+        with_replay = [row for row in top_games if row["replay"]]
+        if with_replay:
+            choice = st.selectbox("Watch a top game", range(len(with_replay)),
+                                  format_func=lambda i: f"{with_replay[i]['player']} · {with_replay[i]['score']}")
+            st.button("🎬 Watch", key="watch_top", on_click=watch_replay, args=(with_replay[choice]["replay"],))
+    else:
+        st.write("No games saved yet for this board size.")
+
+# Replays: seed + turns only, rebuilt headlessly from the nearest keyframe
+with st.expander("🎬 Replay", expanded=False):
+    current = st.session_state.recorder.replay
+    st.text_input("Replay code for this game", value=current.to_string(), disabled=True)
+    st.caption(f"{current.ticks:,} ticks · {len(current.events):,} turns · {len(current.to_bytes()):,} bytes")
+
+    code = st.text_input("Paste a replay code to watch", key='replay_code')
+    try:
+        replay = Replay.from_string(code) if code else current
+    except ValueError as exc:
+        st.error(f"Invalid replay code: {exc}")
+        replay = current
+    # Keep the player (and its keyframes) while the same replay is on screen
+    source = code or ('live', current.ticks)
+    if st.session_state.get('replay_source') != source:
+        st.session_state.replay_source = source
+        st.session_state.replay_player = ReplayPlayer(replay)
+
+    player = st.session_state.replay_player
+    if player.ticks:
+        tick = st.slider("Tick", 0, player.ticks, player.ticks)
+        replayed = player.state_at(tick)
+        st.write(f"Score: **{replayed.score}** · Length: **{len(replayed.snake)}**")
+        render_board(replayed, key='replay_board')
 
 # Instructions
 with st.expander("📖 How to Play", expanded=False):
@@ -327,9 +380,11 @@ with st.expander("📖 How to Play", expanded=False):
         
         <h4>🎮 Controls</h4>
         <ul>
+            <li><strong>Keyboard:</strong> Arrow keys or WASD queue turns for the next moves</li>
             <li><strong>Direction Buttons:</strong> Use ⬅️⬆️⬇️➡️ buttons to change direction</li>
             <li><strong>Manual Move:</strong> Click "🔄 Move" to advance one step</li>
             <li><strong>Auto Play:</strong> Enable for automatic movement</li>
+            <li><strong>AI:</strong> Let the autopilot steer toward the apple without trapping itself</li>
             <li><strong>Speed Control:</strong> Adjust how fast the snake moves</li>
         </ul>
         
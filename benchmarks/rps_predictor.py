@@ -0,0 +1,74 @@
+"""N-gram Rock-Paper-Scissors opponent: prediction latency over long sessions, and results against scripted players.
+
+Run from the repository root:  python -m benchmarks.rps_predictor
+"""
+import argparse
+import random
+import time
+
+from rps_predictor import NgramPredictor, counter
+
+# Scripted players: (their throw history, computer throw history, rng) -> next throw
+PLAYERS = {
+    "random": lambda mine, theirs, rng: rng.randrange(3),
+    "mostly rock": lambda mine, theirs, rng: 0 if rng.random() < 0.5 else rng.randrange(3),
+    "cycle R-P-S": lambda mine, theirs, rng: len(mine) % 3,
+    "beat last": lambda mine, theirs, rng: counter(theirs[-1]) if theirs else 0,
+    "repeat after win": lambda mine, theirs, rng: (mine[-1] if theirs and counter(theirs[-1]) == mine[-1]
+                                                   else rng.randrange(3)),
+    "pattern RRPSP": lambda mine, theirs, rng: (0, 0, 1, 2, 1)[len(mine) % 5],
+}
+
+
+def latency(rounds: int, calls: int = 20_000) -> tuple:
+    """Microseconds per choose() and update() after `rounds` rounds of history"""
+    predictor = NgramPredictor(seed=0)
+    rng = random.Random(0)
+    for _ in range(rounds):
+        predictor.update(rng.randrange(3), rng.randrange(3))
+    start = time.perf_counter()
+    for _ in range(calls):
+        predictor.choose()
+    choose = (time.perf_counter() - start) / calls
+    start = time.perf_counter()
+    for i in range(calls):
+        predictor.update(i % 3, (i // 3) % 3)
+    update = (time.perf_counter() - start) / calls
+    return choose * 1e6, update * 1e6
+
+
+def match(player, rounds: int) -> tuple:
+    """Computer (win, draw, loss) shares over `rounds` rounds"""
+    predictor = NgramPredictor(seed=1)
+    rng = random.Random(2)
+    mine, theirs = [], []
+    results = [0, 0, 0]
+    for _ in range(rounds):
+        computer = predictor.choose()
+        move = player(mine, theirs, rng)
+        results[0 if computer == counter(move) else 1 if computer == move else 2] += 1
+        predictor.update(move, computer)
+        mine.append(move)
+        theirs.append(computer)
+    return tuple(r / rounds for r in results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, nargs="+", default=[100, 10_000, 100_000])
+    parser.add_argument("--match-rounds", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'history':>10}  {'choose us':>9}  {'update us':>9}")
+    for rounds in args.rounds:
+        choose, update = latency(rounds)
+        print(f"{rounds:>10,}  {choose:>9.2f}  {update:>9.2f}")
+
+    print(f"\n{'player':>18}  {'computer wins':>13}  {'draws':>6}  {'losses':>6}")
+    for name, player in PLAYERS.items():
+        win, draw, loss = match(player, args.match_rounds)
+        print(f"{name:>18}  {win:>13.1%}  {draw:>6.1%}  {loss:>6.1%}")
+
+
+if __name__ == "__main__":
+    main()
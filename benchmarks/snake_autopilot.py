@@ -0,0 +1,59 @@
+"""Score, win rate and decision latency of the Snake autopilot policies.
+
+Run from the repository root:  python -m benchmarks.snake_autopilot
+"""
+import argparse
+import time
+
+from snake_autopilot import POLICIES, make_policy
+from snake_engine import SnakeGame
+
+
+def play(policy, width: int, height: int, seed: int, max_ticks: int):
+    """Play one seeded game; returns (score, won, decision times in seconds)"""
+    game = SnakeGame(width, height, seed=seed)
+    timings = []
+    for _ in range(max_ticks):
+        start = time.perf_counter()
+        direction = policy.decide(game)
+        timings.append(time.perf_counter() - start)
+        game.change_direction(direction)
+        game.move_snake()
+        if game.game_over or game.game_won:
+            break
+    return game.score, game.game_won, timings
+
+
+def percentile(values, q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seeds", type=int, default=20)
+    parser.add_argument("--policies", nargs="+", default=list(POLICIES), choices=list(POLICIES))
+    args = parser.parse_args()
+
+    # (width, height, seeds, tick cap, budget): full games on the default board,
+    # latency over a capped stretch of play on the large one
+    boards = [(20, 15, args.seeds, 100_000, 0.001), (100, 100, 2, 5_000, 0.010)]
+
+    print(f"{'board':>8}  {'policy':>12}  {'avg score':>9}  {'win rate':>8}  "
+          f"{'p50 ms':>7}  {'p99 ms':>7}  {'budget':>7}")
+    for width, height, seeds, max_ticks, budget in boards:
+        for name in args.policies:
+            policy = make_policy(name, budget)
+            scores, wins, timings = [], 0, []
+            for seed in range(seeds):
+                score, won, times = play(policy, width, height, seed, max_ticks)
+                scores.append(score)
+                wins += won
+                timings.extend(times)
+            print(f"{width}x{height:<5}  {name:>12}  {sum(scores) / len(scores):>9.1f}  "
+                  f"{wins / seeds:>8.0%}  {percentile(timings, 0.5) * 1e3:>7.3f}  "
+                  f"{percentile(timings, 0.99) * 1e3:>7.3f}  {budget * 1e3:>7.1f}")
+
+
+if __name__ == "__main__":
+    main()
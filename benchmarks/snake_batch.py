@@ -0,0 +1,89 @@
+"""Throughput of SnakeBatch in game-steps/sec, with a rules parity check.
+
+Run from the repository root:  python -m benchmarks.snake_batch
+"""
+import argparse
+import random
+import time
+
+import numpy as np
+
+from snake_batch import SnakeBatch
+from snake_engine import DIRECTIONS, SnakeGame
+
+
+def check_parity(games: int, ticks: int, seed: int = 0):
+    """Play random actions through SnakeBatch and SnakeGame side by side"""
+    batch = SnakeBatch(games, seed=seed)
+    scalar = [SnakeGame() for _ in range(games)]
+    rng = np.random.default_rng(seed + 1)
+
+    def follow_food(i):
+        # The apple is random in both engines; make SnakeGame use the batch's
+        food = int(batch.food[i])
+        scalar[i].food = (food % batch.width, food // batch.width)
+
+    for i in range(games):
+        follow_food(i)
+
+    for _ in range(ticks):
+        actions = rng.integers(-1, 4, games)
+        batch.step(actions)
+        for i, game in enumerate(scalar):
+            if actions[i] >= 0:
+                game.change_direction(DIRECTIONS[actions[i]])
+            game.move_snake()
+            assert game.game_over == batch.game_over[i], f"game {i}: game_over differs"
+            assert game.game_won == batch.game_won[i], f"game {i}: game_won differs"
+            assert game.score == batch.score[i], f"game {i}: score differs"
+            assert len(game.snake) == batch.length[i], f"game {i}: length differs"
+            follow_food(i)
+
+        ended = batch.done.copy()
+        batch.reset(ended)
+        for i in np.flatnonzero(ended):
+            scalar[i] = SnakeGame()
+            follow_food(i)
+
+
+def batch_rate(n: int, ticks: int, width: int, height: int) -> float:
+    """Game-steps per second for n parallel games with random actions"""
+    batch = SnakeBatch(n, width, height, seed=0)
+    actions = np.random.default_rng(1).integers(-1, 4, (ticks, n))
+    start = time.perf_counter()
+    for t in range(ticks):
+        batch.step(actions[t])
+        batch.reset(batch.done)
+    return n * ticks / (time.perf_counter() - start)
+
+
+def scalar_rate(ticks: int, width: int, height: int) -> float:
+    """Game-steps per second for a single SnakeGame driven from Python"""
+    game = SnakeGame(width, height)
+    start = time.perf_counter()
+    for _ in range(ticks):
+        game.change_direction(random.choice(DIRECTIONS))
+        game.move_snake()
+        if game.game_over or game.game_won:
+            game.reset_game()
+    return ticks / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--width", type=int, default=20)
+    parser.add_argument("--height", type=int, default=15)
+    parser.add_argument("--ticks", type=int, default=200)
+    args = parser.parse_args()
+
+    check_parity(games=64, ticks=500)
+    print("parity check against SnakeGame: ok")
+
+    print(f"{'games':>8}  {'steps/sec':>14}")
+    print(f"{'scalar':>8}  {scalar_rate(args.ticks * 100, args.width, args.height):>14,.0f}")
+    for n in (1, 64, 1024, 8192):
+        print(f"{n:>8}  {batch_rate(n, args.ticks, args.width, args.height):>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Steps per second of SnakeEnv and SnakeVectorEnv with random actions.
+
+Run from the repository root:  python -m benchmarks.snake_env
+"""
+import argparse
+import time
+
+import numpy as np
+
+from snake_env import SnakeEnv, SnakeVectorEnv
+
+
+def env_rate(observation: str, steps: int) -> float:
+    env = SnakeEnv(observation=observation)
+    env.reset(seed=0)
+    actions = np.random.default_rng(0).integers(-1, 4, steps).tolist()
+    start = time.perf_counter()
+    for action in actions:
+        _, _, terminated, truncated, _ = env.step(action)
+        if terminated or truncated:
+            env.reset()
+    return steps / (time.perf_counter() - start)
+
+
+def vector_rate(n: int, observation: str, steps: int) -> float:
+    env = SnakeVectorEnv(n, observation=observation)
+    env.reset(seed=0)
+    actions = np.random.default_rng(0).integers(-1, 4, (steps, n))
+    start = time.perf_counter()
+    for t in range(steps):
+        env.step(actions[t])
+    return n * steps / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--steps", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'env':>16}  {'obs':>8}  {'steps/sec':>12}")
+    for observation in ("grid", "features"):
+        print(f"{'SnakeEnv':>16}  {observation:>8}  {env_rate(observation, args.steps * 50):>12,.0f}")
+        for n in (256, 4096):
+            print(f"{f'VectorEnv x{n}':>16}  {observation:>8}  "
+                  f"{vector_rate(n, observation, args.steps):>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
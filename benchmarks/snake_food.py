@@ -0,0 +1,59 @@
+"""Apple placement cost of SnakeGame.generate_food at different fill levels.
+
+Run from the repository root:  python -m benchmarks.snake_food
+"""
+import argparse
+import time
+from collections import Counter
+
+from snake_autopilot import hamiltonian_cycle
+from snake_engine import SnakeGame
+
+
+def filled_game(width: int, height: int, length: int) -> SnakeGame:
+    """A game whose snake covers the first `length` cells of the cycle"""
+    cycle = hamiltonian_cycle(width, height)
+    game = SnakeGame(width, height)
+    game.place_snake([cycle[i] for i in range(length - 1, -1, -1)], (0, 0))
+    return game
+
+
+def time_food(game: SnakeGame, samples: int) -> float:
+    """Average seconds per generate_food call"""
+    start = time.perf_counter()
+    for _ in range(samples):
+        game.generate_food()
+    return (time.perf_counter() - start) / samples
+
+
+def uniformity(width: int, height: int, length: int, samples: int) -> float:
+    """Chi-square statistic of apple positions over the free cells"""
+    game = filled_game(width, height, length)
+    counts = Counter(game.generate_food() for _ in range(samples))
+    free = width * height - length
+    expected = samples / free
+    missing = free - len(counts)
+    return sum((c - expected) ** 2 / expected for c in counts.values()) + missing * expected
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--width", type=int, default=200)
+    parser.add_argument("--height", type=int, default=200)
+    parser.add_argument("--samples", type=int, default=20000)
+    args = parser.parse_args()
+
+    area = args.width * args.height
+    print(f"{'filled':>8}  {'free':>7}  {'us/apple':>9}")
+    for fill in (0.0, 0.5, 0.8, 0.99, 0.999):
+        length = max(1, min(area - 1, int(area * fill)))
+        per_call = time_food(filled_game(args.width, args.height, length), args.samples)
+        print(f"{fill:>8.1%}  {area - length:>7}  {per_call * 1e6:>9.2f}")
+
+    # 20x15 board, 90% full: 30 free cells, so the statistic should sit near 29
+    chi2 = uniformity(20, 15, 270, 60000)
+    print(f"chi-square over 30 free cells (df=29): {chi2:.1f}")
+
+
+if __name__ == "__main__":
+    main()
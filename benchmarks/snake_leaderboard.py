@@ -0,0 +1,73 @@
+"""Leaderboard query latency with many stored games, and concurrent inserts.
+
+Run from the repository root:  python -m benchmarks.snake_leaderboard
+"""
+import argparse
+import os
+import random
+import tempfile
+import threading
+import time
+
+from snake_leaderboard import Leaderboard
+
+
+def fill(board: Leaderboard, games: int, batch: int = 50_000):
+    rng = random.Random(0)
+    for start in range(0, games, batch):
+        board.add_games(("bench", 20, 15, 10 * min(239, int(rng.expovariate(1 / 40))), 0, start + i, None)
+                        for i in range(min(batch, games - start)))
+
+
+def time_queries(board: Leaderboard, runs: int) -> tuple:
+    rng = random.Random(1)
+    start = time.perf_counter()
+    for _ in range(runs):
+        board.top(20, 15, 10)
+    top = (time.perf_counter() - start) / runs
+    start = time.perf_counter()
+    for _ in range(runs):
+        board.rank(20, 15, 10 * rng.randrange(240))
+    rank = (time.perf_counter() - start) / runs
+    return top, rank
+
+
+def concurrent_inserts(board: Leaderboard, threads: int, per_thread: int) -> float:
+    """Single-game inserts per second from several threads at once"""
+    def worker(n):
+        for i in range(per_thread):
+            board.add_game(f"player{n}", 20, 15, 10 * (i % 50), i % 50 + 1, i)
+
+    pool = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    start = time.perf_counter()
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    return threads * per_thread / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--runs", type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        board = Leaderboard(os.path.join(tmp, "bench.db"))
+        print(f"{'games':>10}  {'top-10 us':>10}  {'rank us':>8}")
+        stored = 0
+        for games in sorted(args.games):
+            fill(board, games - stored)
+            stored = games
+            top, rank = time_queries(board, args.runs)
+            print(f"{stored:>10,}  {top * 1e6:>10.1f}  {rank * 1e6:>8.1f}")
+
+        for threads in (1, 4, 8):
+            rate = concurrent_inserts(board, threads, 200)
+            print(f"{threads} inserting threads: {rate:,.0f} games/s, no lock errors")
+        board.close()
+
+
+if __name__ == "__main__":
+    main()
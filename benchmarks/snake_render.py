@@ -0,0 +1,118 @@
+"""Per-frame payload size and server render time: emoji grid vs canvas frames.
+
+Run from the repository root:  python -m benchmarks.snake_render
+"""
+import argparse
+import json
+import time
+import tracemalloc
+
+from snake_autopilot import hamiltonian_cycle
+from snake_engine import SnakeGame
+from snake_render import BoardEncoder
+
+
+def play(width: int, height: int, length: int, ticks: int):
+    """Yield the game after each tick of a snake following a Hamiltonian cycle"""
+    cycle = hamiltonian_cycle(width, height)
+    game = SnakeGame(width, height)
+    game.place_snake([cycle[i] for i in range(length - 1, -1, -1)], (0, 0))
+    index = length - 1
+    for _ in range(ticks):
+        hx, hy = cycle[index % len(cycle)]
+        nx, ny = cycle[(index + 1) % len(cycle)]
+        game.direction = (nx - hx, ny - hy)
+        game.move_snake()
+        index += 1
+        yield game
+
+
+def emoji_grid_frame(game: SnakeGame) -> int:
+    """Bytes of markdown the emoji-grid renderer emits for one frame"""
+    total = 0
+    for row in game.get_board_display():
+        for cell in row:
+            html = f"<div style='text-align: center; font-size: 1.5rem;'>{cell}</div>"
+            total += len(html.encode())
+    return total
+
+
+def canvas_frame(encoder: BoardEncoder, game: SnakeGame) -> int:
+    """Bytes of JSON the canvas renderer sends for one frame"""
+    return len(json.dumps(encoder.frame(game), separators=(",", ":")).encode())
+
+
+def measure(render, games) -> tuple:
+    sizes, elapsed = [], 0.0
+    for game in games:
+        start = time.perf_counter()
+        sizes.append(render(game))
+        elapsed += time.perf_counter() - start
+    return sum(sizes) / len(sizes), elapsed / len(sizes)
+
+
+def view_allocations(width: int, height: int, ticks: int) -> float:
+    """Peak bytes allocated per tick to move and collect the changed cells"""
+    games = play(width, height, width * height // 2, ticks)
+    next(games).take_changes()  # drop the initial everything-is-dirty set
+    tracemalloc.start()
+    peak = 0
+    while True:
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        game = next(games, None)
+        if game is None:
+            break
+        game.take_changes()
+        peak = max(peak, tracemalloc.get_traced_memory()[1] - before)
+    tracemalloc.stop()
+    return peak
+
+
+def script_run_time(renderer: str, runs: int) -> float:
+    """Seconds per full Day15 script run (one manual move) under AppTest"""
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file("../Day15-SnakeGame.py", default_timeout=30)
+    app.session_state.renderer = renderer
+    app.run()
+    start = time.perf_counter()
+    for _ in range(runs):
+        app.button(key="manual_move").click().run()
+    return (time.perf_counter() - start) / runs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--width", type=int, default=20)
+    parser.add_argument("--height", type=int, default=15)
+    parser.add_argument("--length", type=int, default=60)
+    parser.add_argument("--ticks", type=int, default=2000)
+    parser.add_argument("--app-runs", type=int, default=10,
+                        help="full script runs per renderer (0 to skip)")
+    args = parser.parse_args()
+
+    board = (args.width, args.height, args.length, args.ticks)
+    grid_bytes, grid_time = measure(emoji_grid_frame, play(*board))
+    encoder = BoardEncoder()
+    canvas_bytes, canvas_time = measure(lambda game: canvas_frame(encoder, game), play(*board))
+
+    print(f"{'renderer':>12}  {'bytes/frame':>12}  {'us/frame':>9}  {'elements':>9}")
+    print(f"{'emoji grid':>12}  {grid_bytes:>12,.0f}  {grid_time * 1e6:>9.1f}  {args.width * args.height + args.height:>9}")
+    print(f"{'canvas':>12}  {canvas_bytes:>12,.0f}  {canvas_time * 1e6:>9.1f}  {1:>9}")
+    print(f"payload: {grid_bytes / canvas_bytes:.0f}x smaller, render: {grid_time / canvas_time:.0f}x faster "
+          "(encoding only)")
+
+    for width, height in ((20, 15), (200, 200)):
+        print(f"board view allocation on {width}x{height}: "
+              f"{view_allocations(width, height, 200):,.0f} bytes peak per tick")
+
+    if args.app_runs:
+        grid_run = script_run_time("Emoji Grid", args.app_runs)
+        canvas_run = script_run_time("Canvas", args.app_runs)
+        print(f"full script run: emoji grid {grid_run * 1e3:.1f} ms, canvas {canvas_run * 1e3:.1f} ms "
+              f"({grid_run / canvas_run:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Replay size and seek time for an autopilot game.
+
+Run from the repository root:  python -m benchmarks.snake_replay
+"""
+import argparse
+import random
+import time
+from typing import Tuple
+
+from snake_autopilot import HamiltonianPolicy
+from snake_engine import SnakeGame
+from snake_replay import Replay, ReplayPlayer, ReplayRecorder
+
+
+def record_game(width: int, height: int, seed: int, max_ticks: int) -> Tuple[SnakeGame, Replay]:
+    """Play an autopilot game, returning the final game and its replay"""
+    game = SnakeGame(width, height, seed=seed)
+    recorder = ReplayRecorder(game)
+    policy = HamiltonianPolicy(budget=0.01)
+    for _ in range(max_ticks):
+        game.change_direction(policy.decide(game))
+        game.move_snake()
+        recorder.record_tick(game)
+        if game.game_over or game.game_won:
+            break
+    return game, recorder.replay
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--width", type=int, default=20)
+    parser.add_argument("--height", type=int, default=15)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--max-ticks", type=int, default=200_000)
+    parser.add_argument("--seeks", type=int, default=200)
+    args = parser.parse_args()
+
+    final, replay = record_game(args.width, args.height, args.seed, args.max_ticks)
+    data = replay.to_bytes()
+    print(f"ticks: {replay.ticks:,}  turns: {len(replay.events):,}  replay: {len(data):,} bytes "
+          f"({len(replay.to_string()):,} chars as text)")
+
+    player = ReplayPlayer(Replay.from_bytes(data))
+    rebuilt = player.state_at(replay.ticks)
+    assert (rebuilt.score, list(rebuilt.snake)) == (final.score, list(final.snake)), "replay diverged"
+    print(f"replay reproduces the final state: score {final.score}, length {len(final.snake)}")
+
+    ticks = [random.Random(i).randrange(replay.ticks) for i in range(args.seeks)]
+    for interval in (100, 500, 2000):
+        player = ReplayPlayer(replay, interval=interval)
+        start = time.perf_counter()
+        for tick in ticks:
+            player.state_at(tick)
+        elapsed = (time.perf_counter() - start) / len(ticks)
+        print(f"keyframe every {interval:>5} ticks: {elapsed * 1e3:7.2f} ms per random seek")
+
+
+if __name__ == "__main__":
+    main()
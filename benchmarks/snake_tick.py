@@ -0,0 +1,55 @@
+"""Tick latency of SnakeGame.move_snake as the snake grows.
+
+Run from the repository root:  python -m benchmarks.snake_tick
+"""
+import argparse
+import time
+
+from snake_autopilot import hamiltonian_cycle
+from snake_engine import SnakeGame
+
+
+def time_ticks(width: int, height: int, length: int, ticks: int) -> float:
+    """Average seconds per tick for a snake of the given length following the cycle"""
+    cycle = hamiltonian_cycle(width, height)
+    game = SnakeGame(width, height)
+    body = [cycle[i] for i in range(length - 1, -1, -1)]  # head first
+    game.place_snake(body, (0, 0))
+
+    index = length - 1
+    elapsed = 0.0
+    for _ in range(ticks):
+        hx, hy = cycle[index % len(cycle)]
+        nx, ny = cycle[(index + 1) % len(cycle)]
+        game.direction = (nx - hx, ny - hy)
+        start = time.perf_counter()
+        game.move_snake()
+        elapsed += time.perf_counter() - start
+        index += 1
+        if game.game_over:
+            raise RuntimeError(f"snake crashed at length {len(game.snake)}")
+    return elapsed / ticks
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--width", type=int, default=200)
+    parser.add_argument("--height", type=int, default=200)
+    parser.add_argument("--ticks", type=int, default=2000)
+    args = parser.parse_args()
+
+    area = args.width * args.height
+    lengths = [n for n in (1, 10, 100, 1_000, 10_000) if n < area]
+    lengths.append(area - args.ticks - 1)  # leave room to grow on every tick
+
+    print(f"{'length':>10}  {'us/tick':>10}")
+    results = []
+    for length in lengths:
+        per_tick = time_ticks(args.width, args.height, length, args.ticks)
+        results.append(per_tick)
+        print(f"{length:>10}  {per_tick * 1e6:>10.2f}")
+    print(f"slowest / fastest: {max(results) / min(results):.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Dial render time and bytes sent per update: full <style> f-string vs. markup-only template.
+
+Run from the repository root:  python -m benchmarks.stopwatch_render
+"""
+import argparse
+import importlib.util
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_app():
+    spec = importlib.util.spec_from_file_location("stopwatch_app", os.path.join(ROOT, "Day14-StopWatch.py"))
+    app = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = app  # declare_component looks its caller up by module
+    spec.loader.exec_module(app)
+    return app
+
+
+def legacy_html(elapsed_time, running):
+    """The dial as it used to be built: stylesheet and markup in one f-string per update"""
+    progress_degrees = (elapsed_time % 60) * 6
+    minutes = int(elapsed_time // 60)
+    seconds = int(elapsed_time % 60)
+    milliseconds = int((elapsed_time * 1000) % 1000)
+    time_text = f"{minutes:02d}:{seconds:02d}.{milliseconds:03d}"
+    return f"""
+    <style>
+    .stopwatch-container {{
+        display: flex;
+        justify-content: center;
+        align-items: center;
+        margin: 20px 0;
+    }}
+    
+    .circular-progress {{
+        position: relative;
+        height: 300px;
+        width: 300px;
+        border-radius: 50%;
+        background: conic-gradient(#4CAF50 {progress_degrees}deg, #ededed 0deg);
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        box-shadow: 0 4px 15px rgba(0,0,0,0.2);
+    }}
+    
+    .circular-progress::before {{
+        content: '';
+        position: absolute;
+        height: 270px;
+        width: 270px;
+        border-radius: 50%;
+        background-color: white;
+    }}
+    
+    .progress-content {{
+        position: relative;
+        font-size: 32px;
+        font-weight: bold;
+        color: #2E7D32;
+        text-align: center;
+        z-index: 1;
+    }}
+    
+    .time-display {{
+        font-family: 'Courier New', monospace;
+        font-size: 28px;
+        margin-bottom: 5px;
+    }}
+    
+    .progress-text {{
+        font-size: 16px;
+        color: #666;
+    }}
+    
+    /* Animation for running state */
+    @keyframes pulse {{
+        0% {{ transform: scale(1); }}
+        50% {{ transform: scale(1.02); }}
+        100% {{ transform: scale(1); }}
+    }}
+    
+    .running {{
+        animation: pulse 2s infinite;
+    }}
+    </style>
+    
+    <div class="stopwatch-container">
+        <div class="circular-progress {'running' if running else ''}">
+            <div class="progress-content">
+                <div class="time-display">{time_text}</div>
+                <div class="progress-text">{'RUNNING' if running else 'PAUSED'}</div>
+            </div>
+        </div>
+    </div>
+    """
+
+
+def measure(render, runs: int) -> tuple:
+    """(microseconds per render, bytes of component args per update)"""
+    times = [i * 0.137 for i in range(runs)]
+    start = time.perf_counter()
+    for t in times:
+        render(t, True)
+    per_call = (time.perf_counter() - start) / runs
+    payload = json.dumps({"view": "dial", "html": render(754.321, True), "elapsed": 754.321, "running": True})
+    return per_call * 1e6, len(payload.encode())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=100_000)
+    args = parser.parse_args()
+
+    app = load_app()
+    print(f"{'':>10}  {'render us':>9}  {'bytes/update':>12}")
+    for label, render in (("before", legacy_html), ("after", app.create_circular_stopwatch_html)):
+        micros, size = measure(render, args.runs)
+        print(f"{label:>10}  {micros:>9.2f}  {size:>12,}")
+
+
+if __name__ == "__main__":
+    main()
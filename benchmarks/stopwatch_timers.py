@@ -0,0 +1,91 @@
+"""CPU cost of 1,000 active timers: one shared deadline heap vs. per-timer polling.
+
+Run from the repository root:  python -m benchmarks.stopwatch_timers
+"""
+import argparse
+import random
+import statistics
+import threading
+import time
+
+from stopwatch_engine import NS_PER_SECOND, Countdown, Stopwatch, TimerRegistry
+
+
+def run_registry(timers: int, seconds: float) -> tuple:
+    """Half stopwatches, half countdowns finishing spread over the window"""
+    registry = TimerRegistry()
+    rng = random.Random(0)
+    lateness = []
+    deadlines = {}
+    registry.on_expire(lambda timer_id, name: lateness.append(time.perf_counter_ns() - deadlines[timer_id]))
+    for i in range(timers):
+        if i % 2:
+            timer_id = registry.add_stopwatch(f"stopwatch {i}")
+        else:
+            timer_id = registry.add_countdown(f"countdown {i}", rng.uniform(0.1, seconds))
+        registry.start(timer_id)
+        if i % 2 == 0:
+            deadlines[timer_id] = time.perf_counter_ns() + int(registry.status(timer_id)["remaining"] * NS_PER_SECOND)
+
+    cpu, wall = time.process_time(), time.perf_counter()
+    time.sleep(seconds + 0.2)
+    cpu = time.process_time() - cpu
+    wall = time.perf_counter() - wall
+
+    start = time.perf_counter()
+    for _ in range(100):
+        registry.list_status()
+    list_us = (time.perf_counter() - start) / 100 * 1e6
+    return cpu / wall, lateness, list_us
+
+
+def run_polling(timers: int, seconds: float, interval: float) -> tuple:
+    """Every running timer checked on its own schedule, like a session rerunning to tick"""
+    rng = random.Random(0)
+    countdowns = [Countdown(rng.uniform(0.1, seconds)) for i in range(0, timers, 2)]
+    stopwatches = [Stopwatch() for _ in range(timers - len(countdowns))]
+    lateness = []
+    stop = threading.Event()
+
+    def poll():
+        for timer in countdowns + stopwatches:
+            timer.start()
+        deadlines = [c.deadline_ns() for c in countdowns]
+        while not stop.wait(interval):
+            for stopwatch in stopwatches:
+                stopwatch.elapsed_ns()  # Redrawn on every tick
+            for i, countdown in enumerate(countdowns):
+                if not countdown.finished and countdown.remaining_ns() == 0:
+                    countdown.finished = True
+                    lateness.append(time.perf_counter_ns() - deadlines[i])
+
+    thread = threading.Thread(target=poll, daemon=True)
+    cpu, wall = time.process_time(), time.perf_counter()
+    thread.start()
+    time.sleep(seconds + 0.2)
+    stop.set()
+    thread.join()
+    return (time.process_time() - cpu) / (time.perf_counter() - wall), lateness
+
+
+def describe(lateness) -> str:
+    ms = sorted(late / NS_PER_SECOND * 1e3 for late in lateness)
+    return f"{len(ms)} fired, late p50 {statistics.median(ms):.2f} ms, max {ms[-1]:.2f} ms"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--timers", type=int, default=1000)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--interval", type=float, default=0.01, help="polling period, seconds")
+    args = parser.parse_args()
+
+    cpu, lateness, list_us = run_registry(args.timers, args.seconds)
+    print(f"shared heap:   CPU {cpu:6.2%}  {describe(lateness)}")
+    print(f"               list_status() of {args.timers} timers: {list_us:,.0f} us")
+    cpu, lateness = run_polling(args.timers, args.seconds, args.interval)
+    print(f"polling {args.interval * 1e3:.0f} ms: CPU {cpu:6.2%}  {describe(lateness)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Win check, full check and move generation: nested lists vs. bitboards.
+
+Run from the repository root:  python -m benchmarks.tictactoe_bitboard
+"""
+import argparse
+import random
+import time
+
+from tictactoe_engine import Bitboard
+
+
+def list_check_winner(board):
+    """check_winner as it used to walk the nested list"""
+    for i in range(3):
+        if board[i][0] == board[i][1] == board[i][2] != '':
+            return board[i][0], [(i, 0), (i, 1), (i, 2)]
+    for j in range(3):
+        if board[0][j] == board[1][j] == board[2][j] != '':
+            return board[0][j], [(0, j), (1, j), (2, j)]
+    if board[0][0] == board[1][1] == board[2][2] != '':
+        return board[0][0], [(0, 0), (1, 1), (2, 2)]
+    if board[0][2] == board[1][1] == board[2][0] != '':
+        return board[0][2], [(0, 2), (1, 1), (2, 0)]
+    return None, []
+
+
+def list_is_board_full(board):
+    for row in board:
+        if '' in row:
+            return False
+    return True
+
+
+def list_available_moves(board):
+    moves = []
+    for i in range(3):
+        for j in range(3):
+            if board[i][j] == '':
+                moves.append((i, j))
+    return moves
+
+
+def random_positions(count: int, seed: int = 0):
+    """Positions from random play, stopped after a random number of moves"""
+    rng = random.Random(seed)
+    boards = []
+    for _ in range(count):
+        board = [['', '', ''], ['', '', ''], ['', '', '']]
+        cells = rng.sample(range(9), rng.randint(0, 9))
+        for turn, cell in enumerate(cells):
+            board[cell // 3][cell % 3] = 'XO'[turn % 2]
+        boards.append(board)
+    return boards
+
+
+def time_lists(boards) -> float:
+    start = time.perf_counter()
+    for board in boards:
+        if list_check_winner(board)[0] is None and not list_is_board_full(board):
+            list_available_moves(board)
+    return time.perf_counter() - start
+
+
+def time_bitboards(bitboards) -> float:
+    start = time.perf_counter()
+    for bitboard in bitboards:
+        if bitboard.winner()[0] is None and not bitboard.is_full():
+            bitboard.moves()
+    return time.perf_counter() - start
+
+
+def time_adapter(boards) -> float:
+    """Bitboards built from the Streamlit layer's nested lists on every call"""
+    start = time.perf_counter()
+    for board in boards:
+        bitboard = Bitboard.from_board(board)
+        if bitboard.winner()[0] is None and not bitboard.is_full():
+            bitboard.moves()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--positions", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    boards = random_positions(args.positions)
+    bitboards = [Bitboard.from_board(board) for board in boards]
+    lists = time_lists(boards)
+    print(f"{args.positions:,} positions (winner, full, moves)")
+    for label, seconds in (("nested lists", lists), ("bitboards", time_bitboards(bitboards)),
+                           ("list adapter", time_adapter(boards))):
+        print(f"{label:>14}  {seconds:6.2f} s  {seconds / args.positions * 1e9:6.0f} ns/position  "
+              f"{lists / seconds:4.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""MCTS playouts per second and strength against the random computer_move baseline.
+
+Run from the repository root:  python -m benchmarks.tictactoe_mcts
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from tictactoe_engine import line_through
+from tictactoe_mcts import MctsPlayer
+
+
+def play(size: int, k: int, player: MctsPlayer, mcts_mark: str, rng: random.Random) -> str:
+    """One game of MCTS against random moves; 'win', 'loss' or 'tie' for MCTS"""
+    board = [[''] * size for _ in range(size)]
+    turn = 'X'
+    while True:
+        free = [(i, j) for i in range(size) for j in range(size) if board[i][j] == '']
+        if not free:
+            return "tie"
+        row, col = player.choose(board) if turn == mcts_mark else rng.choice(free)
+        board[row][col] = turn
+        if line_through(board, row, col, k):
+            return "win" if turn == mcts_mark else "loss"
+        turn = 'O' if turn == 'X' else 'X'
+
+
+def playout_rate(size: int, k: int, budget: float, pool, workers: int, moves: int = 5) -> float:
+    """Playouts per second from the opening, counting every process"""
+    player = MctsPlayer(k, budget, pool=pool, workers=workers, seed=0)
+    board = [[''] * size for _ in range(size)]
+    board[size // 2][size // 2] = 'X'
+    total = 0
+    start = time.perf_counter()
+    for _ in range(moves):
+        player._root = None  # Same position each time: measure search, not reuse
+        player.choose(board)
+        total += player.last_playouts
+    return total / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--boards", nargs="+", default=["3:3", "7:4", "15:5"], help="size:k pairs")
+    parser.add_argument("--games", type=int, default=10, help="games per board, colors alternating")
+    parser.add_argument("--budget", type=float, default=0.2, help="search seconds per move")
+    parser.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1) - 1,
+                        help="extra search processes for root parallelism")
+    args = parser.parse_args()
+
+    pool = (ProcessPoolExecutor(args.workers, mp_context=multiprocessing.get_context("spawn"))
+            if args.workers > 0 else None)
+    print(f"budget {args.budget * 1e3:.0f} ms/move, {args.workers} extra worker processes")
+    print(f"{'board':>8}  {'playouts/s 1 proc':>17}  {'playouts/s pool':>15}  {'win':>4}  {'tie':>4}  {'loss':>4}")
+    for spec in args.boards:
+        size, k = map(int, spec.split(":"))
+        single = playout_rate(size, k, args.budget, None, 0)
+        pooled = playout_rate(size, k, args.budget, pool, args.workers) if pool else single
+        results = {"win": 0, "tie": 0, "loss": 0}
+        rng = random.Random(0)
+        for game in range(args.games):
+            player = MctsPlayer(k, args.budget, pool=pool, workers=args.workers, seed=game)
+            results[play(size, k, player, 'XO'[game % 2], rng)] += 1
+        print(f"{size}x{size} k{k:<2}  {single:>17,.0f}  {pooled:>15,.0f}  "
+              f"{results['win']:>4}  {results['tie']:>4}  {results['loss']:>4}")
+    if pool:
+        pool.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+"""Vectorized self-play throughput for every pair of Tic-Tac-Toe strategies.
+
+Run from the repository root:  python -m benchmarks.tictactoe_selfplay
+"""
+import argparse
+import time
+
+from tictactoe_selfplay import O_WINS, STRATEGIES, TIE, X_WINS, simulate, summarize
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--games", type=int, default=1_000_000)
+    parser.add_argument("--batch", type=int, default=250_000)
+    args = parser.parse_args()
+
+    simulate("perfect", "perfect", 1000)  # Load the solved table outside the timings
+    print(f"{args.games:,} games per matchup")
+    print(f"{'X':>8} {'O':>8}  {'games/s':>10}  {'X wins':>7}  {'O wins':>7}  {'ties':>7}")
+    for x_strategy in STRATEGIES:
+        for o_strategy in STRATEGIES:
+            start = time.perf_counter()
+            outcomes = summarize(*simulate(x_strategy, o_strategy, args.games, seed=0,
+                                           batch=args.batch))["outcomes"]
+            rate = args.games / (time.perf_counter() - start)
+            print(f"{x_strategy:>8} {o_strategy:>8}  {rate:>10,.0f}  {outcomes[X_WINS]:>7.2%}  "
+                  f"{outcomes[O_WINS]:>7.2%}  {outcomes[TIE]:>7.2%}")
+
+
+if __name__ == "__main__":
+    main()
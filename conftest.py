@@ -0,0 +1 @@
+# Lets tests/ import the app modules that live at the repository root
@@ -0,0 +1,90 @@
+import random
+from array import array
+from collections import deque
+from typing import List, Optional
+
+MOVES = ("rock", "paper", "scissors")  # Each move is beaten by the next one
+
+
+def counter(move: int) -> int:
+    """The move that beats `move`"""
+    return (move + 1) % 3
+
+
+class NgramPredictor:
+    """Online variable-order n-gram model of a player's throws.
+
+    Contexts are the last 0 to max_order rounds, each round being the pair
+    (player's throw, computer's throw). Counts of what the player threw
+    next live in a fixed-size hashed table, so memory stays bounded however
+    long the session runs; colliding contexts just share counts. Counts
+    fade by `decay` per round so the model follows a player who changes
+    style. The decay is applied lazily when a slot is touched, using the
+    round it was last updated, so an update touches max_order + 1 slots and
+    a prediction reads at most as many, whatever the history length.
+    Prediction backs off from the longest context to shorter ones until one
+    has at least `min_evidence` (decayed) observations.
+    """
+
+    def __init__(self, max_order: int = 4, slots: int = 1 << 12, decay: float = 0.98,
+                 min_evidence: float = 1.5, seed: Optional[int] = None):
+        if slots & (slots - 1):
+            raise ValueError("slots must be a power of two")
+        self.max_order = max_order
+        self.shift = 32 - (slots.bit_length() - 1)
+        self.decay = decay
+        self.min_evidence = min_evidence
+        self.rng = random.Random(seed)
+        self.counts = array('d', bytes(8 * 3 * slots))
+        self.stamps = array('q', bytes(8 * slots))
+        self.recent: deque = deque(maxlen=max_order)  # Latest rounds, newest last
+        self.rounds = 0
+        self.hits = 0  # Rounds where the player threw the model's top guess
+        self._context = self._slots()  # Slots for the current context, refreshed per round
+
+    def _slots(self) -> List[int]:
+        """Table slot of every context order, from 0 up to the history available"""
+        slots = []
+        key = 0
+        for order in range(len(self.recent) + 1):
+            if order:
+                key = key * 9 + self.recent[-order] + 1
+            # Fibonacci hashing: the top bits of a 32-bit multiplicative hash
+            slots.append(((key * 8 + order) * 0x9E3779B1 & 0xFFFFFFFF) >> self.shift)
+        return slots
+
+    def _weights(self, slot: int) -> List[float]:
+        fade = self.decay ** (self.rounds - self.stamps[slot])
+        base = slot * 3
+        return [self.counts[base] * fade, self.counts[base + 1] * fade, self.counts[base + 2] * fade]
+
+    def predict(self) -> List[float]:
+        """Probabilities of the player's next throw, indexed like MOVES"""
+        for slot in reversed(self._context):
+            weights = self._weights(slot)
+            total = weights[0] + weights[1] + weights[2]
+            if total >= self.min_evidence:
+                return [w / total for w in weights]
+        return [1 / 3, 1 / 3, 1 / 3]
+
+    def choose(self) -> int:
+        """The computer's throw: beat the most likely throw, ties broken at random"""
+        probabilities = self.predict()
+        best = max(probabilities)
+        likely = [move for move in range(3) if probabilities[move] == best]
+        return counter(self.rng.choice(likely))
+
+    def update(self, player: int, computer: int):
+        """Learn from one round"""
+        probabilities = self.predict()
+        self.hits += probabilities[player] == max(probabilities) and max(probabilities) > 1 / 3
+        for slot in self._context:
+            fade = self.decay ** (self.rounds - self.stamps[slot])
+            base = slot * 3
+            for move in range(3):
+                self.counts[base + move] *= fade
+            self.counts[base + player] += 1.0
+            self.stamps[slot] = self.rounds
+        self.recent.append(player * 3 + computer)
+        self.rounds += 1
+        self._context = self._slots()
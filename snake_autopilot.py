@@ -0,0 +1,240 @@
+import itertools
+import math
+import time
+from collections import deque
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from snake_engine import DIRECTIONS, Cell, SnakeGame
+
+
+@lru_cache(maxsize=8)
+def hamiltonian_cycle(width: int, height: int) -> Optional[Tuple[Cell, ...]]:
+    """A cycle visiting every cell once, or None when both sides are odd"""
+    cells: List[Cell] = []
+    if width % 2 == 0:
+        # Snake down/up the columns below row 0, return along row 0
+        for x in range(width):
+            ys = range(1, height) if x % 2 == 0 else range(height - 1, 0, -1)
+            cells.extend((x, y) for y in ys)
+        cells.extend((x, 0) for x in range(width - 1, -1, -1))
+    elif height % 2 == 0:
+        # Same thing transposed: snake along the rows right of column 0
+        for y in range(height):
+            xs = range(1, width) if y % 2 == 0 else range(width - 1, 0, -1)
+            cells.extend((x, y) for x in xs)
+        cells.extend((0, y) for y in range(height - 1, -1, -1))
+    else:
+        return None
+    return tuple(cells)
+
+
+def _moves(game: SnakeGame) -> List[Tuple[Cell, Cell]]:
+    """(direction, cell) pairs the snake can step onto this tick without dying"""
+    head_x, head_y = game.snake[0]
+    reverse = (-game.direction[0], -game.direction[1])
+    moves = []
+    for dx, dy in DIRECTIONS:
+        if (dx, dy) != reverse and game.is_free(head_x + dx, head_y + dy):
+            moves.append(((dx, dy), (head_x + dx, head_y + dy)))
+    return moves
+
+
+def _bfs(game: SnakeGame, start: Cell, targets: Dict[Cell, Cell],
+         deadline: float = math.inf) -> Optional[Dict[Cell, int]]:
+    """Distances from start to each target cell over free cells.
+
+    Stops as soon as every target is reached. Returns None if the deadline
+    passes first; unreachable targets are missing from the result.
+    """
+    found: Dict[Cell, int] = {}
+    seen = {start}
+    frontier = deque([(start, 0)])
+    expanded = 0
+    while frontier and len(found) < len(targets):
+        (x, y), dist = frontier.popleft()
+        if (x, y) in targets:
+            found[(x, y)] = dist
+        expanded += 1
+        if expanded % 64 == 0 and time.perf_counter() > deadline:
+            return None
+        for dx, dy in DIRECTIONS:
+            cell = (x + dx, y + dy)
+            if cell not in seen and (game.is_free(*cell) or cell in targets):
+                seen.add(cell)
+                frontier.append((cell, dist + 1))
+    return found
+
+
+def _deadline(budget: float) -> float:
+    """When a search must stop, keeping a slice of the budget for the work after it"""
+    return time.perf_counter() + budget * 0.9
+
+
+def _toward_food(game: SnakeGame, moves: List[Tuple[Cell, Cell]]) -> Cell:
+    """Direction of the move closest to the apple by Manhattan distance"""
+    if game.food is None:
+        return moves[0][0]
+    food_x, food_y = game.food
+    return min(moves, key=lambda m: abs(m[1][0] - food_x) + abs(m[1][1] - food_y))[0]
+
+
+class GreedyPolicy:
+    """Step toward the apple by Manhattan distance, avoiding instant death"""
+
+    name = "greedy"
+
+    def decide(self, game: SnakeGame) -> Cell:
+        moves = _moves(game)
+        if not moves:
+            return game.direction
+        return _toward_food(game, moves)
+
+
+class BfsPolicy:
+    """Shortest path to the apple; when it is walled off, head for open space.
+
+    Both searches stop at the per-decision budget, and the greedy step
+    toward the apple is taken instead.
+    """
+
+    name = "bfs"
+
+    def __init__(self, budget: float = 0.001):
+        self.budget = budget
+
+    def decide(self, game: SnakeGame) -> Cell:
+        deadline = _deadline(self.budget)
+        moves = _moves(game)
+        if not moves:
+            return game.direction
+        if game.food is not None:
+            # One BFS from the apple gives the path length through each neighbour
+            dist = _bfs(game, game.food, {cell: d for d, cell in moves}, deadline)
+            if dist is None:
+                return _toward_food(game, moves)
+            if dist:
+                return min((m for m in moves if m[1] in dist), key=lambda m: dist[m[1]])[0]
+        # Tail chasing fallback: the neighbour with the most room around it
+        rooms = []
+        for _, cell in moves:
+            room = self._room(game, cell, deadline)
+            if room is None:
+                return _toward_food(game, moves)
+            rooms.append(room)
+        return moves[rooms.index(max(rooms))][0]
+
+    @staticmethod
+    def _room(game: SnakeGame, start: Cell, deadline: float = math.inf) -> Optional[int]:
+        """Free cells reachable from start, or None if the deadline passes first"""
+        seen = {start}
+        frontier = [start]
+        expanded = 0
+        while frontier:
+            x, y = frontier.pop()
+            expanded += 1
+            if expanded % 64 == 0 and time.perf_counter() > deadline:
+                return None
+            for dx, dy in DIRECTIONS:
+                cell = (x + dx, y + dy)
+                if cell not in seen and game.is_free(*cell):
+                    seen.add(cell)
+                    frontier.append(cell)
+        return len(seen)
+
+
+class HamiltonianPolicy:
+    """BFS toward the apple, restricted to shortcuts along a Hamiltonian cycle.
+
+    The snake's body always lies on the stretch of the cycle between its
+    tail and its head. A move is only taken if it lands on the free stretch
+    ahead of the head and leaves enough of it to absorb every apple still
+    needed to win, so following the cycle is always a safe way out and the
+    snake never traps itself. Among safe moves that do not skip past the
+    apple, BFS distance to the apple picks the winner; if the BFS would run
+    past the per-decision budget, the furthest safe shortcut is used
+    instead. Boards with no Hamiltonian cycle (both sides odd) fall back to
+    BfsPolicy.
+
+    A body steered by hand is not in cycle order, so shortcuts are only
+    taken once it is: until then the snake walks the cycle, and uses
+    BfsPolicy when the next cycle cell is blocked.
+    """
+
+    name = "hamiltonian"
+
+    def __init__(self, budget: float = 0.001):
+        self.budget = budget
+        self._fallback = BfsPolicy(budget)
+        self._board: Optional[Tuple[int, int]] = None
+        self._cycle: Optional[Tuple[Cell, ...]] = None
+        self._index: Dict[Cell, int] = {}
+
+    def _load(self, game: SnakeGame):
+        self._board = (game.width, game.height)
+        self._cycle = hamiltonian_cycle(game.width, game.height)
+        self._index = {cell: i for i, cell in enumerate(self._cycle or ())}
+
+    def _in_cycle_order(self, snake) -> bool:
+        """Whether the body runs back along the cycle from the head, as shortcuts assume"""
+        index, size = self._index, len(self._cycle)
+        head = index[snake[0]]
+        last = 0
+        for cell in itertools.islice(snake, 1, None):
+            behind = (head - index[cell]) % size
+            if behind <= last:
+                return False
+            last = behind
+        return True
+
+    def decide(self, game: SnakeGame) -> Cell:
+        deadline = _deadline(self.budget)
+        if self._board != (game.width, game.height):
+            self._load(game)
+        if self._cycle is None:
+            return self._fallback.decide(game)
+
+        index, size = self._index, len(self._cycle)
+        snake = game.snake
+        head = index[snake[0]]
+        if not self._in_cycle_order(snake):
+            # Walking the cycle puts the body back in order within one body length
+            following = self._cycle[(head + 1) % size]
+            for direction, cell in _moves(game):
+                if cell == following:
+                    return direction
+            return self._fallback.decide(game)
+        tail_gap = (index[snake[-1]] - head) % size or size
+        win_length = math.ceil(game.width * game.height * 0.8)
+        food_gap = (index[game.food] - head) % size if game.food is not None else size
+
+        safe = []  # (cycle distance from head, direction, cell)
+        for direction, cell in _moves(game):
+            ahead = (index[cell] - head) % size
+            if len(snake) > 1 and ahead >= tail_gap:
+                continue  # Behind the head: would break the body ordering
+            eats = cell == game.food
+            new_tail = snake[-1] if eats else cell if len(snake) == 1 else snake[-2]
+            gap = (index[new_tail] - index[cell]) % size or size
+            still_needed = max(0, win_length - len(snake) - eats)
+            if gap >= still_needed + 2:
+                safe.append((ahead, direction, cell))
+        if not safe:
+            return game.direction  # Only reachable after the game is already won
+
+        toward = [m for m in safe if m[0] <= food_gap] or [min(safe)]
+        if len(toward) > 1:
+            dist = _bfs(game, game.food, {cell: direction for _, direction, cell in toward}, deadline)
+            if dist:
+                return min((m for m in toward if m[2] in dist), key=lambda m: (dist[m[2]], -m[0]))[1]
+        return max(toward)[1]
+
+
+POLICIES = {policy.name: policy for policy in (GreedyPolicy, BfsPolicy, HamiltonianPolicy)}
+
+
+def make_policy(name: str, budget: float = 0.001):
+    """A fresh policy by name; the search budget is ignored by greedy, which does not search"""
+    if name == GreedyPolicy.name:
+        return GreedyPolicy()
+    return POLICIES[name](budget)
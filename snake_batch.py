@@ -0,0 +1,122 @@
+import numpy as np
+from typing import Optional, Tuple
+
+from snake_engine import DIRECTIONS
+
+DX = np.array([d[0] for d in DIRECTIONS], dtype=np.int32)
+DY = np.array([d[1] for d in DIRECTIONS], dtype=np.int32)
+
+
+class SnakeBatch:
+    """N headless Snake games stepped together with NumPy.
+
+    Rules follow SnakeGame.move_snake / change_direction: a turn onto the
+    opposite direction is ignored, walls and the snake's own body (tail
+    included) end the game, an apple is worth 10 points and grows the snake
+    by one, and filling 80% of the board wins. Finished games stay frozen
+    until reset() is called for them.
+
+    Each snake body is a ring buffer of cell ids (head_ptr/tail_ptr index
+    into `body`) mirrored by a boolean occupancy grid, so a step is a fixed
+    handful of array operations regardless of snake length.
+    """
+
+    def __init__(self, n: int, width: int = 20, height: int = 15, seed: Optional[int] = None):
+        self.n = n
+        self.width = width
+        self.height = height
+        self.cells = width * height
+        self.win_length = width * height * 0.8
+        self.rng = np.random.default_rng(seed)
+
+        self.occupied = np.zeros((n, self.cells), dtype=bool)
+        self.body = np.zeros((n, self.cells), dtype=np.int32)
+        self.head_ptr = np.zeros(n, dtype=np.int32)
+        self.tail_ptr = np.zeros(n, dtype=np.int32)
+        self.length = np.zeros(n, dtype=np.int32)
+        self.head_x = np.zeros(n, dtype=np.int32)
+        self.head_y = np.zeros(n, dtype=np.int32)
+        self.direction = np.zeros(n, dtype=np.int8)
+        self.food = np.zeros(n, dtype=np.int32)
+        self.score = np.zeros(n, dtype=np.int32)
+        self.game_over = np.zeros(n, dtype=bool)
+        self.game_won = np.zeros(n, dtype=bool)
+        self._rows = np.arange(n)
+        self.reset()
+
+    @property
+    def done(self) -> np.ndarray:
+        return self.game_over | self.game_won
+
+    def reset(self, mask: Optional[np.ndarray] = None):
+        """Reset every game, or only the games selected by a boolean mask"""
+        idx = self._rows if mask is None else np.flatnonzero(mask)
+        if idx.size == 0:
+            return
+        x, y = self.width // 2, self.height // 2
+        start = y * self.width + x
+        self.occupied[idx] = False
+        self.occupied[idx, start] = True
+        self.body[idx, 0] = start
+        self.head_ptr[idx] = 0
+        self.tail_ptr[idx] = 0
+        self.length[idx] = 1
+        self.head_x[idx] = x
+        self.head_y[idx] = y
+        self.direction[idx] = 1  # Moving right initially
+        self.score[idx] = 0
+        self.game_over[idx] = False
+        self.game_won[idx] = False
+        self._place_food(idx)
+
+    def _place_food(self, idx: np.ndarray):
+        """Drop a uniformly random apple on a free cell of each selected game"""
+        noise = self.rng.random((idx.size, self.cells))
+        noise[self.occupied[idx]] = -1.0
+        self.food[idx] = noise.argmax(axis=1)
+
+    def step(self, actions: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Advance every game one tick.
+
+        `actions` holds a direction index per game (see DIRECTIONS) or -1
+        to keep going straight. Returns (rewards, done, scores) where the
+        reward is the score gained on this tick.
+        """
+        actions = np.asarray(actions)
+        active = ~self.done
+
+        # change_direction: ignore 180-degree turns
+        turn = active & (actions >= 0) & (actions != (self.direction + 2) % 4)
+        self.direction[turn] = actions[turn]
+
+        new_x = self.head_x + DX[self.direction]
+        new_y = self.head_y + DY[self.direction]
+        hit_wall = (new_x < 0) | (new_x >= self.width) | (new_y < 0) | (new_y >= self.height)
+        cell = np.where(hit_wall, 0, new_y * self.width + new_x)
+        crashed = active & (hit_wall | self.occupied[self._rows, cell])
+        self.game_over |= crashed
+
+        moving = np.flatnonzero(active & ~crashed)
+        move_cell = cell[moving]
+        self.head_x[moving] = new_x[moving]
+        self.head_y[moving] = new_y[moving]
+        self.head_ptr[moving] = (self.head_ptr[moving] + 1) % self.cells
+        self.body[moving, self.head_ptr[moving]] = move_cell
+        self.occupied[moving, move_cell] = True
+
+        ate = move_cell == self.food[moving]
+        grew = moving[ate]
+        shrink = moving[~ate]
+        tail = self.body[shrink, self.tail_ptr[shrink]]
+        self.occupied[shrink, tail] = False
+        self.tail_ptr[shrink] = (self.tail_ptr[shrink] + 1) % self.cells
+
+        rewards = np.zeros(self.n, dtype=np.float32)
+        if grew.size:
+            self.length[grew] += 1
+            self.score[grew] += 10
+            rewards[grew] = 10.0
+            self._place_food(grew)
+            self.game_won[grew] |= self.length[grew] >= self.win_length
+
+        return rewards, self.done, self.score.copy()
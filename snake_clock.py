@@ -0,0 +1,87 @@
+import time
+from collections import deque
+from typing import Callable, Deque, Optional
+
+
+class TickClock:
+    """Fixed-cadence game clock that never sleeps.
+
+    Tick k is scheduled at origin + k * period on a monotonic clock and is
+    handed out by any poll within half a period of that time. Callers poll
+    due() whenever they happen to run (a timed fragment rerun, a button
+    press) and advance the game by the number of ticks returned, so late or
+    early polls do not accumulate drift. Falling far behind drops ticks
+    beyond max_catch_up instead of fast-forwarding the snake across the
+    board in one frame.
+    """
+
+    def __init__(self, period: float, max_catch_up: int = 3,
+                 clock: Callable[[], float] = time.perf_counter, window: float = 2.0):
+        self.period = period
+        self.max_catch_up = max_catch_up
+        self.clock = clock
+        self.window = window
+        self.origin: Optional[float] = None
+        self.issued = 0
+        self.dropped = 0
+        self._recent: Deque[float] = deque()
+
+    @property
+    def running(self) -> bool:
+        return self.origin is not None
+
+    @property
+    def target_rate(self) -> float:
+        return 1.0 / self.period
+
+    def start(self):
+        """Start ticking from now; the first tick is due half a period later"""
+        self.origin = self.clock()
+        self.issued = 0
+        self.dropped = 0
+        self._recent.clear()
+
+    def stop(self):
+        """Stop ticking until start() is called again"""
+        self.origin = None
+
+    def set_period(self, period: float):
+        """Change the cadence, keeping the current tick as the new origin"""
+        if period == self.period:
+            return
+        if self.running:
+            self.origin += self.issued * (self.period - period)
+        self.period = period
+
+    def due(self) -> int:
+        """Number of ticks to run now"""
+        if not self.running:
+            return 0
+        now = self.clock()
+        # Round rather than floor so a poll that is a little early or late
+        # still yields exactly one tick instead of alternating 0 and 2
+        target = int((now - self.origin) / self.period + 0.5)
+        count = target - self.issued
+        if count > self.max_catch_up:
+            self.dropped += count - self.max_catch_up
+            count = self.max_catch_up
+            self.issued = target - count
+        if count <= 0:
+            return 0
+        self.issued += count
+        self._recent.extend([now] * count)
+        self._prune(now)
+        return count
+
+    def _prune(self, now: float):
+        while self._recent and self._recent[0] < now - self.window:
+            self._recent.popleft()
+
+    def achieved_rate(self) -> float:
+        """Ticks per second actually delivered over the recent window"""
+        if not self.running:
+            return 0.0
+        now = self.clock()
+        self._prune(now)
+        span = min(self.window, now - self.origin)
+        return len(self._recent) / span if span > 0 else 0.0
@@ -0,0 +1,189 @@
+import random
+from collections import deque
+from typing import Deque, Iterable, List, Optional, Set, Tuple
+
+Cell = Tuple[int, int]
+
+# Action index -> (dx, dy). Opposite directions are two apart: (a + 2) % 4
+DIRECTIONS: Tuple[Cell, ...] = ((0, -1), (1, 0), (0, 1), (-1, 0))  # up, right, down, left
+
+# Turns buffered between ticks; further presses are dropped until a move
+MAX_QUEUED_TURNS = 3
+
+# Board display cells
+EMPTY, FOOD, HEAD, BODY = '⬜', '🍎', '🟢', '🟩'
+
+# The same cells as small integers, for array observations and canvas frames
+KIND_EMPTY, KIND_BODY, KIND_HEAD, KIND_FOOD = 0, 1, 2, 3
+CELL_KINDS = {EMPTY: KIND_EMPTY, BODY: KIND_BODY, HEAD: KIND_HEAD, FOOD: KIND_FOOD}
+
+
+class SnakeGame:
+    def __init__(self, width: int = 20, height: int = 15, seed: Optional[int] = None):
+        self.width = width
+        self.height = height
+        # Every game gets a seed so it can be replayed from its inputs alone
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.rng = random.Random(self.seed)
+        self.reset_game()
+
+    def reset_game(self):
+        """Reset the game to initial state"""
+        self.place_snake([(self.width // 2, self.height // 2)], (1, 0))  # Moving right initially
+        self.score = 0
+        self.game_over = False
+        self.game_won = False
+
+    def place_snake(self, body: Iterable[Cell], direction: Cell):
+        """Put the snake on the board, head first, and drop a fresh apple"""
+        # The body is a deque (O(1) push at the head, pop at the tail). Free
+        # cells live in a swap-remove array: _free holds the ids of cells not
+        # covered by the snake and _free_pos maps a cell id to its slot in
+        # _free, or -1 when the snake is on it. That doubles as the occupancy
+        # test and lets generate_food pick a free cell in O(1).
+        self.snake: Deque[Cell] = deque(body)
+        self._free: List[int] = list(range(self.width * self.height))
+        self._free_pos: List[int] = list(range(self.width * self.height))
+        for x, y in self.snake:
+            self._take(y * self.width + x)
+        self.direction = direction
+        self._turns: Deque[Cell] = deque()  # Pending turns, one applied per move
+        self.food = self.generate_food()
+
+        # Persistent display buffer, patched cell by cell from move_snake.
+        # Everything is dirty after a placement.
+        self._display = [[EMPTY] * self.width for _ in range(self.height)]
+        if self.food is not None:
+            self._display[self.food[1]][self.food[0]] = FOOD
+        for i, (x, y) in enumerate(self.snake):
+            self._display[y][x] = HEAD if i == 0 else BODY
+        self._dirty: Set[Cell] = {(x, y) for x in range(self.width) for y in range(self.height)}
+
+    def _paint(self, cell: Cell, value: str):
+        """Update one display cell and remember that it changed"""
+        self._display[cell[1]][cell[0]] = value
+        self._dirty.add(cell)
+
+    def _take(self, cell: int):
+        """Mark a cell id as covered by the snake"""
+        slot = self._free_pos[cell]
+        last = self._free.pop()
+        if last != cell:
+            self._free[slot] = last
+            self._free_pos[last] = slot
+        self._free_pos[cell] = -1
+
+    def _release(self, cell: int):
+        """Mark a cell id as free again"""
+        self._free_pos[cell] = len(self._free)
+        self._free.append(cell)
+
+    def is_free(self, x: int, y: int) -> bool:
+        """Whether a cell is on the board and not covered by the snake"""
+        return 0 <= x < self.width and 0 <= y < self.height and self._free_pos[y * self.width + x] >= 0
+
+    def generate_food(self) -> Optional[Tuple[int, int]]:
+        """Generate food at a random position not occupied by snake"""
+        if not self._free:
+            return None  # Board is completely full
+        cell = self._free[self.rng.randrange(len(self._free))]
+        return (cell % self.width, cell // self.width)
+
+    def move_snake(self):
+        """Apply the next queued turn, then move the snake in the current direction"""
+        if self.game_over:
+            return
+
+        if self._turns:
+            self.direction = self._turns.popleft()
+
+        head_x, head_y = self.snake[0]
+        dx, dy = self.direction
+        new_head = (head_x + dx, head_y + dy)
+
+        # Check wall collision
+        if (new_head[0] < 0 or new_head[0] >= self.width or
+            new_head[1] < 0 or new_head[1] >= self.height):
+            self.game_over = True
+            return
+
+        # Check self collision (the tail still counts, it has not moved yet)
+        head_cell = new_head[1] * self.width + new_head[0]
+        if self._free_pos[head_cell] < 0:
+            self.game_over = True
+            return
+
+        self._paint(self.snake[0], BODY)
+        self.snake.appendleft(new_head)
+        self._take(head_cell)
+        self._paint(new_head, HEAD)
+
+        # Check if food eaten
+        if new_head == self.food:
+            self.score += 10
+            self.food = self.generate_food()
+            if self.food is not None:
+                self._paint(self.food, FOOD)
+
+            # Check win condition (snake fills most of the board)
+            if len(self.snake) >= (self.width * self.height * 0.8):
+                self.game_won = True
+        else:
+            tail_x, tail_y = self.snake.pop()  # Remove tail if no food eaten
+            self._release(tail_y * self.width + tail_x)
+            self._paint((tail_x, tail_y), EMPTY)
+
+    def change_direction(self, new_direction: Tuple[int, int]):
+        """Queue a turn for the next move, preventing 180-degree turns"""
+        # Validate against the last queued turn, not the current direction,
+        # so a quick double press cannot fold the snake back onto itself
+        current_dx, current_dy = self._turns[-1] if self._turns else self.direction
+        new_dx, new_dy = new_direction
+
+        # Prevent 180-degree turns (and drop repeats of the same direction)
+        if (current_dx, current_dy) in ((-new_dx, -new_dy), (new_dx, new_dy)):
+            return
+        if len(self._turns) < MAX_QUEUED_TURNS:
+            self._turns.append(new_direction)
+
+    def clear_turns(self):
+        """Drop any queued turns, e.g. when the autopilot takes over"""
+        self._turns.clear()
+
+    def snapshot(self) -> tuple:
+        """Everything later moves depend on, for restore()"""
+        return (tuple(self.snake), self.direction, tuple(self._turns), self.food, self.score,
+                self.game_over, self.game_won, tuple(self._free), tuple(self._free_pos), self.rng.getstate())
+
+    def restore(self, snapshot: tuple):
+        """Put this game back to an earlier snapshot() of it, in place.
+
+        The free-cell arrays are copied back whole, since their order picks
+        the next apple, but only the cells under the old and new snake and
+        apple are repainted, so the display change log stays a small diff.
+        """
+        body, self.direction, turns, food, self.score, self.game_over, self.game_won, free, free_pos, rng = snapshot
+        for cell in self.snake:
+            self._paint(cell, EMPTY)
+        if self.food is not None:
+            self._paint(self.food, EMPTY)
+        self.snake = deque(body)
+        self._turns = deque(turns)
+        self._free[:] = free
+        self._free_pos[:] = free_pos
+        self.rng.setstate(rng)
+        self.food = food
+        if food is not None:
+            self._paint(food, FOOD)
+        for i, cell in enumerate(self.snake):
+            self._paint(cell, HEAD if i == 0 else BODY)
+
+    def get_board_display(self) -> List[List[str]]:
+        """Get the current board state for display (a live view, do not modify)"""
+        return self._display
+
+    def take_changes(self) -> List[Cell]:
+        """Cells whose display changed since the last call"""
+        changes = list(self._dirty)
+        self._dirty.clear()
+        return changes
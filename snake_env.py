@@ -0,0 +1,136 @@
+import numpy as np
+from typing import Optional, Tuple
+
+from snake_batch import DX, DY, SnakeBatch
+from snake_engine import CELL_KINDS, DIRECTIONS, KIND_EMPTY, KIND_FOOD, KIND_HEAD, SnakeGame
+
+# Feature observation: danger straight/right/left, heading one-hot, apple
+# left/right/up/down of the head
+FEATURES = 11
+
+
+def _features(width: int, height: int, head_x, head_y, direction, food_x, food_y, occupied) -> np.ndarray:
+    """Feature vectors for a batch of games (one array entry per game)"""
+    columns = []
+    for turn in (0, 1, 3):  # straight, right, left
+        heading = (direction + turn) % 4
+        x, y = head_x + DX[heading], head_y + DY[heading]
+        outside = (x < 0) | (x >= width) | (y < 0) | (y >= height)
+        columns.append(outside | occupied(np.clip(x, 0, width - 1), np.clip(y, 0, height - 1)))
+    columns.extend(direction == d for d in range(4))
+    columns.extend((food_x < head_x, food_x > head_x, food_y < head_y, food_y > head_y))
+    return np.stack(columns, axis=-1).astype(np.uint8)
+
+
+class SnakeEnv:
+    """Gym-style single game: reset(seed) -> (obs, info), step(action) ->
+    (obs, reward, terminated, truncated, info).
+
+    Actions are DIRECTIONS indexes (-1 keeps going straight) and go through
+    change_direction, so the rules are exactly SnakeGame's. The reward is the
+    score gained on the step. Observations are either a (height, width)
+    uint8 grid, kept up to date from the game's changed cells rather than
+    rebuilt, or an 11-value uint8 feature vector.
+    """
+
+    def __init__(self, width: int = 20, height: int = 15, observation: str = "grid",
+                 max_steps: Optional[int] = None):
+        if observation not in ("grid", "features"):
+            raise ValueError(f"Unknown observation type: {observation}")
+        self.width = width
+        self.height = height
+        self.observation = observation
+        self.max_steps = max_steps
+        self.game: Optional[SnakeGame] = None
+        self.steps = 0
+        self._grid = np.zeros((height, width), dtype=np.uint8)
+
+    def reset(self, seed: Optional[int] = None) -> Tuple[np.ndarray, dict]:
+        self.game = SnakeGame(self.width, self.height, seed=seed)
+        self.steps = 0
+        self._grid[:] = KIND_EMPTY
+        return self._observe(), {"score": 0}
+
+    def step(self, action: int) -> Tuple[np.ndarray, float, bool, bool, dict]:
+        game = self.game
+        score = game.score
+        if action >= 0:
+            game.change_direction(DIRECTIONS[action])
+        game.move_snake()
+        self.steps += 1
+        terminated = game.game_over or game.game_won
+        truncated = not terminated and self.max_steps is not None and self.steps >= self.max_steps
+        return self._observe(), float(game.score - score), terminated, truncated, {"score": game.score}
+
+    def _observe(self) -> np.ndarray:
+        game = self.game
+        board = game.get_board_display()
+        changes = game.take_changes()
+        if self.observation == "grid":
+            for x, y in changes:
+                self._grid[y, x] = CELL_KINDS[board[y][x]]
+            return self._grid.copy()
+        # Plain Python here: NumPy call overhead dominates for a single game
+        head_x, head_y = game.snake[0]
+        food_x, food_y = game.food if game.food is not None else (head_x, head_y)
+        heading = DIRECTIONS.index(game.direction)
+        values = []
+        for turn in (0, 1, 3):  # straight, right, left
+            dx, dy = DIRECTIONS[(heading + turn) % 4]
+            values.append(not game.is_free(head_x + dx, head_y + dy))
+        values.extend(heading == d for d in range(4))
+        values.extend((food_x < head_x, food_x > head_x, food_y < head_y, food_y > head_y))
+        return np.array(values, dtype=np.uint8)
+
+
+class SnakeVectorEnv:
+    """Many SnakeEnv-equivalent games stepped in lockstep on SnakeBatch.
+
+    step(actions) takes one action per game and returns batched
+    (obs, rewards, terminated, truncated, info). Finished games are reset
+    automatically; their final scores are reported in info["final_score"]
+    (-1 for games that did not finish on this step).
+    """
+
+    def __init__(self, n: int, width: int = 20, height: int = 15, observation: str = "grid",
+                 max_steps: Optional[int] = None):
+        if observation not in ("grid", "features"):
+            raise ValueError(f"Unknown observation type: {observation}")
+        self.n = n
+        self.width = width
+        self.height = height
+        self.observation = observation
+        self.max_steps = max_steps
+        self.batch = SnakeBatch(n, width, height)
+        self.steps = np.zeros(n, dtype=np.int64)
+
+    def reset(self, seed: Optional[int] = None) -> Tuple[np.ndarray, dict]:
+        self.batch.rng = np.random.default_rng(seed)
+        self.batch.reset()
+        self.steps[:] = 0
+        return self._observe(), {"score": self.batch.score.copy()}
+
+    def step(self, actions: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, dict]:
+        rewards, done, scores = self.batch.step(actions)
+        self.steps += 1
+        terminated = done.copy()
+        truncated = ~terminated & (self.steps >= self.max_steps) if self.max_steps else np.zeros_like(done)
+        finished = terminated | truncated
+        final_score = np.where(finished, scores, -1)
+        if finished.any():
+            self.batch.reset(finished)
+            self.steps[finished] = 0
+        return (self._observe(), rewards, terminated, truncated,
+                {"score": self.batch.score.copy(), "final_score": final_score})
+
+    def _observe(self) -> np.ndarray:
+        batch = self.batch
+        rows = np.arange(self.n)
+        if self.observation == "grid":
+            grid = batch.occupied.astype(np.uint8)  # KIND_BODY == 1
+            grid[rows, batch.head_y * self.width + batch.head_x] = KIND_HEAD
+            grid[rows, batch.food] = KIND_FOOD
+            return grid.reshape(self.n, self.height, self.width)
+        return _features(self.width, self.height, batch.head_x, batch.head_y, batch.direction.astype(np.int64),
+                         batch.food % self.width, batch.food // self.width,
+                         lambda x, y: batch.occupied[rows, y * self.width + x])
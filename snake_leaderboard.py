@@ -0,0 +1,100 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Iterable, List, Optional, Tuple
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "snake_leaderboard.db")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    player TEXT NOT NULL,
+    width INTEGER NOT NULL,
+    height INTEGER NOT NULL,
+    score INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    seed INTEGER NOT NULL,
+    replay TEXT,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS games_board_score ON games (width, height, score DESC, id);
+
+-- Number of games per (board, score). Scores are multiples of 10 capped by
+-- the board size, so ranking sums a handful of rows however many games exist.
+CREATE TABLE IF NOT EXISTS score_counts (
+    width INTEGER NOT NULL,
+    height INTEGER NOT NULL,
+    score INTEGER NOT NULL,
+    games INTEGER NOT NULL,
+    PRIMARY KEY (width, height, score)
+) WITHOUT ROWID;
+"""
+
+
+class Leaderboard:
+    """Snake high scores in a local SQLite file.
+
+    The database runs in WAL mode, so any number of processes can read while
+    one writes, and each insert is a single short transaction. Top-N reads
+    walk the (width, height, score) index. Ranks come from the per-score
+    counts table, which is kept in step with every insert.
+
+    One connection serves every thread (Streamlit runs each rerun on a new
+    one), with a lock around each use.
+    """
+
+    def __init__(self, path: str = DEFAULT_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=10, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def add_games(self, games: Iterable[Tuple[str, int, int, int, int, int, Optional[str]]]):
+        """Insert (player, width, height, score, length, seed, replay) rows in one transaction"""
+        now = time.time()
+        rows = [(*game, now) for game in games]
+        with self._lock, self._conn as conn:
+            conn.executemany(
+                "INSERT INTO games (player, width, height, score, length, seed, replay, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            conn.executemany(
+                "INSERT INTO score_counts (width, height, score, games) VALUES (?, ?, ?, 1) "
+                "ON CONFLICT (width, height, score) DO UPDATE SET games = games + 1",
+                [(row[1], row[2], row[3]) for row in rows])
+
+    def add_game(self, player: str, width: int, height: int, score: int, length: int,
+                 seed: int, replay: Optional[str] = None):
+        """Record one finished game"""
+        self.add_games([(player, width, height, score, length, seed, replay)])
+
+    def top(self, width: int, height: int, limit: int = 10) -> List[sqlite3.Row]:
+        """Best games on a board size, highest score first (earliest wins ties)"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT id, player, score, length, seed, replay, created_at FROM games "
+                "WHERE width = ? AND height = ? ORDER BY score DESC, id LIMIT ?",
+                (width, height, limit)).fetchall()
+
+    def rank(self, width: int, height: int, score: int) -> int:
+        """1-based rank a score would have on a board size"""
+        with self._lock:
+            better = self._conn.execute(
+                "SELECT COALESCE(SUM(games), 0) FROM score_counts "
+                "WHERE width = ? AND height = ? AND score > ?", (width, height, score)).fetchone()[0]
+        return better + 1
+
+    def count(self, width: int, height: int) -> int:
+        """Games recorded on a board size"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COALESCE(SUM(games), 0) FROM score_counts WHERE width = ? AND height = ?",
+                (width, height)).fetchone()[0]
@@ -0,0 +1,83 @@
+import os
+from typing import List
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+from snake_engine import CELL_KINDS, DIRECTIONS, EMPTY, SnakeGame
+
+_COMPONENTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "components")
+_snake_board = components.declare_component("snake_board", path=os.path.join(_COMPONENTS, "snake_board"))
+_snake_keys = components.declare_component("snake_keys", path=os.path.join(_COMPONENTS, "snake_keys"))
+
+
+class BoardEncoder:
+    """Turns successive SnakeGame states into compact canvas frames.
+
+    A frame is {"seq", "w", "h", "full", "cells"} where cells is a flat
+    [cell_id, kind, cell_id, kind, ...] list, kinds being the CELL_KINDS
+    values components/snake_board/index.html draws. Full frames list every
+    non-empty cell; the others only list the cells the game reports as
+    changed since the previous frame, usually the new head, the old head,
+    the old tail and the apple.
+    """
+
+    def __init__(self):
+        self.seq = -1
+        self.last_resync = None
+        self._game = None
+
+    def frame(self, game: SnakeGame, full: bool = False) -> dict:
+        """Encode the game as a diff against the previous frame (or in full)"""
+        # A different game object has its own change log: start over
+        full = full or self.seq < 0 or game is not self._game
+        changes = game.take_changes()
+        board = game.get_board_display()
+        width = game.width
+
+        flat: List[int] = []
+        if full:
+            for y, row in enumerate(board):
+                for x, value in enumerate(row):
+                    if value != EMPTY:
+                        flat += (y * width + x, CELL_KINDS[value])
+        else:
+            for x, y in changes:
+                flat += (y * width + x, CELL_KINDS[board[y][x]])
+
+        self.seq += 1
+        self._game = game
+        return {"seq": self.seq, "w": width, "h": game.height, "full": full, "cells": flat}
+
+
+def render_board(game: SnakeGame, key: str = "snake_board"):
+    """Draw the board with the canvas component, sending only changed cells"""
+    encoder_key = f"{key}_encoder"
+    if encoder_key not in st.session_state:
+        st.session_state[encoder_key] = BoardEncoder()
+    encoder = st.session_state[encoder_key]
+
+    # The component asks for a full frame when it missed a diff
+    reply = st.session_state.get(key) or {}
+    resync = reply.get("resync")
+    full = resync is not None and resync != encoder.last_resync
+    encoder.last_resync = resync
+
+    _snake_board(frame=encoder.frame(game, full=full), key=key, default=None)
+
+
+def read_keys(game: SnakeGame, key: str = "snake_keys", enabled: bool = True):
+    """Queue the arrow/WASD presses captured by the keyboard component.
+
+    The component resends its last few presses with increasing ids every
+    time, so presses are still seen when several land between reruns.
+    """
+    last_key = f"{key}_last"
+    last = st.session_state.get(last_key, 0)
+    value = _snake_keys(key=key, default=None) or {}
+    for press_id, direction in value.get("presses", []):
+        if press_id > last:
+            last = press_id
+            if enabled:
+                game.change_direction(DIRECTIONS[direction])
+    st.session_state[last_key] = last
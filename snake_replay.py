@@ -0,0 +1,176 @@
+import base64
+import bisect
+import zlib
+from typing import List, Optional, Tuple
+
+from snake_engine import DIRECTIONS, SnakeGame
+
+_MAGIC = b"SNK1"
+
+# Limits on what a pasted replay may ask us to build: the largest board any
+# of the front ends plays on, and a cap on board cells times ticks, which
+# bounds both the replay time and the keyframe memory
+MAX_SIDE = 100
+MAX_TICKS = 1 << 18
+MAX_WORK = 1 << 26
+
+
+def _write_varint(out: bytearray, value: int):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    value = shift = 0
+    while True:
+        if pos >= len(data) or shift > 63:
+            raise ValueError("Corrupt Snake replay")
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+class Replay:
+    """Everything needed to rebuild a game: board size, seed and the turns.
+
+    Events are (tick, direction index) pairs, one per tick on which the
+    direction actually changed. On the wire each event is a varint of
+    (ticks since the previous event << 2 | direction), so the long straight
+    runs between turns cost nothing, and the whole stream is deflated.
+    """
+
+    def __init__(self, width: int, height: int, seed: int, ticks: int = 0,
+                 events: Optional[List[Tuple[int, int]]] = None):
+        self.width = width
+        self.height = height
+        self.seed = seed
+        self.ticks = ticks
+        self.events = events if events is not None else []
+
+    def to_bytes(self) -> bytes:
+        out = bytearray()
+        for value in (self.width, self.height, self.seed, self.ticks, len(self.events)):
+            _write_varint(out, value)
+        previous = 0
+        for tick, direction in self.events:
+            _write_varint(out, (tick - previous) << 2 | direction)
+            previous = tick
+        return _MAGIC + zlib.compress(bytes(out), 9)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Replay":
+        if not data.startswith(_MAGIC):
+            raise ValueError("Not a Snake replay")
+        inflater = zlib.decompressobj()
+        try:
+            # Header varints plus at most 4 bytes per event; stop inflating past that
+            body = inflater.decompress(data[len(_MAGIC):], 64 + 4 * MAX_TICKS)
+        except zlib.error as exc:
+            raise ValueError("Corrupt Snake replay") from exc
+        if inflater.unconsumed_tail:
+            raise ValueError("Corrupt Snake replay")
+        header = []
+        pos = 0
+        for _ in range(5):
+            value, pos = _read_varint(body, pos)
+            header.append(value)
+        width, height, seed, ticks, count = header
+        # Every event takes at least one byte, and at most one lands on each tick
+        if (not 0 < width <= MAX_SIDE or not 0 < height <= MAX_SIDE or ticks > MAX_TICKS
+                or width * height * ticks > MAX_WORK or count > ticks or count > len(body) - pos):
+            raise ValueError("Corrupt Snake replay")
+        events = []
+        tick = 0
+        for i in range(count):
+            value, pos = _read_varint(body, pos)
+            if i and not value >> 2:
+                raise ValueError("Corrupt Snake replay")
+            tick += value >> 2
+            events.append((tick, value & 3))
+        if events and tick >= ticks:
+            raise ValueError("Corrupt Snake replay")
+        return cls(width, height, seed, ticks, events)
+
+    def to_string(self) -> str:
+        """Shareable text form of the replay"""
+        return base64.urlsafe_b64encode(self.to_bytes()).decode("ascii")
+
+    @classmethod
+    def from_string(cls, text: str) -> "Replay":
+        try:
+            data = base64.urlsafe_b64decode(text.strip().encode("ascii"))
+        except (ValueError, UnicodeEncodeError) as exc:
+            raise ValueError("Not a Snake replay") from exc
+        return cls.from_bytes(data)
+
+
+class ReplayRecorder:
+    """Builds a Replay by watching the direction each move was made in"""
+
+    def __init__(self, game: SnakeGame):
+        self.replay = Replay(game.width, game.height, game.seed)
+        self._direction = game.direction
+
+    def record_tick(self, game: SnakeGame):
+        """Call right after game.move_snake()"""
+        if game.direction != self._direction:
+            self._direction = game.direction
+            self.replay.events.append((self.replay.ticks, DIRECTIONS.index(game.direction)))
+        self.replay.ticks += 1
+
+
+class ReplayPlayer:
+    """Rebuilds the game at any tick by fast-forwarding one headless engine.
+
+    A keyframe (an engine snapshot) is kept every `interval` ticks as the
+    replay is played forward. Seeking forward keeps playing from where the
+    engine is; seeking back, or past a later keyframe, restores the nearest
+    earlier keyframe into the same engine first, so a seek costs at most
+    `interval` moves and never copies a whole engine.
+
+    The whole replay is played once up front, and playing stops when the
+    game ends, so `ticks` is the replay's length cut at the final move.
+    """
+
+    def __init__(self, replay: Replay, interval: int = 500):
+        self.replay = replay
+        self.interval = interval
+        self._game = SnakeGame(replay.width, replay.height, seed=replay.seed)
+        self._tick = 0
+        self._keyframes: List[tuple] = [self._game.snapshot()]  # _keyframes[k] is tick k * interval
+        self._event_ticks = [tick for tick, _ in replay.events]
+        self.ticks = self._tick = self._advance(0, replay.ticks)
+
+    def _advance(self, start: int, stop: int) -> int:
+        """Play ticks start..stop-1, keeping a keyframe at every new interval boundary.
+
+        Returns the tick reached, which is short of stop if the game ended.
+        """
+        game, events, interval = self._game, self.replay.events, self.interval
+        i = bisect.bisect_left(self._event_ticks, start)
+        for tick in range(start, stop):
+            if game.game_over or game.game_won:
+                return tick
+            if i < len(events) and events[i][0] == tick:
+                game.direction = DIRECTIONS[events[i][1]]
+                i += 1
+            game.move_snake()
+            if (tick + 1) % interval == 0 and (tick + 1) // interval == len(self._keyframes):
+                self._keyframes.append(game.snapshot())
+        return stop
+
+    def state_at(self, tick: int) -> SnakeGame:
+        """The game as it was after `tick` moves: the player's own engine, read it only"""
+        tick = max(0, min(tick, self.ticks))
+        nearest = min(tick // self.interval, len(self._keyframes) - 1) * self.interval
+        if not nearest <= self._tick <= tick:
+            self._game.restore(self._keyframes[nearest // self.interval])
+            self._tick = nearest
+        self._advance(self._tick, tick)
+        self._tick = tick
+        return self._game
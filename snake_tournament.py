@@ -0,0 +1,159 @@
+"""Self-play tournament for the Snake autopilot policies.
+
+Plays every policy on the same seeded games across a process pool and
+streams one CSV row per game, so an interrupted run picks up where it
+stopped when started again with the same output file:
+
+    python snake_tournament.py --policies greedy bfs hamiltonian --seeds 2000 --out results.csv
+"""
+import argparse
+import csv
+import os
+import statistics
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Iterator, List, Set, Tuple
+
+from snake_autopilot import POLICIES, make_policy
+from snake_engine import SnakeGame
+
+FIELDS = ["policy", "seed", "width", "height", "score", "length", "ticks", "won", "crashed"]
+
+
+def play_chunk(policy_name: str, seeds: List[int], width: int, height: int,
+               max_ticks: int, budget: float) -> List[dict]:
+    """Play one game per seed with a fresh policy; runs inside a worker process"""
+    rows = []
+    for seed in seeds:
+        policy = make_policy(policy_name, budget)
+        game = SnakeGame(width, height, seed=seed)
+        ticks = 0
+        while ticks < max_ticks and not game.game_over and not game.game_won:
+            game.change_direction(policy.decide(game))
+            game.move_snake()
+            ticks += 1
+        rows.append({"policy": policy_name, "seed": seed, "width": width, "height": height,
+                     "score": game.score, "length": len(game.snake), "ticks": ticks,
+                     "won": int(game.game_won), "crashed": int(game.game_over)})
+    return rows
+
+
+def read_results(path: str) -> List[dict]:
+    """Rows already in the output file; a row cut off by an interruption is skipped"""
+    if not os.path.exists(path):
+        return []
+    rows = []
+    with open(path, newline="") as f:
+        for row in csv.DictReader(f):
+            try:
+                rows.append({k: row[k] if k == "policy" else int(row[k]) for k in FIELDS})
+            except (KeyError, TypeError, ValueError):
+                continue
+    return rows
+
+
+def pending_chunks(policies: List[str], seeds: range, done: Set[Tuple[str, int]],
+                   chunk_size: int) -> Iterator[Tuple[str, List[int]]]:
+    for name in policies:
+        todo = [seed for seed in seeds if (name, seed) not in done]
+        for i in range(0, len(todo), chunk_size):
+            yield name, todo[i:i + chunk_size]
+
+
+def summarize(rows: List[dict], policies: List[str]):
+    """Print score distribution, win rate and game length per policy"""
+    print(f"\n{'policy':>12}  {'games':>6}  {'mean':>7}  {'p10':>6}  {'median':>6}  "
+          f"{'p90':>6}  {'max':>6}  {'win rate':>8}  {'crash':>6}  {'ticks':>8}")
+    for name in policies:
+        mine = [r for r in rows if r["policy"] == name]
+        if not mine:
+            continue
+        scores = sorted(r["score"] for r in mine)
+        deciles = statistics.quantiles(scores, n=10, method="inclusive") if len(scores) > 1 else scores * 9
+        print(f"{name:>12}  {len(mine):>6}  {statistics.fmean(scores):>7.1f}  {deciles[0]:>6.0f}  "
+              f"{statistics.median(scores):>6.0f}  {deciles[-1]:>6.0f}  {scores[-1]:>6}  "
+              f"{sum(r['won'] for r in mine) / len(mine):>8.1%}  "
+              f"{sum(r['crashed'] for r in mine) / len(mine):>6.1%}  "
+              f"{statistics.fmean(r['ticks'] for r in mine):>8.0f}")
+
+
+def run(args) -> List[dict]:
+    rows = [r for r in read_results(args.out) if (r["width"], r["height"]) == (args.width, args.height)]
+    done = {(r["policy"], r["seed"]) for r in rows}
+    seeds = range(args.seed_start, args.seed_start + args.seeds)
+    chunks = list(pending_chunks(args.policies, seeds, done, args.chunk_size))
+    total = sum(len(c[1]) for c in chunks)
+    if done:
+        print(f"resuming: {len(done)} games already in {args.out}, {total} to go")
+
+    new_file = not os.path.exists(args.out) or os.path.getsize(args.out) == 0
+    if not new_file:
+        with open(args.out, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            torn = f.read(1) != b"\n"
+    workers = args.workers or os.cpu_count() or 1
+
+    with open(args.out, "a", newline="") as f:
+        if not new_file and torn:
+            f.write("\n")  # Close off a row half-written by an interrupted run
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        if new_file:
+            writer.writeheader()
+
+        start = time.perf_counter()
+        finished = 0
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # Keep a bounded number of chunks in flight so results stream out
+            # steadily and little work is lost on interruption
+            queue = iter(chunks)
+            running = set()
+            while True:
+                while len(running) < 2 * workers:
+                    chunk = next(queue, None)
+                    if chunk is None:
+                        break
+                    running.add(pool.submit(play_chunk, chunk[0], chunk[1], args.width, args.height,
+                                            args.max_ticks, args.budget))
+                if not running:
+                    break
+                completed, running = wait(running, return_when=FIRST_COMPLETED)
+                for future in completed:
+                    results = future.result()
+                    writer.writerows(results)
+                    rows.extend(results)
+                    finished += len(results)
+                f.flush()
+                elapsed = time.perf_counter() - start
+                print(f"\r{finished}/{total} games  {finished / elapsed:,.1f} games/s", end="", flush=True)
+    print()
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Snake autopilot self-play tournament")
+    parser.add_argument("--policies", nargs="+", default=list(POLICIES), choices=list(POLICIES))
+    parser.add_argument("--seeds", type=int, default=1000, help="games per policy")
+    parser.add_argument("--seed-start", type=int, default=0)
+    parser.add_argument("--width", type=int, default=20)
+    parser.add_argument("--height", type=int, default=15)
+    parser.add_argument("--max-ticks", type=int, default=100_000,
+                        help="stop a game that has not ended after this many ticks")
+    parser.add_argument("--budget", type=float, default=0.01,
+                        help="bfs and hamiltonian search budget per decision, seconds")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--chunk-size", type=int, default=10, help="games per task")
+    parser.add_argument("--out", default="snake_tournament.csv")
+    parser.add_argument("--parquet", help="also write all results to this Parquet file")
+    args = parser.parse_args()
+
+    rows = run(args)
+    summarize(rows, args.policies)
+
+    if args.parquet:
+        import pandas as pd
+        pd.DataFrame(rows, columns=FIELDS).to_parquet(args.parquet, index=False)
+        print(f"wrote {len(rows)} games to {args.parquet}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,386 @@
+import heapq
+import io
+import itertools
+import logging
+import math
+import threading
+import time
+from array import array
+from bisect import bisect_right
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+NS_PER_SECOND = 1_000_000_000
+
+logger = logging.getLogger(__name__)
+
+
+def format_duration(ns: int) -> str:
+    """MM:SS.mmm for a duration in nanoseconds"""
+    ms = ns // 1_000_000
+    minutes, ms = divmod(ms, 60_000)
+    seconds, ms = divmod(ms, 1000)
+    return f"{minutes:02d}:{seconds:02d}.{ms:03d}"
+
+
+class LapStore:
+    """Lap splits in a compact int64 array, with lap statistics kept current.
+
+    Only the cumulative split times are stored (8 bytes per lap); each lap is
+    the difference of two neighbouring splits. Fastest, slowest, mean and
+    standard deviation (Welford's running variance) are updated in O(1) per
+    added lap, so nothing is ever rescanned.
+    """
+
+    def __init__(self):
+        self._splits = array('q')
+        self._mean = 0.0
+        self._m2 = 0.0
+        self.fastest_index = -1
+        self.slowest_index = -1
+
+    def __len__(self) -> int:
+        return len(self._splits)
+
+    def add_split(self, split_ns: int) -> int:
+        """Record a lap ending at split_ns of total elapsed time; returns the lap length"""
+        lap = split_ns - (self._splits[-1] if self._splits else 0)
+        self._splits.append(split_ns)
+        count = len(self._splits)
+
+        delta = lap - self._mean
+        self._mean += delta / count
+        self._m2 += delta * (lap - self._mean)
+
+        if self.fastest_index < 0 or lap < self.lap_ns(self.fastest_index):
+            self.fastest_index = count - 1
+        if self.slowest_index < 0 or lap > self.lap_ns(self.slowest_index):
+            self.slowest_index = count - 1
+        return lap
+
+    def split_ns(self, index: int) -> int:
+        return self._splits[index]
+
+    def lap_ns(self, index: int) -> int:
+        return self._splits[index] - (self._splits[index - 1] if index > 0 else 0)
+
+    @property
+    def fastest_ns(self) -> int:
+        return self.lap_ns(self.fastest_index) if self._splits else 0
+
+    @property
+    def slowest_ns(self) -> int:
+        return self.lap_ns(self.slowest_index) if self._splits else 0
+
+    @property
+    def mean_ns(self) -> float:
+        return self._mean
+
+    @property
+    def stdev_ns(self) -> float:
+        """Sample standard deviation of the lap times"""
+        return math.sqrt(self._m2 / (len(self._splits) - 1)) if len(self._splits) > 1 else 0.0
+
+    def recent(self, count: int) -> List[Tuple[int, int, int]]:
+        """(lap number, lap ns, split ns) for the latest laps, newest first"""
+        first = max(0, len(self._splits) - count)
+        return [(i + 1, self.lap_ns(i), self._splits[i]) for i in range(len(self._splits) - 1, first - 1, -1)]
+
+    def to_csv(self) -> str:
+        """All laps as CSV text, written through one buffer"""
+        buffer = io.StringIO()
+        buffer.write("lap,lap_ns,split_ns,lap_time,split_time\n")
+        for i in range(len(self._splits)):
+            lap, split = self.lap_ns(i), self._splits[i]
+            buffer.write(f"{i + 1},{lap},{split},{format_duration(lap)},{format_duration(split)}\n")
+        return buffer.getvalue()
+
+
+class Stopwatch:
+    """Start/stop/lap timing on the monotonic perf_counter_ns clock.
+
+    Unlike time.time(), the clock never jumps when the system time is
+    adjusted, and integer nanoseconds keep long sessions exact.
+    """
+
+    def __init__(self, clock: Callable[[], int] = time.perf_counter_ns):
+        self.clock = clock
+        self.running = False
+        self._started_ns = 0
+        self._accumulated_ns = 0
+        self.laps = LapStore()
+
+    def start(self):
+        if not self.running:
+            self._started_ns = self.clock()
+            self.running = True
+
+    def stop(self):
+        if self.running:
+            self._accumulated_ns += self.clock() - self._started_ns
+            self.running = False
+
+    def reset(self):
+        self.running = False
+        self._accumulated_ns = 0
+        self.laps = LapStore()
+
+    def elapsed_ns(self) -> int:
+        if self.running:
+            return self._accumulated_ns + self.clock() - self._started_ns
+        return self._accumulated_ns
+
+    def elapsed(self) -> float:
+        """Elapsed time in seconds"""
+        return self.elapsed_ns() / NS_PER_SECOND
+
+    def lap(self) -> int:
+        """Close the current lap at the current elapsed time; returns its length in ns"""
+        return self.laps.add_split(self.elapsed_ns())
+
+
+class Countdown:
+    """A stopwatch that counts down from a fixed duration"""
+
+    def __init__(self, seconds: float, clock: Callable[[], int] = time.perf_counter_ns):
+        self.duration_ns = int(seconds * NS_PER_SECOND)
+        self.stopwatch = Stopwatch(clock)
+        self.finished = False
+
+    @property
+    def running(self) -> bool:
+        return self.stopwatch.running
+
+    def start(self):
+        if not self.finished:
+            self.stopwatch.start()
+
+    def stop(self):
+        self.stopwatch.stop()
+
+    def reset(self):
+        self.stopwatch.reset()
+        self.finished = False
+
+    def remaining_ns(self) -> int:
+        return max(0, self.duration_ns - self.stopwatch.elapsed_ns())
+
+    def deadline_ns(self) -> int:
+        """Clock reading at which a running countdown reaches zero"""
+        return self.stopwatch.clock() + self.remaining_ns()
+
+
+class IntervalTimer:
+    """A fixed run of timed phases, e.g. 8 rounds of 20s work / 10s rest.
+
+    Phase boundaries are laid out once as cumulative nanosecond offsets from
+    the start, and the current phase is found by bisecting them against the
+    stopwatch's elapsed time. Nothing is stepped forward between reruns, so
+    the last of hundreds of phases ends exactly where it should.
+    """
+
+    def __init__(self, phases: Iterable[Tuple[str, str, float]], clock: Callable[[], int] = time.perf_counter_ns):
+        """phases are (name, kind, seconds) with kind one of prepare, work or rest"""
+        self.names: List[str] = []
+        self.kinds: List[str] = []
+        self.ends = array('q')
+        total = 0
+        for name, kind, seconds in phases:
+            total += round(seconds * NS_PER_SECOND)
+            self.names.append(name)
+            self.kinds.append(kind)
+            self.ends.append(total)
+        self.stopwatch = Stopwatch(clock)
+
+    @classmethod
+    def rounds(cls, rounds: int, work: float, rest: float, prepare: float = 0.0,
+               clock: Callable[[], int] = time.perf_counter_ns) -> "IntervalTimer":
+        phases = [("Get ready", "prepare", prepare)] if prepare > 0 else []
+        for r in range(1, rounds + 1):
+            phases.append((f"Work {r}/{rounds}", "work", work))
+            if rest > 0 and r < rounds:
+                phases.append((f"Rest {r}/{rounds}", "rest", rest))
+        return cls(phases, clock)
+
+    def __len__(self) -> int:
+        return len(self.ends)
+
+    @property
+    def total_ns(self) -> int:
+        return self.ends[-1] if self.ends else 0
+
+    @property
+    def running(self) -> bool:
+        return self.stopwatch.running and not self.finished
+
+    @property
+    def finished(self) -> bool:
+        return self.stopwatch.elapsed_ns() >= self.total_ns
+
+    def start(self):
+        if not self.finished:
+            self.stopwatch.start()
+
+    def stop(self):
+        self.stopwatch.stop()
+
+    def reset(self):
+        self.stopwatch.reset()
+
+    def elapsed_ns(self) -> int:
+        return min(self.stopwatch.elapsed_ns(), self.total_ns)
+
+    def phase_at(self, elapsed_ns: int) -> int:
+        """Index of the phase running at elapsed_ns; len(self) once all are over"""
+        return bisect_right(self.ends, elapsed_ns)
+
+    def phase_start_ns(self, index: int) -> int:
+        return self.ends[index - 1] if index > 0 else 0
+
+    def status(self) -> dict:
+        elapsed = self.elapsed_ns()
+        index = self.phase_at(elapsed)
+        if index == len(self):
+            return {"index": index, "name": "Done", "kind": "done", "remaining": 0.0,
+                    "elapsed": elapsed / NS_PER_SECOND}
+        return {"index": index, "name": self.names[index], "kind": self.kinds[index],
+                "remaining": (self.ends[index] - elapsed) / NS_PER_SECOND,
+                "elapsed": elapsed / NS_PER_SECOND}
+
+
+class TimerRegistry:
+    """Many named stopwatches and countdowns served from one process.
+
+    Stopwatches need no scheduling at all: their time is computed when
+    asked. Running countdowns share one min-heap of deadlines watched by a
+    single background thread that sleeps until the earliest one, so a
+    thousand idle timers cost one sleeping thread rather than a thousand
+    polling loops. Pausing or resetting a countdown bumps its generation,
+    which turns its heap entry stale instead of searching the heap for it.
+    """
+
+    def __init__(self, clock: Callable[[], int] = time.perf_counter_ns):
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._timers: Dict[int, Tuple[str, object]] = {}
+        self._generations: Dict[int, int] = {}
+        self._heap: List[Tuple[int, int, int]] = []  # (deadline ns, timer id, generation)
+        self._ids = itertools.count(1)
+        self._callbacks: List[Callable[[int, str], None]] = []
+        self._thread: Optional[threading.Thread] = None
+        self.expired = 0
+
+    def on_expire(self, callback: Callable[[int, str], None]):
+        """Call callback(timer_id, name) from the scheduler thread, unlocked, when a countdown ends.
+
+        Exceptions raised by a callback are logged and do not stop other timers.
+        """
+        self._callbacks.append(callback)
+
+    def add_stopwatch(self, name: str) -> int:
+        with self._lock:
+            timer_id = next(self._ids)
+            self._timers[timer_id] = (name, Stopwatch(self.clock))
+            return timer_id
+
+    def add_countdown(self, name: str, seconds: float) -> int:
+        with self._lock:
+            timer_id = next(self._ids)
+            self._timers[timer_id] = (name, Countdown(seconds, self.clock))
+            self._generations[timer_id] = 0
+            return timer_id
+
+    def start(self, timer_id: int):
+        with self._lock:
+            timer = self._timers[timer_id][1]
+            if timer.running:
+                return
+            timer.start()
+            if isinstance(timer, Countdown) and timer.running:
+                self._schedule(timer_id, timer)
+
+    def stop(self, timer_id: int):
+        with self._lock:
+            self._timers[timer_id][1].stop()
+            self._invalidate(timer_id)
+
+    def reset(self, timer_id: int):
+        with self._lock:
+            self._timers[timer_id][1].reset()
+            self._invalidate(timer_id)
+
+    def remove(self, timer_id: int):
+        with self._lock:
+            del self._timers[timer_id]
+            self._generations.pop(timer_id, None)
+
+    def status(self, timer_id: int) -> dict:
+        with self._lock:
+            return self._status(timer_id)
+
+    def list_status(self) -> List[dict]:
+        with self._lock:
+            return [self._status(timer_id) for timer_id in self._timers]
+
+    def __len__(self) -> int:
+        return len(self._timers)
+
+    def _status(self, timer_id: int) -> dict:
+        name, timer = self._timers[timer_id]
+        if isinstance(timer, Countdown):
+            state = "finished" if timer.finished else "running" if timer.running else "paused"
+            return {"id": timer_id, "name": name, "kind": "countdown", "state": state,
+                    "elapsed": timer.stopwatch.elapsed(), "remaining": timer.remaining_ns() / NS_PER_SECOND}
+        return {"id": timer_id, "name": name, "kind": "stopwatch",
+                "state": "running" if timer.running else "paused",
+                "elapsed": timer.elapsed(), "remaining": None}
+
+    def _invalidate(self, timer_id: int):
+        if timer_id in self._generations:
+            self._generations[timer_id] += 1
+
+    def _schedule(self, timer_id: int, countdown: Countdown):
+        """Push the countdown's deadline; the lock must be held"""
+        self._generations[timer_id] += 1
+        deadline = countdown.deadline_ns()
+        heapq.heappush(self._heap, (deadline, timer_id, self._generations[timer_id]))
+        if self._heap[0][1] == timer_id:
+            self._wakeup.notify()  # New earliest deadline: re-arm the sleep
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="timer-registry", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            fired = []
+            with self._lock:
+                heap = self._heap
+                while not fired:
+                    # Drop entries for paused, reset or removed countdowns
+                    while heap and self._generations.get(heap[0][1]) != heap[0][2]:
+                        heapq.heappop(heap)
+                    if not heap:
+                        self._wakeup.wait()
+                        continue
+                    wait_ns = heap[0][0] - self.clock()
+                    if wait_ns > 0:
+                        self._wakeup.wait(wait_ns / NS_PER_SECOND)
+                        continue
+                    # Take every countdown that is due, then run callbacks unlocked
+                    while heap and heap[0][0] <= self.clock():
+                        _, timer_id, generation = heapq.heappop(heap)
+                        if self._generations.get(timer_id) != generation:
+                            continue
+                        name, countdown = self._timers[timer_id]
+                        countdown.stop()
+                        countdown.finished = True
+                        self.expired += 1
+                        fired.append((timer_id, name))
+            # Outside the lock, so callbacks may call back into the registry
+            for timer_id, name in fired:
+                for callback in self._callbacks:
+                    # A failing callback must not take the scheduler thread down with it
+                    try:
+                        callback(timer_id, name)
+                    except Exception:
+                        logger.exception("on_expire callback failed for timer %s (%s)", timer_id, name)
@@ -0,0 +1,68 @@
+import random
+
+import pytest
+
+from rps_predictor import MOVES, NgramPredictor, counter
+
+ROCK, PAPER, SCISSORS = range(3)
+
+
+def play(player, rounds, seed=0):
+    """Computer win rate against player(history) over the last half of the rounds"""
+    model = NgramPredictor(seed=seed)
+    history, wins = [], 0
+    for n in range(rounds):
+        computer = model.choose()
+        throw = player(history)
+        if n >= rounds // 2:
+            wins += computer == counter(throw)
+        model.update(throw, computer)
+        history.append((throw, computer))
+    return wins / (rounds - rounds // 2), model
+
+
+def test_counter_beats_each_move():
+    assert [MOVES[counter(m)] for m in range(3)] == ["paper", "scissors", "rock"]
+
+
+def test_starts_with_no_opinion():
+    assert NgramPredictor().predict() == [1 / 3, 1 / 3, 1 / 3]
+
+
+@pytest.mark.parametrize("player", [
+    lambda history: len(history) % 3,  # Cycle
+    lambda history: PAPER,  # Always the same
+    lambda history: counter(history[-1][1]) if history else ROCK,  # Beat the computer's last throw
+    lambda history: (ROCK, ROCK, PAPER, SCISSORS)[len(history) % 4],  # Fixed pattern
+])
+def test_learns_patterned_players(player):
+    win_rate, model = play(player, 600)
+    assert win_rate > 0.9
+    assert model.rounds == 600 and model.hits > 300
+
+
+def test_cannot_exploit_a_random_player():
+    rng = random.Random(7)
+    win_rate, _ = play(lambda history: rng.randrange(3), 6000)
+    assert 0.28 < win_rate < 0.39
+
+
+def test_follows_a_player_who_changes_style():
+    win_rate, _ = play(lambda history: ROCK if len(history) < 300 else SCISSORS, 600)
+    assert win_rate > 0.9
+
+
+def test_memory_stays_bounded():
+    model = NgramPredictor(slots=256, seed=1)
+    size = len(model.counts), len(model.stamps)
+    rng = random.Random(2)
+    for _ in range(5000):
+        model.update(rng.randrange(3), rng.randrange(3))
+    assert (len(model.counts), len(model.stamps)) == size
+    assert len(model.recent) == model.max_order
+    assert sum(model.predict()) == pytest.approx(1.0)
+
+
+def test_slots_must_be_a_power_of_two():
+    with pytest.raises(ValueError):
+        NgramPredictor(slots=1000)
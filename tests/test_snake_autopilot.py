@@ -0,0 +1,69 @@
+import pytest
+
+from snake_autopilot import POLICIES, BfsPolicy, GreedyPolicy, HamiltonianPolicy, _moves, hamiltonian_cycle, make_policy
+from snake_engine import SnakeGame
+
+
+@pytest.mark.parametrize("width, height", [(4, 4), (10, 8), (7, 6), (6, 5)])
+def test_hamiltonian_cycle_visits_every_cell_once(width, height):
+    cycle = hamiltonian_cycle(width, height)
+    assert sorted(cycle) == [(x, y) for x in range(width) for y in range(height)]
+    for (x1, y1), (x2, y2) in zip(cycle, cycle[1:] + cycle[:1]):
+        assert abs(x1 - x2) + abs(y1 - y2) == 1
+
+
+def test_no_hamiltonian_cycle_on_odd_boards():
+    assert hamiltonian_cycle(5, 7) is None
+
+
+def play(policy, game, max_ticks=50_000):
+    for _ in range(max_ticks):
+        if game.game_over or game.game_won:
+            break
+        game.change_direction(policy.decide(game))
+        game.move_snake()
+    return game
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_hamiltonian_policy_wins(seed):
+    game = play(HamiltonianPolicy(budget=1.0), SnakeGame(10, 8, seed=seed))
+    assert game.game_won and not game.game_over
+
+
+def test_policies_only_pick_safe_moves():
+    for policy in (GreedyPolicy(), BfsPolicy(budget=1.0), HamiltonianPolicy(budget=1.0)):
+        game = SnakeGame(9, 7, seed=4)
+        for _ in range(300):
+            if game.game_over or game.game_won:
+                break
+            safe = [direction for direction, _ in _moves(game)]
+            direction = policy.decide(game)
+            assert not safe or direction in safe
+            game.change_direction(direction)
+            game.move_snake()
+
+
+def test_bfs_policy_takes_the_greedy_step_when_out_of_budget():
+    game = SnakeGame(100, 100, seed=1)
+    game.place_snake([(5, 50)], (1, 0))
+    game.food = (95, 50)
+    assert BfsPolicy(budget=0.0).decide(game) == GreedyPolicy().decide(game) == (1, 0)
+
+
+def test_hamiltonian_policy_walks_the_cycle_until_the_body_is_in_order():
+    # Cycle on 4x4: down column 0 from row 1, up column 1, ..., back along row 0.
+    # Head (1, 2) with the neck at (0, 2) runs against the cycle order.
+    game = SnakeGame(4, 4, seed=0)
+    game.place_snake([(1, 2), (0, 2), (0, 3), (1, 3)], (1, 0))
+    policy = HamiltonianPolicy(budget=1.0)
+    policy._load(game)
+    assert not policy._in_cycle_order(game.snake)
+    assert policy.decide(game) == (0, -1)  # On to (1, 1), the next cycle cell
+
+
+def test_make_policy_passes_the_budget_to_searching_policies():
+    assert isinstance(make_policy("greedy", 0.5), GreedyPolicy)
+    for name in ("bfs", "hamiltonian"):
+        policy = make_policy(name, 0.5)
+        assert isinstance(policy, POLICIES[name]) and policy.budget == 0.5
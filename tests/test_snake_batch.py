@@ -0,0 +1,47 @@
+import numpy as np
+
+from snake_batch import SnakeBatch
+from snake_engine import DIRECTIONS, SnakeGame
+
+UP, RIGHT, DOWN, LEFT = range(4)
+
+
+def test_batch_moves_like_the_engine():
+    actions = [UP, UP, LEFT, LEFT, LEFT, DOWN, RIGHT, DOWN, DOWN, DOWN, DOWN, DOWN, DOWN, DOWN, DOWN, DOWN]
+    batch = SnakeBatch(1, 12, 10, seed=0)
+    batch.food[:] = 0  # Out of the way in the top-left corner
+    game = SnakeGame(12, 10, seed=0)
+    game.food = (0, 0)
+    for action in actions:
+        batch.step(np.array([action]))
+        game.change_direction(DIRECTIONS[action])
+        game.move_snake()
+        assert bool(batch.game_over[0]) == game.game_over
+        if game.game_over:
+            break
+        assert (batch.head_x[0], batch.head_y[0]) == game.snake[0]
+        assert DIRECTIONS[batch.direction[0]] == game.direction
+    assert game.game_over  # Ran into the bottom wall
+
+
+def test_eating_grows_scores_and_moves_the_apple():
+    batch = SnakeBatch(3, 8, 6, seed=1)
+    batch.food[:] = batch.head_y * 8 + batch.head_x + 1  # Right in front
+    rewards, done, scores = batch.step(np.full(3, -1))
+    assert rewards.tolist() == [10.0] * 3 and scores.tolist() == [10] * 3
+    assert batch.length.tolist() == [2] * 3 and not done.any()
+    assert not batch.occupied[np.arange(3), batch.food].any()
+    assert batch.occupied.sum(axis=1).tolist() == [2] * 3
+
+
+def test_reversal_is_ignored_and_reset_is_per_game():
+    batch = SnakeBatch(2, 8, 6, seed=2)
+    batch.food[:] = 0
+    batch.step(np.array([LEFT, -1]))  # LEFT reverses the initial RIGHT
+    assert batch.direction.tolist() == [RIGHT, RIGHT]
+    for _ in range(5):
+        batch.step(np.array([-1, UP]))
+    assert batch.game_over.tolist() == [True, True]
+    batch.reset(np.array([True, False]))
+    assert batch.game_over.tolist() == [False, True]
+    assert batch.length[0] == 1 and batch.occupied[0].sum() == 1
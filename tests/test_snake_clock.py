@@ -0,0 +1,61 @@
+from snake_clock import TickClock
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def started(period=0.1, **kwargs):
+    clock = FakeClock()
+    ticks = TickClock(period, clock=clock, **kwargs)
+    ticks.start()
+    return clock, ticks
+
+
+def test_first_tick_is_due_half_a_period_after_start():
+    clock, ticks = started()
+    clock.now = 0.049
+    assert ticks.due() == 0
+    clock.now = 0.05
+    assert ticks.due() == 1
+
+
+def test_early_and_late_polls_do_not_drift():
+    clock, ticks = started()
+    total = 0
+    for k in range(1, 101):
+        clock.now = k * 0.1 + (0.03 if k % 2 else -0.03)
+        total += ticks.due()
+    assert total == 100
+    assert ticks.dropped == 0
+
+
+def test_falling_behind_drops_ticks_beyond_the_catch_up_limit():
+    clock, ticks = started(max_catch_up=3)
+    clock.now = 1.0
+    assert ticks.due() == 3
+    assert ticks.dropped == 7
+    clock.now = 1.1
+    assert ticks.due() == 1
+
+
+def test_set_period_keeps_the_current_tick():
+    clock, ticks = started(max_catch_up=10)
+    clock.now = 0.5
+    assert ticks.due() == 5
+    ticks.set_period(0.2)
+    clock.now = 0.7
+    assert ticks.due() == 1
+    clock.now = 0.9
+    assert ticks.due() == 1
+
+
+def test_stopped_clock_issues_nothing():
+    clock, ticks = started()
+    ticks.stop()
+    clock.now = 5.0
+    assert ticks.due() == 0 and ticks.achieved_rate() == 0.0
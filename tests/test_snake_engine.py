@@ -0,0 +1,76 @@
+from snake_engine import BODY, EMPTY, FOOD, HEAD, MAX_QUEUED_TURNS, SnakeGame
+
+UP, RIGHT, DOWN, LEFT = (0, -1), (1, 0), (0, 1), (-1, 0)
+
+
+def test_same_seed_same_game():
+    first, second = SnakeGame(10, 8, seed=5), SnakeGame(10, 8, seed=5)
+    for direction in (DOWN, LEFT, UP, LEFT, DOWN, RIGHT) * 3:
+        for game in (first, second):
+            game.change_direction(direction)
+            game.move_snake()
+            game.move_snake()
+    assert first.snapshot() == second.snapshot()
+
+
+def test_free_cells_track_the_body():
+    game = SnakeGame(6, 5, seed=1)
+    game.place_snake([(2, 2), (1, 2), (0, 2)], RIGHT)
+    for _ in range(3):
+        game.move_snake()
+    free = {(x, y) for x in range(6) for y in range(5) if game.is_free(x, y)}
+    assert free == {(x, y) for x in range(6) for y in range(5)} - set(game.snake)
+    assert not game.is_free(-1, 0) and not game.is_free(6, 0)
+
+
+def test_walls_and_body_end_the_game():
+    game = SnakeGame(4, 4, seed=0)
+    game.place_snake([(3, 0)], RIGHT)
+    game.move_snake()
+    assert game.game_over
+
+    game = SnakeGame(5, 5, seed=0)
+    game.place_snake([(2, 2), (2, 3), (1, 3), (1, 2), (1, 1)], UP)
+    game.food = None
+    game.change_direction(LEFT)
+    game.move_snake()
+    assert game.game_over
+
+
+def test_turn_queue_rejects_reversals_and_overflow():
+    game = SnakeGame(10, 10, seed=0)
+    game.change_direction(LEFT)  # Reverses the initial RIGHT
+    game.change_direction(RIGHT)  # Repeats it
+    assert not game._turns
+    for direction in (UP, LEFT, DOWN, RIGHT, UP):
+        game.change_direction(direction)
+    assert list(game._turns) == [UP, LEFT, DOWN][:MAX_QUEUED_TURNS]
+    game.clear_turns()
+    game.move_snake()
+    assert game.direction == RIGHT
+
+
+def test_display_changes_are_reported_once():
+    game = SnakeGame(6, 6, seed=2)
+    game.place_snake([(2, 2), (1, 2)], RIGHT)
+    game.food = (5, 5)
+    game.take_changes()
+    game.move_snake()
+    assert sorted(game.take_changes()) == [(1, 2), (2, 2), (3, 2)]
+    board = game.get_board_display()
+    assert (board[2][3], board[2][2], board[2][1]) == (HEAD, BODY, EMPTY)
+    assert game.take_changes() == []
+
+
+def test_restore_returns_to_a_snapshot():
+    game = SnakeGame(8, 6, seed=3)
+    snapshot = game.snapshot()
+    display = [row[:] for row in game.get_board_display()]
+    for direction in (DOWN, LEFT, UP):
+        game.change_direction(direction)
+        game.move_snake()
+        game.move_snake()
+    game.restore(snapshot)
+    assert game.snapshot() == snapshot
+    assert game.get_board_display() == display
+    assert FOOD in sum(display, [])
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from snake_engine import KIND_FOOD, KIND_HEAD
+from snake_env import FEATURES, SnakeEnv, SnakeVectorEnv
+
+UP, RIGHT, DOWN, LEFT = range(4)
+
+
+def grid_from_board(game):
+    values = {'⬜': 0, '🟩': 1, '🟢': 2, '🍎': 3}
+    return np.array([[values[cell] for cell in row] for row in game.get_board_display()], dtype=np.uint8)
+
+
+def test_grid_observation_tracks_the_board():
+    env = SnakeEnv(8, 6)
+    obs, info = env.reset(seed=3)
+    assert obs.shape == (6, 8) and info == {"score": 0}
+    for action in (UP, LEFT, DOWN, DOWN, RIGHT, -1, -1):
+        obs, reward, terminated, truncated, info = env.step(action)
+        assert (obs == grid_from_board(env.game)).all()
+        if terminated:
+            break
+
+
+def test_feature_observation():
+    env = SnakeEnv(8, 6, observation="features")
+    obs, _ = env.reset(seed=0)
+    assert obs.shape == (FEATURES,) and obs.dtype == np.uint8
+    assert obs[3 + RIGHT] == 1 and obs[3:7].sum() == 1  # Heading right
+    assert obs[:3].tolist() == [0, 0, 0]  # Nothing in the way at the start
+
+
+def test_truncation_and_rewards():
+    env = SnakeEnv(20, 15, max_steps=3)
+    env.reset(seed=0)
+    env.game.food = (0, 0)
+    results = [env.step(-1) for _ in range(3)]
+    assert [r[1] for r in results] == [0.0, 0.0, 0.0]
+    assert [r[3] for r in results] == [False, False, True]
+
+
+def test_unknown_observation_type():
+    with pytest.raises(ValueError):
+        SnakeEnv(observation="pixels")
+
+
+def test_vector_env_resets_finished_games():
+    env = SnakeVectorEnv(4, 8, 6)
+    obs, _ = env.reset(seed=0)
+    assert obs.shape == (4, 6, 8)
+    assert ((obs == KIND_HEAD).sum(axis=(1, 2)) == 1).all() and ((obs == KIND_FOOD).sum(axis=(1, 2)) == 1).all()
+    finished = np.zeros(4, dtype=bool)
+    for _ in range(8):  # Straight on into the right wall
+        obs, rewards, terminated, truncated, info = env.step(np.full(4, -1))
+        finished |= terminated
+        assert ((info["final_score"] >= 0) == terminated).all()
+    assert finished.all() and not env.batch.done.any()
+
+
+def test_vector_features_match_single_env_layout():
+    env = SnakeVectorEnv(3, 8, 6, observation="features")
+    obs, _ = env.reset(seed=1)
+    assert obs.shape == (3, FEATURES)
+    assert (obs[:, 3 + RIGHT] == 1).all() and (obs[:, :3] == 0).all()
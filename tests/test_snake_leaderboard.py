@@ -0,0 +1,67 @@
+import threading
+
+import pytest
+
+from snake_leaderboard import Leaderboard
+
+
+@pytest.fixture
+def board(tmp_path):
+    leaderboard = Leaderboard(str(tmp_path / "scores.db"))
+    yield leaderboard
+    leaderboard.close()
+
+
+def test_top_orders_by_score_then_age(board):
+    board.add_game("ann", 20, 15, 120, 13, 1)
+    board.add_game("bob", 20, 15, 300, 31, 2, "SNK1code")
+    board.add_game("cat", 20, 15, 120, 13, 3)
+    board.add_game("dan", 30, 20, 900, 91, 4)
+    top = board.top(20, 15)
+    assert [(row["player"], row["score"]) for row in top] == [("bob", 300), ("ann", 120), ("cat", 120)]
+    assert top[0]["replay"] == "SNK1code" and top[1]["replay"] is None
+    assert [row["player"] for row in board.top(20, 15, limit=1)] == ["bob"]
+
+
+def test_rank_and_count_per_board(board):
+    board.add_games([("p", 20, 15, score, 1, i, None) for i, score in enumerate((50, 100, 100, 200))])
+    board.add_game("q", 10, 10, 500, 1, 9)
+    assert board.count(20, 15) == 4 and board.count(10, 10) == 1 and board.count(5, 5) == 0
+    assert board.rank(20, 15, 300) == 1
+    assert board.rank(20, 15, 100) == 2
+    assert board.rank(20, 15, 60) == 4
+    assert board.rank(20, 15, 0) == 5
+
+
+def test_reopened_file_keeps_games(tmp_path):
+    path = str(tmp_path / "scores.db")
+    first = Leaderboard(path)
+    first.add_game("ann", 20, 15, 70, 8, 1)
+    first.close()
+    second = Leaderboard(path)
+    assert second.count(20, 15) == 1
+    second.close()
+
+
+def test_threads_share_one_leaderboard(board):
+    def play(name):
+        for i in range(20):
+            board.add_game(name, 20, 15, i * 10, 1, i)
+
+    threads = [threading.Thread(target=play, args=(f"t{n}",)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert board.count(20, 15) == 80
+    assert board.rank(20, 15, 190) == 1 and board.top(20, 15, 4)[-1]["score"] == 190
+
+
+def test_connection_is_opened_once(board, monkeypatch):
+    opened = []
+    monkeypatch.setattr("sqlite3.connect", lambda *args, **kwargs: opened.append(args))
+    thread = threading.Thread(target=board.add_game, args=("ann", 20, 15, 10, 2, 1))
+    thread.start()
+    thread.join()
+    assert board.top(20, 15)[0]["player"] == "ann"
+    assert opened == []
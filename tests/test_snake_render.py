@@ -0,0 +1,35 @@
+from snake_engine import SnakeGame
+from snake_engine import KIND_BODY, KIND_FOOD, KIND_HEAD
+from snake_render import BoardEncoder
+
+
+def cells(frame):
+    flat = frame["cells"]
+    return dict(zip(flat[::2], flat[1::2]))
+
+
+def test_first_frame_is_full_then_diffs():
+    game = SnakeGame(6, 5, seed=0)
+    game.place_snake([(2, 2), (1, 2)], (1, 0))
+    assert game.food != (3, 2)  # The next move does not eat
+    encoder = BoardEncoder()
+
+    first = encoder.frame(game)
+    assert first["full"] and (first["seq"], first["w"], first["h"]) == (0, 6, 5)
+    assert cells(first)[2 * 6 + 2] == KIND_HEAD and cells(first)[2 * 6 + 1] == KIND_BODY
+
+    game.move_snake()
+    diff = encoder.frame(game)
+    assert not diff["full"] and diff["seq"] == 1
+    assert cells(diff) == {2 * 6 + 3: KIND_HEAD, 2 * 6 + 2: KIND_BODY, 2 * 6 + 1: 0}
+
+
+def test_a_new_game_or_a_resync_sends_a_full_frame():
+    encoder = BoardEncoder()
+    game = SnakeGame(6, 5, seed=1)
+    encoder.frame(game)
+    assert not encoder.frame(game)["full"]
+    assert encoder.frame(game, full=True)["full"]
+    other = SnakeGame(6, 5, seed=2)
+    frame = encoder.frame(other)
+    assert frame["full"] and KIND_FOOD in cells(frame).values()
@@ -0,0 +1,96 @@
+import zlib
+
+import pytest
+
+from snake_engine import DIRECTIONS, SnakeGame
+from snake_replay import Replay, ReplayPlayer, ReplayRecorder
+
+
+def play(width=12, height=10, seed=3, ticks=300):
+    """A recorded game that turns every few ticks, steering away from walls"""
+    game = SnakeGame(width, height, seed=seed)
+    recorder = ReplayRecorder(game)
+    for tick in range(ticks):
+        if tick % 7 == 0:
+            x, y = game.snake[0]
+            for dx, dy in DIRECTIONS:
+                if game.is_free(x + dx, y + dy) and (dx, dy) != game.direction:
+                    game.change_direction((dx, dy))
+                    break
+        game.move_snake()
+        recorder.record_tick(game)
+        if game.game_over:
+            break
+    return game, recorder.replay
+
+
+def test_round_trip():
+    _, replay = play()
+    loaded = Replay.from_string(replay.to_string())
+    assert (loaded.width, loaded.height, loaded.seed, loaded.ticks) == (12, 10, 3, replay.ticks)
+    assert loaded.events == replay.events
+
+
+def test_player_rebuilds_final_state():
+    game, replay = play()
+    rebuilt = ReplayPlayer(Replay.from_bytes(replay.to_bytes()), interval=16).state_at(replay.ticks)
+    assert list(rebuilt.snake) == list(game.snake)
+    assert (rebuilt.score, rebuilt.food) == (game.score, game.food)
+
+
+def test_seeking_back_and_forth_matches_playing_forward():
+    _, replay = play()
+    player = ReplayPlayer(replay, interval=16)
+    fresh = ReplayPlayer(replay, interval=16)
+    for tick in (replay.ticks, 5, 40, 17, 0, replay.ticks - 1, 33):
+        expected = ReplayPlayer(replay, interval=1000).state_at(tick)
+        seeked = player.state_at(tick)
+        assert list(seeked.snake) == list(expected.snake)
+        assert (seeked.food, seeked.score) == (expected.food, expected.score)
+        assert seeked.get_board_display() == expected.get_board_display()
+    assert list(fresh.state_at(replay.ticks).snake) == list(player.state_at(replay.ticks).snake)
+
+
+@pytest.mark.parametrize("data", [
+    b"",
+    b"SNK0" + zlib.compress(b"\x05"),
+    b"SNK1not zlib",
+    b"SNK1" + zlib.compress(b"\x05"),  # Header cut short
+    b"SNK1" + zlib.compress(bytes([20, 15, 1, 10, 3, 4, 8])),  # Fewer events than announced
+    b"SNK1" + zlib.compress(bytes([20, 15, 1, 10, 1, 0x80])),  # Varint cut short
+    b"SNK1" + zlib.compress(bytes([0, 15, 1, 10, 0])),  # Empty board
+    b"SNK1" + zlib.compress(bytes([0xFF, 0xFF, 0x7F, 0xFF, 0xFF, 0x7F, 1, 10, 0])),  # Huge board
+    b"SNK1" + zlib.compress(bytes([20, 15, 1, 2, 1, 40])),  # Event after the last tick
+])
+def test_corrupt_input_raises_value_error(data):
+    with pytest.raises(ValueError):
+        Replay.from_bytes(data)
+
+
+def test_truncated_stream_raises_value_error():
+    _, replay = play()
+    data = replay.to_bytes()
+    body = zlib.decompress(data[4:])
+    for cut in range(len(body)):
+        with pytest.raises(ValueError):
+            Replay.from_bytes(b"SNK1" + zlib.compress(body[:cut]))
+
+
+def test_oversized_replay_is_rejected():
+    # A few bytes claiming a 1024x1024 board and 10,000 ticks without a turn
+    huge = Replay(1024, 1024, 1, 10_000)
+    assert len(huge.to_string()) < 40
+    with pytest.raises(ValueError):
+        Replay.from_string(huge.to_string())
+    with pytest.raises(ValueError):
+        Replay.from_string(Replay(20, 15, 1, 1 << 24).to_string())
+
+
+def test_player_stops_at_game_over():
+    # No turns: the snake runs into the right wall after ten moves
+    replay = Replay(20, 15, 1, 50_000)
+    player = ReplayPlayer(Replay.from_string(replay.to_string()), interval=4)
+    assert player.ticks == 10
+    assert len(player._keyframes) == 3
+    assert player.state_at(replay.ticks).game_over
+    assert player.state_at(9).snake[0] == (19, 7)
@@ -0,0 +1,52 @@
+import csv
+
+from snake_tournament import FIELDS, pending_chunks, play_chunk, read_results, summarize
+
+
+def row(policy, seed, score):
+    return {"policy": policy, "seed": seed, "width": 20, "height": 15, "score": score,
+            "length": score // 10 + 1, "ticks": 100, "won": 0, "crashed": 1}
+
+
+def summary_line(capsys, rows, policy):
+    summarize(rows, [policy])
+    header, line = capsys.readouterr().out.strip().splitlines()
+    return dict(zip(header.replace("win rate", "win_rate").split(), line.split()))
+
+
+def test_deciles_stay_within_observed_scores(capsys):
+    scores = [0, 10, 20, 30, 960]
+    stats = summary_line(capsys, [row("bfs", i, s) for i, s in enumerate(scores)], "bfs")
+    assert int(stats["p10"]) >= min(scores)
+    assert int(stats["p90"]) <= int(stats["max"]) == 960
+    assert int(stats["games"]) == len(scores)
+
+
+def test_single_game_summary(capsys):
+    stats = summary_line(capsys, [row("greedy", 0, 70)], "greedy")
+    assert stats["p10"] == stats["median"] == stats["p90"] == stats["max"] == "70"
+    assert stats["crash"] == "100.0%"
+
+
+def test_pending_chunks_skip_finished_games():
+    chunks = list(pending_chunks(["greedy", "bfs"], range(5), {("greedy", 1), ("bfs", 4)}, 2))
+    assert chunks == [("greedy", [0, 2]), ("greedy", [3, 4]), ("bfs", [0, 1]), ("bfs", [2, 3])]
+
+
+def test_play_chunk_is_deterministic():
+    first = play_chunk("greedy", [1, 2], 10, 8, 500, 0.01)
+    assert first == play_chunk("greedy", [1, 2], 10, 8, 500, 0.01)
+    assert [r["seed"] for r in first] == [1, 2]
+    assert all(r["ticks"] <= 500 for r in first)
+
+
+def test_read_results_skips_a_torn_row(tmp_path):
+    path = tmp_path / "results.csv"
+    rows = play_chunk("greedy", [1, 2], 10, 8, 200, 0.01)
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+        f.write("greedy,3,10,8,4")  # Interrupted mid-row
+    assert read_results(str(path)) == rows
+    assert read_results(str(tmp_path / "missing.csv")) == []
@@ -0,0 +1,198 @@
+import statistics
+import threading
+import time
+
+import pytest
+
+from stopwatch_engine import (NS_PER_SECOND, Countdown, IntervalTimer, LapStore, Stopwatch, TimerRegistry,
+                              format_duration)
+
+
+class FakeClock:
+    """A clock that only moves when told to"""
+
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self) -> int:
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += round(seconds * NS_PER_SECOND)
+
+
+def test_format_duration():
+    assert format_duration(0) == "00:00.000"
+    assert format_duration(61_234_000_000) == "01:01.234"
+
+
+def test_stopwatch_accumulates_only_while_running():
+    clock = FakeClock()
+    stopwatch = Stopwatch(clock)
+    stopwatch.start()
+    clock.advance(2)
+    stopwatch.stop()
+    clock.advance(5)
+    stopwatch.start()
+    clock.advance(0.5)
+    assert stopwatch.elapsed() == 2.5
+    stopwatch.reset()
+    assert stopwatch.elapsed_ns() == 0 and not stopwatch.running
+
+
+def test_lap_statistics_match_a_full_rescan():
+    laps = [3.2, 2.9, 3.5, 3.1, 2.7, 4.0]
+    store = LapStore()
+    split = 0
+    for lap in laps:
+        split += round(lap * NS_PER_SECOND)
+        store.add_split(split)
+    lap_ns = [store.lap_ns(i) for i in range(len(store))]
+    assert lap_ns == [round(lap * NS_PER_SECOND) for lap in laps]
+    assert store.fastest_ns == min(lap_ns) and store.fastest_index == 4
+    assert store.slowest_ns == max(lap_ns) and store.slowest_index == 5
+    assert store.mean_ns == pytest.approx(statistics.fmean(lap_ns))
+    assert store.stdev_ns == pytest.approx(statistics.stdev(lap_ns))
+    assert [number for number, _, _ in store.recent(3)] == [6, 5, 4]
+
+
+def test_laps_to_csv():
+    store = LapStore()
+    store.add_split(1_500_000_000)
+    store.add_split(2_000_000_000)
+    assert store.to_csv().splitlines() == [
+        "lap,lap_ns,split_ns,lap_time,split_time",
+        "1,1500000000,1500000000,00:01.500,00:01.500",
+        "2,500000000,2000000000,00:00.500,00:02.000",
+    ]
+
+
+def test_countdown_remaining_time():
+    clock = FakeClock()
+    countdown = Countdown(10, clock)
+    countdown.start()
+    clock.advance(4)
+    assert countdown.remaining_ns() == 6 * NS_PER_SECOND
+    assert countdown.deadline_ns() == 10 * NS_PER_SECOND
+    clock.advance(20)
+    assert countdown.remaining_ns() == 0
+
+
+def test_registry_expires_countdowns_in_deadline_order():
+    registry = TimerRegistry()
+    fired = []
+    done = threading.Event()
+
+    def on_expire(timer_id, name):
+        fired.append(name)
+        if len(fired) == 2:
+            done.set()
+
+    registry.on_expire(on_expire)
+    late = registry.add_countdown("late", 0.15)
+    early = registry.add_countdown("early", 0.05)
+    registry.start(late)
+    registry.start(early)
+    assert done.wait(2)
+    assert fired == ["early", "late"]
+    assert registry.expired == 2
+    assert registry.status(late)["state"] == registry.status(early)["state"] == "finished"
+
+
+def test_registry_skips_paused_and_removed_countdowns():
+    registry = TimerRegistry()
+    fired = []
+    registry.on_expire(lambda timer_id, name: fired.append(name))
+    paused = registry.add_countdown("paused", 0.05)
+    removed = registry.add_countdown("removed", 0.05)
+    kept = registry.add_countdown("kept", 0.1)
+    for timer_id in (paused, removed, kept):
+        registry.start(timer_id)
+    registry.stop(paused)
+    registry.remove(removed)
+    time.sleep(0.3)
+    assert fired == ["kept"]
+    assert registry.status(paused)["state"] == "paused"
+    assert [t["name"] for t in registry.list_status()] == ["paused", "kept"]
+
+
+def test_registry_callbacks_may_call_back_into_the_registry():
+    registry = TimerRegistry()
+    seen = []
+    done = threading.Event()
+
+    def on_expire(timer_id, name):
+        # Every public method takes the registry lock
+        seen.append((registry.status(timer_id)["state"], len(registry.list_status())))
+        registry.add_stopwatch(f"after {name}")
+        done.set()
+
+    registry.on_expire(on_expire)
+    registry.start(registry.add_countdown("heat", 0.02))
+    assert done.wait(2), "expiry callback deadlocked"
+    assert seen == [("finished", 1)]
+    assert len(registry) == 2
+
+
+def test_registry_survives_a_failing_callback(caplog):
+    registry = TimerRegistry()
+    fired = []
+    done = threading.Event()
+
+    def broken(timer_id, name):
+        raise RuntimeError("boom")
+
+    def on_expire(timer_id, name):
+        fired.append(name)
+        if len(fired) == 2:
+            done.set()
+
+    registry.on_expire(broken)
+    registry.on_expire(on_expire)
+    registry.start(registry.add_countdown("first", 0.02))
+    second = registry.add_countdown("second", 0.05)
+    registry.start(second)
+    assert done.wait(2), "scheduler thread died with the callback"
+    assert fired == ["first", "second"]
+    assert registry.status(second)["state"] == "finished"
+    assert "boom" in caplog.text
+
+
+def test_registry_stopwatch_status():
+    clock = FakeClock()
+    registry = TimerRegistry(clock)
+    timer_id = registry.add_stopwatch("lap")
+    registry.start(timer_id)
+    clock.advance(3)
+    status = registry.status(timer_id)
+    assert (status["kind"], status["state"], status["elapsed"], status["remaining"]) == \
+        ("stopwatch", "running", 3.0, None)
+
+
+def test_interval_rounds_layout():
+    timer = IntervalTimer.rounds(3, work=20, rest=10, prepare=5)
+    assert timer.names == ["Get ready", "Work 1/3", "Rest 1/3", "Work 2/3", "Rest 2/3", "Work 3/3"]
+    assert list(timer.ends) == [s * NS_PER_SECOND for s in (5, 25, 35, 55, 65, 85)]
+    assert timer.total_ns == 85 * NS_PER_SECOND
+
+
+def test_interval_phase_boundaries():
+    timer = IntervalTimer.rounds(2, work=20, rest=10)
+    assert timer.phase_at(0) == 0
+    assert timer.phase_at(20 * NS_PER_SECOND - 1) == 0
+    assert timer.phase_at(20 * NS_PER_SECOND) == 1  # A phase ends exactly at its boundary
+    assert timer.phase_at(50 * NS_PER_SECOND) == len(timer)
+    assert timer.phase_start_ns(2) == 30 * NS_PER_SECOND
+
+
+def test_interval_status_follows_the_clock_without_drift():
+    clock = FakeClock()
+    timer = IntervalTimer.rounds(500, work=0.3, rest=0.1, clock=clock)
+    timer.start()
+    clock.advance(0.4 * 499 + 0.15)
+    status = timer.status()
+    assert (status["name"], status["kind"]) == ("Work 500/500", "work")
+    assert status["remaining"] == pytest.approx(0.15)
+    clock.advance(1)
+    assert timer.status()["kind"] == "done" and timer.finished and not timer.running
+    assert timer.elapsed_ns() == timer.total_ns
@@ -0,0 +1,131 @@
+import functools
+import itertools
+
+import pytest
+
+from tictactoe_engine import (FULL, NO_MOVE, SYMMETRIES, TERNARY, Bitboard, board_key, line_through,
+                              perfect_move, solved_table)
+
+MARKS = {0: '', 1: 'X', 2: 'O'}
+
+
+def reachable():
+    """Every position reachable in play, as 3x3 boards"""
+    seen, stack, boards = set(), [(0,) * 9], []
+    while stack:
+        cells = stack.pop()
+        key = sum(cell * 3 ** i for i, cell in enumerate(cells))
+        if key in seen:
+            continue
+        seen.add(key)
+        board = [[MARKS[cells[r * 3 + c]] for c in range(3)] for r in range(3)]
+        boards.append(board)
+        if Bitboard.from_board(board).winner()[0] or 0 not in cells:
+            continue
+        player = 1 if cells.count(1) == cells.count(2) else 2
+        stack.extend(cells[:i] + (player,) + cells[i + 1:] for i in range(9) if cells[i] == 0)
+    return boards
+
+
+BOARDS = reachable()
+
+
+@functools.lru_cache(maxsize=None)
+def negamax(cells, player):
+    """Plain negamax over a tuple of 9 marks, with solved_table's scoring"""
+    empties = cells.count('')
+    board = [list(cells[r:r + 3]) for r in (0, 3, 6)]
+    if Bitboard.from_board(board).winner()[0]:
+        return -(1 + empties)
+    if not empties:
+        return 0
+    other = 'O' if player == 'X' else 'X'
+    return max(-negamax(cells[:i] + (player,) + cells[i + 1:], other) for i in range(9) if cells[i] == '')
+
+
+@pytest.fixture(scope="module")
+def table(tmp_path_factory):
+    solved_table.cache_clear()
+    yield solved_table(str(tmp_path_factory.mktemp("solved") / "table.bin"))
+    solved_table.cache_clear()
+
+
+def test_every_reachable_position_is_solved():
+    assert len(BOARDS) == 5478
+
+
+def test_bitboard_agrees_with_the_list_board():
+    for board in BOARDS:
+        bits = Bitboard.from_board(board)
+        flat = [cell for row in board for cell in row]
+        assert bits.to_board() == board
+        assert bits.key() == board_key(board)
+        assert list(bits.moves()) == [i for i, cell in enumerate(flat) if cell == '']
+        assert bits.is_full() == ('' not in flat)
+        assert bits.empty() == FULL & ~(bits.x | bits.o)
+
+
+def test_ternary_table_is_the_base_3_value():
+    for bits in range(512):
+        assert TERNARY[bits] == int("".join(str(bits >> i & 1) for i in reversed(range(9))), 3)
+
+
+def test_symmetries_are_distinct_permutations():
+    assert len(set(SYMMETRIES)) == 8
+    assert all(sorted(perm) == list(range(9)) for perm in SYMMETRIES)
+
+
+def test_table_values_and_moves_agree_with_negamax(table):
+    moves, scores = table
+    for board in BOARDS:
+        cells = tuple(cell for row in board for cell in row)
+        player = 'X' if cells.count('X') == cells.count('O') else 'O'
+        key = board_key(board)
+        value = negamax(cells, player)
+        assert scores[key] == value
+        move = moves[key]
+        if move == NO_MOVE:
+            assert Bitboard.from_board(board).winner()[0] or '' not in cells
+        else:
+            # The stored move keeps the position's value
+            child = cells[:move] + (player,) + cells[move + 1:]
+            assert -negamax(child, 'O' if player == 'X' else 'X') == value
+
+
+def test_table_is_reloaded_from_its_file(table, tmp_path):
+    path = tmp_path / "table.bin"
+    solved_table.cache_clear()
+    first = solved_table(str(path))
+    solved_table.cache_clear()
+    second = solved_table(str(path))
+    assert path.stat().st_size == 2 * 3 ** 9
+    assert first[0] == second[0] and first[1] == second[1] == table[1]
+
+
+def test_perfect_play_draws_itself():
+    board = [[''] * 3 for _ in range(3)]
+    for player in itertools.islice(itertools.cycle('XO'), 9):
+        row, col = perfect_move(board)
+        board[row][col] = player
+    assert Bitboard.from_board(board).winner() == (None, 0)
+    assert perfect_move(board) is None
+
+
+def test_line_through_finds_k_in_a_row_in_every_direction():
+    for cells in ([(4, c) for c in range(1, 6)], [(r, 2) for r in range(0, 5)],
+                  [(i, i) for i in range(2, 7)], [(i, 8 - i) for i in range(1, 6)]):
+        board = [[''] * 9 for _ in range(9)]
+        for r, c in cells:
+            board[r][c] = 'X'
+        for r, c in cells:
+            assert line_through(board, r, c, 5) == sorted(cells)
+        assert line_through(board, *cells[0], 6) == []
+
+
+def test_line_through_stops_at_other_marks_and_edges():
+    board = [[''] * 7 for _ in range(7)]
+    for c in (0, 1, 2, 4):
+        board[0][c] = 'O'
+    board[0][3] = 'X'
+    assert line_through(board, 0, 2, 3) == [(0, 0), (0, 1), (0, 2)]
+    assert line_through(board, 0, 4, 2) == []
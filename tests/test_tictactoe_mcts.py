@@ -0,0 +1,67 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from tictactoe_mcts import MctsPlayer, _neighbours, _wins, search
+
+X, O = 1, 2
+
+
+def board_of(rows):
+    return [['' if cell == '.' else cell for cell in row] for row in rows]
+
+
+@pytest.mark.parametrize("k", [3, 4, 5])
+def test_wins_only_checks_lines_through_the_move(k):
+    size = 7
+    for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+        cells = bytearray(size * size)
+        line = [(3 + (i - k // 2) * dr, 3 + (i - k // 2) * dc) for i in range(k)]
+        for r, c in line:
+            cells[r * size + c] = X
+        r, c = line[-1]
+        assert _wins(cells, size, k, r * size + c)
+        cells[r * size + c] = O
+        assert not _wins(cells, size, k, r * size + c)
+
+
+def test_neighbours_stay_on_the_board():
+    table = _neighbours(5, 2)
+    assert len(table[0]) == 8 and len(table[12]) == 24
+    assert all(0 <= n < 25 for cells in table for n in cells)
+
+
+def test_takes_an_immediate_win():
+    board = board_of(["XX.", "OO.", "..."])
+    assert MctsPlayer(3, budget=0.2, seed=0).choose(board) == (0, 2)
+
+
+def test_blocks_an_immediate_loss_on_a_large_board():
+    board = board_of([".......",
+                      ".......",
+                      ".XXX...",
+                      "...O...",
+                      "....O..",
+                      ".......",
+                      "......."])
+    assert MctsPlayer(4, budget=0.5, seed=1).choose(board) in [(2, 0), (2, 4)]
+
+
+def test_reuses_its_tree_after_the_opponent_replies():
+    player = MctsPlayer(3, budget=0.1, seed=2)
+    board = board_of(["...", ".X.", "..."])
+    row, col = player.choose(board)
+    board[row][col] = 'O'
+    reply = next((r, c) for r in range(3) for c in range(3) if board[r][c] == '')
+    board[reply[0]][reply[1]] = 'X'
+    player.choose(board)
+    assert player.last_reused > 0 and player.last_playouts > 0
+
+
+def test_root_parallel_search_adds_up_worker_visits():
+    board = board_of(["XX.", "OO.", "..."])
+    with ThreadPoolExecutor(2) as pool:
+        player = MctsPlayer(3, budget=0.1, pool=pool, workers=2, seed=3)
+        assert player.choose(board) == (0, 2)
+    stats, playouts = search(bytes([X, X, 0, O, O, 0, 0, 0, 0]), 3, 3, 0.05, seed=4)
+    assert playouts > 0 and sum(visits for visits, _ in stats.values()) == playouts
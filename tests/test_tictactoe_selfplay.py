@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from tictactoe_selfplay import O_WINS, STRATEGIES, TIE, X_WINS, WINNING, simulate, summarize
+
+
+def test_winning_table_matches_the_lines():
+    assert WINNING[0b000000111] and WINNING[0b100010001] and WINNING[0b001010100]
+    assert not WINNING[0b000000011] and not WINNING[0b010100011]
+    assert WINNING.sum() == sum(1 for bits in range(512)
+                                if any(bits & mask == mask for mask in
+                                       (7, 56, 448, 73, 146, 292, 273, 84)))
+
+
+def test_random_self_play_matches_the_known_split():
+    summary = summarize(*simulate("random", "random", 200_000, seed=0))
+    x, o, tie = summary["outcomes"][[X_WINS, O_WINS, TIE]]
+    assert x == pytest.approx(0.585, abs=0.01)
+    assert o == pytest.approx(0.288, abs=0.01)
+    assert tie == pytest.approx(0.127, abs=0.01)
+
+
+@pytest.mark.parametrize("opponent", list(STRATEGIES))
+def test_perfect_play_never_loses(opponent):
+    as_x, _, _ = simulate("perfect", opponent, 5_000, seed=1)
+    as_o, _, _ = simulate(opponent, "perfect", 5_000, seed=2)
+    assert not (as_x == O_WINS).any() and not (as_o == X_WINS).any()
+
+
+def test_perfect_against_perfect_is_always_a_tie():
+    outcome, _, length = simulate("perfect", "perfect", 2_000, seed=3)
+    assert (outcome == TIE).all() and (length == 9).all()
+
+
+def test_summary_shapes_and_batches():
+    outcome, first_move, length = simulate("greedy", "random", 1_001, seed=4, batch=100)
+    assert outcome.shape == first_move.shape == length.shape == (1_001,)
+    assert ((length >= 5) & (length <= 9)).all()
+    summary = summarize(outcome, first_move, length)
+    assert summary["games"] == 1_001
+    assert summary["by_first_move"].sum() == summary["lengths"].sum() == 1_001
+    assert np.isclose(summary["outcomes"].sum(), 1.0)
@@ -0,0 +1,220 @@
+import os
+from array import array
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+# Cell codes in a board key: the board read row by row as a base-3 number
+EMPTY, X, O = 0, 1, 2
+CODES = {'': EMPTY, 'X': X, 'O': O}
+_POWERS = tuple(3 ** i for i in range(9))
+NO_MOVE = 255
+TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tictactoe_table.bin")
+
+_LINES = ((0, 1, 2), (3, 4, 5), (6, 7, 8), (0, 3, 6), (1, 4, 7), (2, 5, 8), (0, 4, 8), (2, 4, 6))
+WIN_MASKS = tuple(sum(1 << i for i in line) for line in _LINES)
+FULL = (1 << 9) - 1
+
+# Per 9-bit pattern: its base-3 digits, the first win mask it covers, its set cells
+TERNARY = tuple(sum(_POWERS[i] for i in range(9) if bits >> i & 1) for bits in range(1 << 9))
+_WIN_LINE = tuple(next((mask for mask in WIN_MASKS if bits & mask == mask), 0) for bits in range(1 << 9))
+_CELLS = tuple(tuple(i for i in range(9) if bits >> i & 1) for bits in range(1 << 9))
+
+
+class Bitboard:
+    """3x3 board as one 9-bit int per player; bit 3 * row + col is that cell.
+
+    A line is won when player & mask == mask for one of the 8 win masks, and
+    the empty cells are the bits missing from x | o. Both answers are read
+    from 512-entry tables indexed by the 9-bit patterns, so nothing walks a
+    grid.
+    """
+
+    __slots__ = ("x", "o")
+
+    def __init__(self, x: int = 0, o: int = 0):
+        self.x = x
+        self.o = o
+
+    @classmethod
+    def from_board(cls, board: List[List[str]]) -> "Bitboard":
+        x = o = 0
+        bit = 1
+        for row in board:
+            for cell in row:
+                if cell == 'X':
+                    x |= bit
+                elif cell == 'O':
+                    o |= bit
+                bit <<= 1
+        return cls(x, o)
+
+    def to_board(self) -> List[List[str]]:
+        return [['X' if self.x >> i & 1 else 'O' if self.o >> i & 1 else '' for i in range(r, r + 3)]
+                for r in (0, 3, 6)]
+
+    def key(self) -> int:
+        """Same base-3 key as board_key"""
+        return TERNARY[self.x] + 2 * TERNARY[self.o]
+
+    def empty(self) -> int:
+        return FULL & ~(self.x | self.o)
+
+    def is_full(self) -> bool:
+        return self.x | self.o == FULL
+
+    def moves(self) -> Tuple[int, ...]:
+        """Empty cells, lowest first"""
+        return _CELLS[FULL & ~(self.x | self.o)]
+
+    def play(self, cell: int, player: str):
+        if player == 'X':
+            self.x |= 1 << cell
+        else:
+            self.o |= 1 << cell
+
+    def winner(self) -> Tuple[Optional[str], int]:
+        """('X' or 'O', winning line mask), or (None, 0)"""
+        mask = _WIN_LINE[self.x]
+        if mask:
+            return 'X', mask
+        mask = _WIN_LINE[self.o]
+        return ('O', mask) if mask else (None, 0)
+
+
+def _symmetries() -> Tuple[Tuple[int, ...], ...]:
+    """The 8 rotations and reflections of the 3x3 grid as cell permutations"""
+    rotate = (6, 3, 0, 7, 4, 1, 8, 5, 2)  # new cell i takes old cell rotate[i]
+    mirror = (2, 1, 0, 5, 4, 3, 8, 7, 6)
+    perms = []
+    perm = tuple(range(9))
+    for _ in range(4):
+        perms.append(perm)
+        perms.append(tuple(perm[mirror[i]] for i in range(9)))
+        perm = tuple(perm[rotate[i]] for i in range(9))
+    return tuple(perms)
+
+
+SYMMETRIES = _symmetries()
+
+
+def board_key(board: List[List[str]]) -> int:
+    """Base-3 key of a 3x3 board of '', 'X' and 'O'"""
+    key = 0
+    for i, cell in enumerate(cell for row in board for cell in row):
+        key += CODES[cell] * _POWERS[i]
+    return key
+
+
+def _winner(cells: Tuple[int, ...]) -> int:
+    for a, b, c in _LINES:
+        if cells[a] != EMPTY and cells[a] == cells[b] == cells[c]:
+            return cells[a]
+    return EMPTY
+
+
+def _canonical(cells: Tuple[int, ...]) -> int:
+    return min(sum(cells[perm[i]] * _POWERS[i] for i in range(9)) for perm in SYMMETRIES)
+
+
+def _solve() -> Tuple[bytearray, array]:
+    """Negamax over the whole game, one search per symmetry class"""
+    values = {}  # canonical key -> value for the side to move
+
+    def negamax(cells: Tuple[int, ...], player: int) -> int:
+        key = _canonical(cells)
+        if key in values:
+            return values[key]
+        empties = cells.count(EMPTY)
+        if _winner(cells):
+            value = -(1 + empties)  # The previous move won
+        elif not empties:
+            value = 0
+        else:
+            value = max(-negamax(cells[:i] + (player,) + cells[i + 1:], 3 - player)
+                        for i in range(9) if cells[i] == EMPTY)
+        values[key] = value
+        return value
+
+    moves = bytearray([NO_MOVE]) * 3 ** 9
+    scores = array('b', bytes(3 ** 9))
+    seen = set()
+    stack = [(EMPTY,) * 9]
+    while stack:
+        cells = stack.pop()
+        key = sum(cells[i] * _POWERS[i] for i in range(9))
+        if key in seen:
+            continue
+        seen.add(key)
+        player = X if cells.count(X) == cells.count(O) else O
+        scores[key] = negamax(cells, player)
+        if _winner(cells) or EMPTY not in cells:
+            continue
+        best = None
+        for i in range(9):
+            if cells[i] == EMPTY:
+                child = cells[:i] + (player,) + cells[i + 1:]
+                value = -negamax(child, 3 - player)
+                if best is None or value > best:
+                    best, moves[key] = value, i
+                stack.append(child)
+    return moves, scores
+
+
+@lru_cache(maxsize=1)
+def solved_table(path: str = TABLE_PATH) -> Tuple[bytearray, array]:
+    """Perfect move and value for every reachable position, indexed by board key.
+
+    Positions are solved once per symmetry class (765 of them), then every
+    one of the 5,478 reachable positions gets its best move written into a
+    3**9 byte table, so a move is a single index at play time. Values are
+    from the side to move: positive wins, negative loses, larger magnitude
+    means sooner, 0 is a draw. The two tables (about 40 KB) are saved to
+    path after the first solve and loaded from there afterwards.
+    """
+    size = 3 ** 9
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+        if len(data) == 2 * size:
+            return bytearray(data[:size]), array('b', data[size:])
+    except OSError:
+        pass
+    moves, scores = _solve()
+    try:
+        with open(path, "wb") as f:
+            f.write(moves + scores.tobytes())
+    except OSError:
+        pass  # Read-only checkout: solve again next start
+    return moves, scores
+
+
+def perfect_move(board: List[List[str]]) -> Optional[Tuple[int, int]]:
+    """The (row, col) a perfect player picks, or None if the game is over"""
+    move = solved_table()[0][Bitboard.from_board(board).key()]
+    return None if move == NO_MOVE else divmod(move, 3)
+
+
+# Row/column steps of the four line directions: across, down, both diagonals
+LINE_DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+
+def line_through(board: List[List[str]], row: int, col: int, k: int) -> List[Tuple[int, int]]:
+    """Cells of a k-in-a-row through the mark at (row, col), or [] if there is none.
+
+    Only the four lines through that cell are walked, at most k - 1 steps
+    each way, so a move is checked in O(k) whatever the board size.
+    """
+    player = board[row][col]
+    size = len(board)
+    for dr, dc in LINE_DIRECTIONS:
+        cells = [(row, col)]
+        for sign in (-1, 1):
+            r, c = row + sign * dr, col + sign * dc
+            for _ in range(k - 1):
+                if not (0 <= r < size and 0 <= c < size) or board[r][c] != player:
+                    break
+                cells.append((r, c))
+                r, c = r + sign * dr, c + sign * dc
+        if len(cells) >= k:
+            return sorted(cells)
+    return []
@@ -0,0 +1,227 @@
+import math
+import random
+import time
+from concurrent.futures import Executor
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from tictactoe_engine import CODES, EMPTY, LINE_DIRECTIONS, O, X
+
+# The player to move next is 3 - the player who just moved (X = 1, O = 2)
+
+Stats = Dict[int, Tuple[int, float]]  # move -> (visits, wins) at the root
+
+
+@lru_cache(maxsize=8)
+def _neighbours(size: int, radius: int) -> Tuple[Tuple[int, ...], ...]:
+    """Cells within `radius` steps (king moves) of each cell"""
+    table = []
+    for idx in range(size * size):
+        row, col = divmod(idx, size)
+        table.append(tuple(r * size + c
+                           for r in range(max(0, row - radius), min(size, row + radius + 1))
+                           for c in range(max(0, col - radius), min(size, col + radius + 1))
+                           if (r, c) != (row, col)))
+    return tuple(table)
+
+
+def _wins(cells: bytearray, size: int, k: int, idx: int) -> bool:
+    """Whether the mark at idx completes k in a row; the four lines through it only"""
+    player = cells[idx]
+    row, col = divmod(idx, size)
+    for dr, dc in LINE_DIRECTIONS:
+        count = 1
+        for sign in (-1, 1):
+            r, c = row + sign * dr, col + sign * dc
+            while 0 <= r < size and 0 <= c < size and cells[r * size + c] == player:
+                count += 1
+                if count >= k:
+                    return True
+                r, c = r + sign * dr, c + sign * dc
+    return False
+
+
+def _rollout(cells: bytearray, size: int, k: int, player: int, rng: random.Random) -> int:
+    """Random play to the end; the winner, or EMPTY for a draw. Plays on cells in place."""
+    order = [i for i, cell in enumerate(cells) if cell == EMPTY]
+    rng.shuffle(order)
+    for idx in order:
+        cells[idx] = player
+        if _wins(cells, size, k, idx):
+            return player
+        player = 3 - player
+    return EMPTY
+
+
+class _Node:
+    __slots__ = ("move", "player", "children", "untried", "candidates", "visits", "wins", "winner")
+
+    def __init__(self, move: int, player: int, winner: int = EMPTY):
+        self.move = move          # Cell played to reach this node (-1 at a fresh root)
+        self.player = player      # Who played it; wins are counted for them
+        self.children: Dict[int, "_Node"] = {}
+        self.untried: Optional[List[int]] = None  # Filled on the first visit
+        self.candidates: Optional[set] = None
+        self.visits = 0
+        self.wins = 0.0
+        self.winner = winner
+
+
+class _Tree:
+    """UCT search over one position.
+
+    On boards larger than 5x5 only cells within two steps of a mark are
+    considered, which is where k-in-a-row games are decided; each node's
+    candidate set is its parent's minus the move plus the move's empty
+    neighbours, so nothing rescans the board.
+    """
+
+    def __init__(self, cells: bytearray, size: int, k: int, exploration: float, rng: random.Random,
+                 root: Optional[_Node] = None):
+        self.cells = cells
+        self.size = size
+        self.k = k
+        self.exploration = exploration
+        self.rng = rng
+        self.prune = size > 5
+        self.neighbours = _neighbours(size, 2)
+        to_move = X if cells.count(X) == cells.count(O) else O
+        self.root = root if root is not None else _Node(-1, 3 - to_move)
+        self.playouts = 0
+
+    def _candidates(self, node: _Node, parent: Optional[_Node], cells: bytearray) -> set:
+        if not self.prune:
+            return {i for i, cell in enumerate(cells) if cell == EMPTY}
+        if parent is None or parent.candidates is None:
+            marked = [i for i, cell in enumerate(cells) if cell != EMPTY]
+            if not marked:
+                return {(self.size // 2) * self.size + self.size // 2}
+            found = {n for i in marked for n in self.neighbours[i] if cells[n] == EMPTY}
+        else:
+            found = parent.candidates - {node.move}
+            found.update(n for n in self.neighbours[node.move] if cells[n] == EMPTY)
+        return found or {i for i, cell in enumerate(cells) if cell == EMPTY}
+
+    def run(self, deadline: float):
+        size, k, rng = self.size, self.k, self.rng
+        log, sqrt, c = math.log, math.sqrt, self.exploration
+        while True:
+            for _ in range(16):
+                cells = bytearray(self.cells)
+                node, parent = self.root, None
+                path = [node]
+                # Selection: descend through fully expanded nodes by UCT
+                while node.winner == EMPTY:
+                    if node.untried is None:
+                        node.candidates = self._candidates(node, parent, cells)
+                        node.untried = list(node.candidates)
+                        rng.shuffle(node.untried)
+                    if node.untried or not node.children:
+                        break
+                    scale = c * sqrt(log(node.visits))
+                    parent, node = node, max(node.children.values(),
+                                             key=lambda n: n.wins / n.visits + scale / sqrt(n.visits))
+                    cells[node.move] = node.player
+                    path.append(node)
+                # Expansion: one new child
+                if node.winner == EMPTY and node.untried:
+                    move = node.untried.pop()
+                    player = 3 - node.player
+                    cells[move] = player
+                    child = _Node(move, player, player if _wins(cells, size, k, move) else EMPTY)
+                    node.children[move] = child
+                    node = child
+                    path.append(node)
+                # Simulation
+                if node.winner != EMPTY:
+                    winner = node.winner
+                elif EMPTY in cells:
+                    winner = _rollout(cells, size, k, 3 - node.player, rng)
+                else:
+                    winner = EMPTY
+                # Backpropagation
+                for visited in path:
+                    visited.visits += 1
+                    if winner == visited.player:
+                        visited.wins += 1.0
+                    elif winner == EMPTY:
+                        visited.wins += 0.5
+                self.playouts += 1
+            if time.perf_counter() >= deadline:
+                return
+
+    def stats(self) -> Stats:
+        return {move: (child.visits, child.wins) for move, child in self.root.children.items()}
+
+
+def search(cells: bytes, size: int, k: int, budget: float, exploration: float = 1.4,
+           seed: Optional[int] = None) -> Tuple[Stats, int]:
+    """One fresh search of a position; runs in a worker process for root parallelism"""
+    tree = _Tree(bytearray(cells), size, k, exploration, random.Random(seed))
+    tree.run(time.perf_counter() + budget)
+    return tree.stats(), tree.playouts
+
+
+class MctsPlayer:
+    """Monte Carlo tree search player for any board size and k.
+
+    Each move searches for `budget` seconds. The player keeps its own tree
+    between moves: after the opponent replies, the matching grandchild of
+    the previous root becomes the new root, so earlier playouts still
+    count. With a process pool, each worker also searches the position
+    from scratch for the same budget (root parallelism) and the root visit
+    counts of all trees are added up before the most visited move is
+    played.
+    """
+
+    def __init__(self, k: int, budget: float = 0.2, pool: Optional[Executor] = None, workers: int = 0,
+                 exploration: float = 1.4, seed: Optional[int] = None):
+        self.k = k
+        self.budget = budget
+        self.pool = pool
+        self.workers = workers if pool is not None else 0
+        self.exploration = exploration
+        self.rng = random.Random(seed)
+        self._root: Optional[_Node] = None
+        self._cells: Optional[bytearray] = None
+        self.last_playouts = 0
+        self.last_reused = 0
+
+    def _reuse(self, cells: bytearray) -> Optional[_Node]:
+        """The subtree for this position, if it follows on from the last one by one move"""
+        if self._root is None or self._cells is None or len(self._cells) != len(cells):
+            return None
+        played = [i for i in range(len(cells)) if cells[i] != self._cells[i]]
+        if len(played) != 1 or self._cells[played[0]] != EMPTY:
+            return None
+        return self._root.children.get(played[0])
+
+    def choose(self, board: List[List[str]]) -> Tuple[int, int]:
+        """(row, col) to play on a board of '', 'X' and 'O'"""
+        size = len(board)
+        cells = bytearray(CODES[cell] for row in board for cell in row)
+        deadline = time.perf_counter() + self.budget
+        futures = [self.pool.submit(search, bytes(cells), size, self.k, self.budget, self.exploration,
+                                    self.rng.getrandbits(32))
+                   for _ in range(self.workers)]
+
+        root = self._reuse(cells)
+        self.last_reused = root.visits if root is not None else 0
+        tree = _Tree(cells, size, self.k, self.exploration, self.rng, root)
+        tree.run(deadline)
+
+        totals = {move: visits for move, (visits, _) in tree.stats().items()}
+        playouts = tree.playouts
+        for future in futures:
+            stats, count = future.result()
+            playouts += count
+            for move, (visits, _) in stats.items():
+                totals[move] = totals.get(move, 0) + visits
+        self.last_playouts = playouts
+
+        move = max(totals, key=totals.get)
+        # Keep the chosen subtree for the next move
+        self._root = tree.root.children.get(move)
+        self._cells = bytearray(cells)
+        self._cells[move] = X if cells.count(X) == cells.count(O) else O
+        return divmod(move, size)
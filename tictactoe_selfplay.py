@@ -0,0 +1,102 @@
+import numpy as np
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Tuple
+
+from tictactoe_engine import TERNARY, WIN_MASKS, solved_table
+
+# Outcome codes
+TIE, X_WINS, O_WINS = 0, 1, 2
+
+_CELL_BITS = (1 << np.arange(9)).astype(np.int64)
+_POWERS = 3 ** np.arange(9, dtype=np.int64)
+_TERNARY_ARRAY = np.array(TERNARY, dtype=np.int64)
+# Every 9-bit pattern checked against the 8 win masks at once
+WINNING = ((np.arange(512)[:, None] & np.array(WIN_MASKS)) == np.array(WIN_MASKS)).any(axis=1)
+
+
+@lru_cache(maxsize=1)
+def _values() -> np.ndarray:
+    """Solved values by board key, from the side to move"""
+    return np.frombuffer(solved_table()[1], dtype=np.int8)
+
+
+def _random(rng, mine, theirs, empty, player) -> np.ndarray:
+    return np.where(empty, rng.random(empty.shape), -1.0)
+
+
+def _greedy(rng, mine, theirs, empty, player) -> np.ndarray:
+    """Win if possible, else block, else the centre, else anything"""
+    wins = WINNING[mine[:, None] | _CELL_BITS]
+    blocks = WINNING[theirs[:, None] | _CELL_BITS]
+    score = 4.0 * wins + 2.0 * blocks + rng.random(empty.shape)
+    score[:, 4] += 1.0
+    return np.where(empty, score, -1.0)
+
+
+def _perfect(rng, mine, theirs, empty, player) -> np.ndarray:
+    """Any move keeping the best game-theoretic value, picked at random among equals"""
+    x, o = (mine, theirs) if player == 1 else (theirs, mine)
+    key = _TERNARY_ARRAY[x] + 2 * _TERNARY_ARRAY[o]
+    children = key[:, None] + player * _POWERS
+    # Values are from the side to move, so the child's value is the opponent's
+    value = -_values()[np.where(empty, children, 0)].astype(np.float64)
+    return np.where(empty, value + 0.5 * rng.random(empty.shape), -np.inf)
+
+
+STRATEGIES: Dict[str, Callable] = {"random": _random, "greedy": _greedy, "perfect": _perfect}
+
+
+def simulate(x_strategy: str, o_strategy: str, games: int, seed: Optional[int] = None,
+             batch: int = 250_000) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Play `games` games between two strategies in NumPy batches.
+
+    Each board is a pair of 9-bit ints per game, one per player, and every
+    ply moves all unfinished games at once: strategies score the 9 cells of
+    every board in one array expression, and wins are read from a 512-entry
+    table of the 8 win masks. Returns (outcome, first_move, length) arrays
+    with one entry per game.
+    """
+    rng = np.random.default_rng(seed)
+    outcome = np.empty(games, dtype=np.int8)
+    first_move = np.empty(games, dtype=np.int8)
+    length = np.empty(games, dtype=np.int8)
+    rows_all = np.arange(batch)
+
+    for start in range(0, games, batch):
+        n = min(batch, games - start)
+        rows = rows_all[:n]
+        bits = np.zeros((2, n), dtype=np.int64)  # X then O
+        result = np.full(n, TIE, dtype=np.int8)
+        moves = np.full(n, 9, dtype=np.int8)
+        live = np.ones(n, dtype=bool)
+        for ply in range(9):
+            side = ply % 2
+            active = rows[live]
+            mine, theirs = bits[side, active], bits[1 - side, active]
+            empty = ((mine | theirs)[:, None] & _CELL_BITS) == 0
+            strategy = STRATEGIES[x_strategy if side == 0 else o_strategy]
+            cell = strategy(rng, mine, theirs, empty, side + 1).argmax(axis=1)
+            if ply == 0:
+                first_move[start:start + n] = cell
+            mine = mine | _CELL_BITS[cell]
+            bits[side, active] = mine
+            won = WINNING[mine]
+            finished = active[won]
+            result[finished] = side + 1
+            moves[finished] = ply + 1
+            live[finished] = False
+        outcome[start:start + n] = result
+        length[start:start + n] = moves
+    return outcome, first_move, length
+
+
+def summarize(outcome: np.ndarray, first_move: np.ndarray, length: np.ndarray) -> dict:
+    """Outcome shares, results by X's first cell and game length distribution"""
+    games = len(outcome)
+    by_first = np.bincount(first_move.astype(np.int64) * 3 + outcome, minlength=27).reshape(9, 3)
+    return {
+        "games": games,
+        "outcomes": np.bincount(outcome, minlength=3) / games,
+        "by_first_move": by_first,
+        "lengths": np.bincount(length, minlength=10)[5:],  # Games end after 5 to 9 plies
+    }